@@ -760,7 +760,8 @@ def fill_parent_branch(i: int,
                        branch_tolerance_mode: BranchImpedanceMode,
                        t_idx: int = -1,
                        time_series: bool = False,
-                       is_dc_branch: bool = False, ):
+                       is_dc_branch: bool = False,
+                       monitor_loading: bool | None = None):
     """
 
     :param i:
@@ -772,6 +773,7 @@ def fill_parent_branch(i: int,
     :param t_idx:
     :param time_series:
     :param is_dc_branch:
+    :param monitor_loading: monitor loading value to use instead of the device's flag (optional)
     :return:
     """
     data.names[i] = elm.name
@@ -826,7 +828,7 @@ def fill_parent_branch(i: int,
         data.B2[i] = elm.B2
 
     data.contingency_enabled[i] = int(elm.contingency_enabled)
-    data.monitor_loading[i] = int(elm.monitor_loading)
+    data.monitor_loading[i] = bool(elm.monitor_loading) if monitor_loading is None else monitor_loading
 
     data.virtual_tap_f[i], data.virtual_tap_t[i] = elm.get_virtual_taps()
 
@@ -981,6 +983,7 @@ def get_branch_data(
         control_taps_modules: bool = True,
         control_taps_phase: bool = True,
         control_remote_voltage: bool = True,
+        monitor_lines: BoolVec | None = None,
         logger: Logger = Logger()
 ) -> ds.BranchData:
     """
@@ -998,10 +1001,15 @@ def get_branch_data(
     :param control_taps_modules: Control TapsModules
     :param control_taps_phase: Control TapsPhase
     :param control_remote_voltage: Control RemoteVoltage
+    :param monitor_lines: monitor loading mask of the lines, overrides the lines monitor_loading flags (optional)
     :param logger: Logger
     :return: BranchData
     """
 
+    if monitor_lines is not None and len(monitor_lines) != len(circuit.lines):
+        raise Exception(f"The monitor_lines mask has {len(monitor_lines)} entries, "
+                        f"but the circuit has {len(circuit.lines)} lines")
+
     data = ds.BranchData(nelm=circuit.get_branch_number_wo_hvdc(),
                          nbus=circuit.get_bus_number())
 
@@ -1018,7 +1026,8 @@ def get_branch_data(
                            branch_tolerance_mode=branch_tolerance_mode,
                            t_idx=t_idx,
                            time_series=time_series,
-                           is_dc_branch=False)
+                           is_dc_branch=False,
+                           monitor_loading=None if monitor_lines is None else bool(monitor_lines[i]))
 
         ii += 1
 
@@ -1168,7 +1177,7 @@ def get_branch_data(
         data.Pset[ii] = elm.Pfset / circuit.Sbase
 
         data.contingency_enabled[ii] = int(elm.contingency_enabled)
-        data.monitor_loading[ii] = int(elm.monitor_loading)
+        data.monitor_loading[ii] = bool(elm.monitor_loading)
 
         data.tap_phase_control_mode[i] = 0
         data.tap_module_control_mode[i] = 0
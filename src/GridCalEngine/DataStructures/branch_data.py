@@ -96,7 +96,7 @@ class BranchData:
         self.is_converter: BoolVec = np.zeros(self.nelm, dtype=bool)
 
         self.contingency_enabled: IntVec = np.ones(self.nelm, dtype=int)
-        self.monitor_loading: IntVec = np.ones(self.nelm, dtype=int)
+        self.monitor_loading: BoolVec = np.ones(self.nelm, dtype=bool)
 
         # connectivity branch with their "from" bus
         self.C_branch_bus_f: sp.lil_matrix = sp.lil_matrix((self.nelm, nbus), dtype=int)
@@ -368,7 +368,7 @@ class BranchData:
         Get monitored branch indices
         :return:
         """
-        return np.where(self.monitor_loading == 1)[0]
+        return np.where(self.monitor_loading)[0]
 
     def get_contingency_enabled_indices(self) -> IntVec:
         """
@@ -385,13 +385,7 @@ class BranchData:
         :return: List of (branch index, flow sense w.r.t the area exchange)
         """
 
-        lst: List[Tuple[int, float]] = list()
-        for k in range(self.nelm):
-            if self.F[k] in bus_idx_from and self.T[k] in bus_idx_to:
-                lst.append((k, 1.0))
-            elif self.F[k] in bus_idx_to and self.T[k] in bus_idx_from:
-                lst.append((k, -1.0))
-        return lst
+        return tp.get_inter_areas(F=self.F, T=self.T, bus_idx_from=bus_idx_from, bus_idx_to=bus_idx_to)
 
     def to_df(self) -> pd.DataFrame:
         """
@@ -324,13 +324,7 @@ class HvdcData:
         :return: List of (branch index, flow sense w.r.t the area exchange)
         """
 
-        lst: List[Tuple[int, float]] = list()
-        for k in range(self.nelm):
-            if self.F[k] in bus_idx_from and self.T[k] in bus_idx_to:
-                lst.append((k, 1.0))
-            elif self.F[k] in bus_idx_to and self.T[k] in bus_idx_from:
-                lst.append((k, -1.0))
-        return lst
+        return tp.get_inter_areas(F=self.F, T=self.T, bus_idx_from=bus_idx_from, bus_idx_to=bus_idx_to)
 
     def __len__(self) -> int:
         """
@@ -95,14 +95,7 @@ def get_inter_areas_branch(F: np.ndarray,
     :param buses_in_a2: Array of bus indices belonging area to
     :return: List of (branch index, branch object, flow sense w.r.t the area exchange)
     """
-    nbr = len(F)
-    lst: List[Tuple[int, float]] = list()
-    for k in range(nbr):
-        if F[k] in buses_in_a1 and T[k] in buses_in_a2:
-            lst.append((k, 1.0))
-        elif F[k] in buses_in_a2 and T[k] in buses_in_a1:
-            lst.append((k, -1.0))
-    return lst
+    return tp.get_inter_areas(F=F, T=T, bus_idx_from=buses_in_a1, bus_idx_to=buses_in_a2)
 
 
 def get_devices_per_areas(Cdev: sp.csc_matrix,
@@ -2069,6 +2062,7 @@ def compile_numerical_circuit_at(circuit: MultiCircuit,
                                  control_taps_modules: bool = True,
                                  control_taps_phase: bool = True,
                                  control_remote_voltage: bool = True,
+                                 monitor_lines: Union[BoolVec, None] = None,
                                  logger=Logger()) -> NumericalCircuit:
     """
     Compile a NumericalCircuit from a MultiCircuit
@@ -2083,6 +2077,7 @@ def compile_numerical_circuit_at(circuit: MultiCircuit,
     :param control_taps_modules: control taps modules?
     :param control_taps_phase: control taps phase?
     :param control_remote_voltage: control remote voltage?
+    :param monitor_lines: (optional) monitor loading mask of the lines, overrides the lines monitor_loading flags
     :param logger: Logger instance
     :return: NumericalCircuit instance
     """
@@ -2192,6 +2187,7 @@ def compile_numerical_circuit_at(circuit: MultiCircuit,
         control_taps_modules=control_taps_modules,
         control_taps_phase=control_taps_phase,
         control_remote_voltage=control_remote_voltage,
+        monitor_lines=monitor_lines,
     )
 
     nc.hvdc_data = gc_compiler2.get_hvdc_data(
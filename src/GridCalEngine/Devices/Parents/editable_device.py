@@ -13,7 +13,8 @@ from GridCalEngine.enumerations import (DeviceType, TimeFrame, BuildStatus, Wind
                                         CpfParametrization, CpfStopAt, InvestmentEvaluationMethod, SolverType,
                                         InvestmentsEvaluationObjectives, NodalCapacityMethod, TimeGrouping,
                                         ZonalGrouping, MIPSolvers, AcOpfMode, SubstationTypes, BranchGroupTypes,
-                                        BranchImpedanceMode, FaultType, TapChangerTypes, ContingencyOperationTypes)
+                                        BranchImpedanceMode, FaultType, TapChangerTypes, ContingencyOperationTypes,
+                                        SparseSolver)
 
 # types that can be assigned to a GridCal property
 GCPROP_TYPES = Union[
@@ -41,6 +42,7 @@ GCPROP_TYPES = Union[
     Type[ZonalGrouping],
     Type[MIPSolvers],
     Type[AcOpfMode],
+    Type[SparseSolver],
     Type[BranchImpedanceMode],
     Type[FaultType],
     Type[TapChangerTypes],
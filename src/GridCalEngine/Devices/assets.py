@@ -599,6 +599,19 @@ class Assets:
 
         return obj
 
+    def add_lines(self, objs: List[dev.Line], logger: Union[Logger, DataLogger] = Logger()) -> List[dev.Line]:
+        """
+        Add several line objects at once
+        :param objs: list of Line instances
+        :param logger: Logger to record events
+        :return: the same list of lines
+        """
+        for obj in objs:
+            # lines between different voltage levels are converted to transformers by add_line
+            self.add_line(obj, logger=logger)
+
+        return objs
+
     def delete_line(self, obj: dev.Line):
         """
         Delete line
@@ -1202,6 +1215,20 @@ class Assets:
 
         return obj
 
+    def add_buses(self, objs: List[dev.Bus]) -> List[dev.Bus]:
+        """
+        Add several buses at once
+        :param objs: list of Bus objects
+        :return: the same list of buses
+        """
+        if self.time_profile is not None:
+            for obj in objs:
+                obj.ensure_profiles_exist(self.time_profile)
+
+        self._buses.extend(objs)
+
+        return objs
+
     def delete_bus(self, obj: dev.Bus, delete_associated=False):
         """
         Delete a :ref:`Bus<bus>` object from the grid.
@@ -1588,6 +1588,14 @@ class MultiCircuit(Assets):
         for ld in self.get_loads():
             ld.active_prof.set(ld.P_prof.toarray().astype(bool))
 
+    def set_all_lines_monitor_loading(self, value: bool = True):
+        """
+        Set the monitor_loading flag of all the lines
+        :param value: monitor the lines loading?
+        """
+        for ln in self._lines:
+            ln.monitor_loading = value
+
     def get_voltage_guess(self) -> CxVec:
         """
         Get the buses stored voltage guess
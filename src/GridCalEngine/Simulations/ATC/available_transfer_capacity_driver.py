@@ -79,7 +79,7 @@ def scale_proportional_sensed(P, idx1, idx2, dT=1.0):
     return P + dP
 
 
-@nb.njit()
+@nb.njit(cache=True)
 def compute_alpha(ptdf, P0, Pgen, Pinstalled, Pload, bus_a1_idx, bus_a2_idx, dT=1.0, mode=0, lodf=None):
     """
     Compute line sensitivity to power transfer
@@ -123,11 +123,18 @@ def compute_alpha(ptdf, P0, Pgen, Pinstalled, Pload, bus_a1_idx, bus_a2_idx, dT=
 
     dP = dPu + dPd
 
-    # compute the line flow increments due to the exchange increment dT in MW
-    dflow = ptdf.dot(dP)
+    # only the buses of the exchanging areas have injection increments
+    dP_idx = np.nonzero(dP)[0]
 
-    # compute the sensitivity
-    alpha = dflow / dT
+    # compute the line flow increments due to the exchange increment dT in MW
+    # and from them, the sensitivity
+    nbr = ptdf.shape[0]
+    alpha = np.zeros(nbr)
+    for m in range(nbr):
+        dflow = 0.0
+        for i in dP_idx:
+            dflow += ptdf[m, i] * dP[i]
+        alpha[m] = dflow / dT
     # alpha_n1 = np.zeros((len(alpha), len(alpha)))
     #
     # if lodf is not None:
@@ -9,7 +9,7 @@ import scipy.sparse as sp
 from typing import Union, List, Tuple
 from scipy.sparse.linalg import spsolve as scipy_spsolve
 
-from GridCalEngine.basic_structures import Logger, Vec, IntVec, CxVec, Mat, ObjVec, CxMat
+from GridCalEngine.basic_structures import Logger, Vec, IntVec, CxVec, Mat, ObjVec, CxMat, BoolVec
 from GridCalEngine.DataStructures.numerical_circuit import NumericalCircuit
 from GridCalEngine.Devices.multi_circuit import MultiCircuit
 from GridCalEngine.Devices.Aggregation.contingency_group import ContingencyGroup
@@ -335,24 +335,39 @@ class LinearMultiContingency:
 
     def get_lp_contingency_flows(self,
                                  base_flow: ObjVec,
-                                 injections: ObjVec) -> ObjVec:
+                                 injections: ObjVec,
+                                 active: BoolVec) -> Tuple[IntVec, ObjVec]:
         """
         Get contingency flows using the LP interface equations
         :param base_flow: Base branch flows (nbranch)
         :param injections: Bus injections (nbus)
-        :return: New flows (nbranch)
+        :param active: Array of branch active states (nbranch), the active branches have a flow variable
+        :return: indices of the branches with a contingency flow expression,
+                 contingency flow expressions of those branches
         """
 
         flow = base_flow.copy()
 
+        if len(self.branch_indices) == 0 and len(self.bus_indices) == 0:
+            # the contingency does not modify anything
+            return np.empty(0, dtype=int), flow[:0]
+
+        # all the active branches get a contingency flow expression (even if their factors are zero),
+        # and so do the inactive branches with a sensitivity to the contingency
+        rows = [np.flatnonzero(active)]
+
         if len(self.branch_indices):
             flow += lpDot(self.mlodf_factors, base_flow[self.branch_indices])
+            rows.append(self.mlodf_factors.indices)
 
         if len(self.bus_indices):
             injection_delta = self.injections_factor * injections[self.bus_indices]
             flow += lpDot(self.compensated_ptdf_factors, injection_delta[self.bus_indices])
+            rows.append(self.compensated_ptdf_factors.indices)
 
-        return flow
+        idx: IntVec = np.unique(np.concatenate(rows))
+
+        return idx, flow[idx]
 
 
 class ContingencyIndices:
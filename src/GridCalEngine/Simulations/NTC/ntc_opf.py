@@ -9,12 +9,17 @@ That means that solves the OPF problem for a complete time series at once
 """
 from __future__ import annotations
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from typing import List, Union, Tuple, Callable
+import scipy.sparse as sp
+from typing import List, Union, Tuple, Callable, Dict, FrozenSet, Iterator, Any
 
 from GridCalEngine.enumerations import MIPSolvers, ZonalGrouping
 from GridCalEngine.Devices.multi_circuit import MultiCircuit
 from GridCalEngine.Devices.Aggregation.contingency_group import ContingencyGroup
+from GridCalEngine.Devices.Aggregation.area import Area
+from GridCalEngine.Devices.Substation.bus import Bus
 from GridCalEngine.DataStructures.numerical_circuit import NumericalCircuit, compile_numerical_circuit_at
 from GridCalEngine.DataStructures.generator_data import GeneratorData
 from GridCalEngine.DataStructures.load_data import LoadData
@@ -22,7 +27,7 @@ from GridCalEngine.DataStructures.branch_data import BranchData
 from GridCalEngine.DataStructures.hvdc_data import HvdcData
 from GridCalEngine.DataStructures.bus_data import BusData
 from GridCalEngine.basic_structures import Logger, Vec, IntVec, BoolVec, StrVec, CxMat
-from GridCalEngine.Utils.MIP.selected_interface import LpExp, LpVar, LpModel, lpDot, set_var_bounds, join
+from GridCalEngine.Utils.MIP.selected_interface import LpExp, LpVar, LpModel, set_var_bounds
 from GridCalEngine.enumerations import TapPhaseControl, HvdcControlType, AvailableTransferMode
 from GridCalEngine.Simulations.LinearFactors.linear_analysis import LinearAnalysis, LinearMultiContingencies
 from GridCalEngine.Simulations.ATC.available_transfer_capacity_driver import compute_alpha
@@ -293,6 +298,39 @@ class BusNtcVars:
         self.delta_p = np.zeros((nt, n_elm), dtype=object)
         self.proportions = np.zeros((nt, n_elm), dtype=float)
 
+        # injections (t_idx, bus index, sign, flow var) pending to be added to Pcalc
+        self.pending_inj: List[Tuple[int, int, float, LpVar]] = list()
+
+    def add_pending_injection(self, t_idx: int, bus: int, sign: float, flow: LpVar):
+        """
+        Stage an injection to be added to Pcalc when calling flush_pending
+        :param t_idx: time index
+        :param bus: bus index
+        :param sign: sign of the injection (+1 incoming, -1 outgoing)
+        :param flow: flow LP var
+        """
+        self.pending_inj.append((t_idx, bus, sign, flow))
+
+    def flush_pending(self, t_idx: int):
+        """
+        Add the pending injections of a time step to Pcalc, building a single expression per bus
+        :param t_idx: time index
+        """
+        signs_per_bus = dict()
+        flows_per_bus = dict()
+        remaining = list()
+        for t, bus, sign, flow in self.pending_inj:
+            if t == t_idx:
+                signs_per_bus.setdefault(bus, list()).append(sign)
+                flows_per_bus.setdefault(bus, list()).append(flow)
+            else:
+                remaining.append((t, bus, sign, flow))
+
+        for bus, signs in signs_per_bus.items():
+            self.Pcalc[t_idx, bus] = self.Pcalc[t_idx, bus] + LpModel.dot(signs, flows_per_bus[bus])
+
+        self.pending_inj = remaining
+
     def get_values(self, Sbase: float, model: LpModel) -> "BusNtcVars":
         """
         Return an instance of this class where the arrays content are not LP vars but their value
@@ -356,6 +394,19 @@ class BranchNtcVars:
 
         self.inter_space_branches: List[Tuple[int, float]] = list()  # index, sense
 
+        # same as inter_space_branches, split in arrays
+        self.inter_space_idx: IntVec = np.zeros(0, dtype=int)
+        self.inter_space_sense: Vec = np.zeros(0, dtype=float)
+
+    def set_inter_space_branches(self, inter_space_branches: List[Tuple[int, float]]):
+        """
+        Set the inter space branches
+        :param inter_space_branches: List of (index, flow sense w.r.t the area exchange)
+        """
+        self.inter_space_branches = inter_space_branches
+        self.inter_space_idx = np.array([k for k, sense in inter_space_branches], dtype=int)
+        self.inter_space_sense = np.array([sense for k, sense in inter_space_branches], dtype=float)
+
     def get_values(self, Sbase: float, model: LpModel) -> "BranchNtcVars":
         """
         Return an instance of this class where the arrays content are not LP vars but their value
@@ -367,7 +418,7 @@ class BranchNtcVars:
         data.rates = self.rates
         data.contingency_rates = self.contingency_rates
         data.alpha = self.alpha
-        data.inter_space_branches = self.inter_space_branches
+        data.set_inter_space_branches(self.inter_space_branches)
 
         for t in range(nt):
             for i in range(n_elm):
@@ -438,6 +489,19 @@ class HvdcNtcVars:
 
         self.inter_space_hvdc: List[Tuple[int, float]] = list()  # index, sense
 
+        # same as inter_space_hvdc, split in arrays
+        self.inter_space_idx: IntVec = np.zeros(0, dtype=int)
+        self.inter_space_sense: Vec = np.zeros(0, dtype=float)
+
+    def set_inter_space_hvdc(self, inter_space_hvdc: List[Tuple[int, float]]):
+        """
+        Set the inter space hvdc lines
+        :param inter_space_hvdc: List of (index, flow sense w.r.t the area exchange)
+        """
+        self.inter_space_hvdc = inter_space_hvdc
+        self.inter_space_idx = np.array([k for k, sense in inter_space_hvdc], dtype=int)
+        self.inter_space_sense = np.array([sense for k, sense in inter_space_hvdc], dtype=float)
+
     def get_values(self, Sbase: float, model: LpModel) -> "HvdcNtcVars":
         """
         Return an instance of this class where the arrays content are not LP vars but their value
@@ -446,7 +510,7 @@ class HvdcNtcVars:
         nt, n_elm = self.flows.shape
         data = HvdcNtcVars(nt=nt, n_elm=n_elm)
         data.rates = self.rates
-        data.inter_space_hvdc = self.inter_space_hvdc
+        data.set_inter_space_hvdc(self.inter_space_hvdc)
 
         for t in range(nt):
             for i in range(n_elm):
@@ -590,34 +654,33 @@ def add_linear_injections_formulation(t: Union[int, None],
     ntc_vars.bus_vars.proportions[t, :] = proportions
 
     f_obj = 0.0
-    deltas_1 = 0.0
-    for k in bus_a1_idx:
-        if bus_data_t.active[k] and proportions[k] != 0:
-            # declare bus delta injections
-            ntc_vars.bus_vars.delta_p[t, k] = prob.add_var(
-                lb=0,
-                ub=prob.INFINITY,
-                name=join("dp_up_", [t, k], "_")
-            )
 
-            # add the deltas of the sending area
-            deltas_1 += ntc_vars.bus_vars.delta_p[t, k]
+    # declare bus delta injections of the sending area
+    idx1 = bus_a1_idx[bus_data_t.active[bus_a1_idx].astype(bool) & (proportions[bus_a1_idx] != 0)]
+    ntc_vars.bus_vars.delta_p[t, idx1] = prob.add_var_array(
+        lb=np.zeros(len(idx1)),
+        ub=np.full(len(idx1), prob.INFINITY),
+        name_prefix=f"dp_up_{t}_" if prob.emit_names else "",
+        idx=idx1
+    )
+
+    # add the deltas of the sending area
+    deltas_1 = prob.sum(ntc_vars.bus_vars.delta_p[t, idx1])
 
     # maximize the deltas of the sending area
     # f_obj -= deltas_1
 
-    deltas_2 = 0.0
-    for k in bus_a2_idx:
-        if bus_data_t.active[k] and proportions[k] != 0:
-            # declare bus delta injections
-            ntc_vars.bus_vars.delta_p[t, k] = prob.add_var(
-                lb=0,
-                ub=prob.INFINITY,
-                name=join("dp_down_", [t, k], "_")
-            )
+    # declare bus delta injections of the receiving area
+    idx2 = bus_a2_idx[bus_data_t.active[bus_a2_idx].astype(bool) & (proportions[bus_a2_idx] != 0)]
+    ntc_vars.bus_vars.delta_p[t, idx2] = prob.add_var_array(
+        lb=np.zeros(len(idx2)),
+        ub=np.full(len(idx2), prob.INFINITY),
+        name_prefix=f"dp_down_{t}_" if prob.emit_names else "",
+        idx=idx2
+    )
 
-            # add the deltas of the sending area
-            deltas_2 += ntc_vars.bus_vars.delta_p[t, k]
+    # add the deltas of the receiving area
+    deltas_2 = prob.sum(ntc_vars.bus_vars.delta_p[t, idx2])
 
     # maximize the deltas of the sending area
     # f_obj -= deltas_2
@@ -626,24 +689,26 @@ def add_linear_injections_formulation(t: Union[int, None],
     # we have declared the deltas positive for the sending and receiving areas
     prob.add_cst(
         cst=deltas_1 == deltas_2,
-        name=join(f'deltas_equality_', [t], "_")
+        name=f"deltas_equality_{t}" if prob.emit_names else ""
     )
 
     # now, formulate the final injections for all buses
-    for k in range(bus_data_t.nbus):
-        # declare bus injections
-        ntc_vars.bus_vars.Pcalc[t, k] = prob.add_var(
-            lb=bus_pmin_t[k],
-            ub=bus_pmax_t[k],
-            name=join("inj_p", [t, k], "_")
-        )
+    ntc_vars.bus_vars.Pcalc[t, :] = prob.add_var_array(
+        lb=bus_pmin_t,
+        ub=bus_pmax_t,
+        name_prefix=f"inj_p{t}_" if prob.emit_names else ""
+    )
 
+    for k in range(bus_data_t.nbus):
         # we compute the injections power:
         # P = Pset + proportion · ΔP
         # the proportion is positive for the sending buses and negative for the receiving buses
-        prob.add_cst(
-            cst=ntc_vars.bus_vars.Pcalc[t, k] == p_bus_t[k] + proportions[k] * ntc_vars.bus_vars.delta_p[t, k],
-            name=join("bus_balance", [t, k], "_")
+        prob.add_linear_cst(
+            coefficients=(1.0, -proportions[k]),
+            variables=(ntc_vars.bus_vars.Pcalc[t, k], ntc_vars.bus_vars.delta_p[t, k]),
+            sense="==",
+            rhs=p_bus_t[k],
+            name=f"bus_balance{t}_{k}" if prob.emit_names else ""
         )
 
     return f_obj
@@ -663,6 +728,7 @@ def add_linear_branches_formulation(t_idx: int,
                                     ntc_load_rule: float,
                                     inf=1e20,
                                     add_flow_slacks: bool = True,
+                                    ntc_load_rule_rates: Vec | None = None,
                                     ):
     """
     Formulate the branches
@@ -680,10 +746,45 @@ def add_linear_branches_formulation(t_idx: int,
     :param alpha
     :param inf: number considered infinte
     :param add_flow_slacks: add aslacks to the branch flows?
+    :param ntc_load_rule_rates: ntc_load_rule * rates, if None it is computed here (optional)
     :return objective function
     """
     f_obj = 0.0
 
+    # Monitoring logic: Avoid unrealistic ntc flows over CEP rule limit in N condition
+    if monitor_only_ntc_load_rule_branches:
+        """
+        Calculo el porcentaje del ratio de la línea que se reserva al intercambio según la regla de ACER, 
+        y paso dicho valor a la frontera, y si el valor es mayor que el máximo intercambio estructural 
+        significa que la linea no puede limitar el intercambio
+        Ejemplo:
+            ntc_load_rule = 0.7
+            rate = 1700
+            alpha = 0.05
+            structural_rate = 5200
+            0.7 * 1700 --> 1190 mw para el intercambio
+            1190 / 0.05 --> 23.800 MW en la frontera en N
+            23.800 >>>> 5200 --> esta linea no puede ser declarada como limitante en la NTC en N.
+           """
+        if ntc_load_rule_rates is None:
+            ntc_load_rule_rates = ntc_load_rule * branch_data_t.rates
+
+        monitor_by_load_rule_n = ntc_load_rule_rates / (alpha + 1e-20) <= structural_ntc
+    else:
+        monitor_by_load_rule_n = np.ones(branch_data_t.nelm, dtype=bool)
+
+    # Monitoring logic: Exclude branches with not enough sensibility to exchange in N condition
+    if monitor_only_sensitive_branches:
+        monitor_by_sensitivity_n = alpha > alpha_threshold
+    else:
+        monitor_by_sensitivity_n = np.ones(branch_data_t.nelm, dtype=bool)
+
+    # branches whose rate constraint must be added
+    monitor = (branch_data_t.active.astype(bool) &
+               branch_data_t.monitor_loading &
+               monitor_by_sensitivity_n &
+               monitor_by_load_rule_n)
+
     # for each branch
     for m in range(branch_data_t.nelm):
         fr = branch_data_t.F[m]
@@ -694,14 +795,11 @@ def add_linear_branches_formulation(t_idx: int,
 
         if branch_data_t.active[m]:
 
-            # compute rate in per unit
-            rate_pu = branch_data_t.rates[m] / Sbase
-
             # declare the flow LPVar
             branch_vars.flows[t_idx, m] = prob.add_var(
                 lb=-inf,
                 ub=inf,
-                name=join("flow_", [t_idx, m], "_")
+                name=f"flow_{t_idx}_{m}" if prob.emit_names else ""
             )
 
             # compute the branch susceptance
@@ -720,15 +818,18 @@ def add_linear_branches_formulation(t_idx: int,
                 branch_vars.tap_angles[t_idx, m] = prob.add_var(
                     lb=branch_data_t.tap_angle_min[m],
                     ub=branch_data_t.tap_angle_max[m],
-                    name=join("tap_ang_", [t_idx, m], "_")
+                    name=f"tap_ang_{t_idx}_{m}" if prob.emit_names else ""
                 )
 
                 # is a phase shifter device (like phase shifter transformer or VSC with P control)
-                prob.add_cst(
-                    cst=branch_vars.flows[t_idx, m] == bk * (bus_vars.theta[t_idx, fr] -
-                                                             bus_vars.theta[t_idx, to] +
-                                                             branch_vars.tap_angles[t_idx, m]),
-                    name=join("Branch_flow_set_with_ps_", [t_idx, m], "_")
+                prob.add_linear_cst(
+                    coefficients=(1.0, -bk, bk, -bk),
+                    variables=(branch_vars.flows[t_idx, m],
+                               bus_vars.theta[t_idx, fr],
+                               bus_vars.theta[t_idx, to],
+                               branch_vars.tap_angles[t_idx, m]),
+                    sense="==",
+                    name=f"Branch_flow_set_with_ps_{t_idx}_{m}" if prob.emit_names else ""
                 )
 
                 # power injected and subtracted due to the phase shift
@@ -737,44 +838,20 @@ def add_linear_branches_formulation(t_idx: int,
 
             else:  # rest of the branches
                 # is a phase shifter device (like phase shifter transformer or VSC with P control)
-                prob.add_cst(
-                    cst=branch_vars.flows[t_idx, m] == bk * (bus_vars.theta[t_idx, fr] -
-                                                             bus_vars.theta[t_idx, to]),
-                    name=join("Branch_flow_set_", [t_idx, m], "_"))
-
-            # Monitoring logic: Avoid unrealistic ntc flows over CEP rule limit in N condition
-            if monitor_only_ntc_load_rule_branches:
-                """
-                Calculo el porcentaje del ratio de la línea que se reserva al intercambio según la regla de ACER, 
-                y paso dicho valor a la frontera, y si el valor es mayor que el máximo intercambio estructural 
-                significa que la linea no puede limitar el intercambio
-                Ejemplo:
-                    ntc_load_rule = 0.7
-                    rate = 1700
-                    alpha = 0.05
-                    structural_rate = 5200
-                    0.7 * 1700 --> 1190 mw para el intercambio
-                    1190 / 0.05 --> 23.800 MW en la frontera en N
-                    23.800 >>>> 5200 --> esta linea no puede ser declarada como limitante en la NTC en N.
-                   """
-                monitor_by_load_rule_n = ntc_load_rule * branch_data_t.rates[m] / (alpha[m] + 1e-20) <= structural_ntc
-            else:
-                monitor_by_load_rule_n = True
-
-            # Monitoring logic: Exclude branches with not enough sensibility to exchange in N condition
-            if monitor_only_sensitive_branches:
-                monitor_by_sensitivity_n = alpha[m] > alpha_threshold
-            else:
-                monitor_by_sensitivity_n = True
-
-            # add the rate constraint if the branch is monitored
-            if branch_data_t.monitor_loading[m] and monitor_by_sensitivity_n and monitor_by_load_rule_n:
-                if isinstance(branch_vars.flows[t_idx, m], LpVar):
-                    branch_vars.flows[t_idx, m].bounds(low=-rate_pu, up=rate_pu)
+                prob.add_linear_cst(
+                    coefficients=(1.0, -bk, bk),
+                    variables=(branch_vars.flows[t_idx, m], bus_vars.theta[t_idx, fr], bus_vars.theta[t_idx, to]),
+                    sense="==",
+                    name=f"Branch_flow_set_{t_idx}_{m}" if prob.emit_names else "")
+
+    # add the rate constraint for the monitored branches
+    rate_pu = branch_data_t.rates / Sbase
+    for m in np.flatnonzero(monitor):
+        if isinstance(branch_vars.flows[t_idx, m], LpVar):
+            branch_vars.flows[t_idx, m].bounds(low=-rate_pu[m], up=rate_pu[m])
 
     # add the inter-area flows to the objective function with the correct sign
-    for k, sense in branch_vars.inter_space_branches:
-        f_obj -= branch_vars.flows[t_idx, k] * sense
+    f_obj -= prob.dot(branch_vars.inter_space_sense, branch_vars.flows[t_idx, branch_vars.inter_space_idx])
 
     return f_obj
 
@@ -808,70 +885,82 @@ def add_linear_branches_contingencies_formulation(t_idx: int,
     :return objective function
     """
     f_obj = 0.0
-    for c, contingency in enumerate(linear_multicontingencies.multi_contingencies):
 
-        contingency_flows = contingency.get_lp_contingency_flows(base_flow=branch_vars.flows[t_idx, :],
-                                                                 injections=bus_vars.Pcalc[t_idx, :])
-
-        for m, contingency_flow in enumerate(contingency_flows):
-            if isinstance(contingency_flow, LpExp):
-
-                # Monitoring logic: Avoid unrealistic ntc flows over CEP rule limit in N-1 condition
-                # if monitor_only_ntc_load_rule_branches:
-                #     """
-                #     Calculo el porcentaje del ratio de la línea que se reserva al intercambio según la regla de ACER,
-                #     y paso dicho valor a la frontera, y si el valor es mayor que el máximo intercambio estructural
-                #     significa que la linea no puede limitar el intercambio
-                #     Ejemplo:
-                #         ntc_load_rule = 0.7
-                #         rate = 1700
-                #         alpha_n1 = 0.05
-                #         structural_rate = 5200
-                #         0.7 * 1700 --> 1190 mw para el intercambio
-                #         1190 / 0.05 --> 23.800 MW en la frontera en N
-                #         23.800 >>>> 5200 --> esta linea no puede ser declarada como limitante en la NTC en N.
-                #        """
-                #     monitor_by_load_rule_n1 = ntc_load_rule * branch_data_t.rates[m] / (alpha_n1[m, c] + 1e-20) <= structural_ntc
-                # else:
-                #     monitor_by_load_rule_n1 = True
-                #
-                # # Monitoring logic: Exclude branches with not enough sensibility to exchange in N-1 condition
-                # if monitor_only_sensitive_branches:
-                #     monitor_by_sensitivity_n1 = alpha_n1[m, c] > alpha_threshold
-                # else:
-                #     monitor_by_sensitivity_n1 = True
-
-                # TODO: Figure out how to compute Alpha N-1 to be able to uncomment the block above
-                monitor_by_load_rule_n1 = True
-                monitor_by_sensitivity_n1 = True
-
-                if monitor_by_load_rule_n1 and monitor_by_sensitivity_n1:
-                    # declare slack variables
-                    pos_slack = prob.add_var(0, 1e20, join("br_cst_flow_pos_sl_", [t_idx, m, c]))
-                    neg_slack = prob.add_var(0, 1e20, join("br_cst_flow_neg_sl_", [t_idx, m, c]))
-
-                    # register the contingency data to evaluate the result at the end
-                    branch_vars.add_contingency_flow(t=t_idx, m=m, c=c,
-                                                     flow_var=contingency_flow,
-                                                     neg_slack=neg_slack,
-                                                     pos_slack=pos_slack)
-
-                    # add upper rate constraint
-                    prob.add_cst(
-                        cst=contingency_flow + pos_slack - neg_slack <= branch_data_t.contingency_rates[m] / Sbase,
-                        name=join("br_cst_flow_upper_lim_", [t_idx, m, c])
-                    )
+    # contingency rates in per unit
+    cr_pu = branch_data_t.contingency_rates / Sbase
 
-                    # add lower rate constraint
-                    prob.add_cst(
-                        cst=contingency_flow + pos_slack - neg_slack >= -branch_data_t.contingency_rates[m] / Sbase,
-                        name=join("br_cst_flow_lower_lim_", [t_idx, m, c])
-                    )
+    for c, contingency in enumerate(linear_multicontingencies.multi_contingencies):
+
+        mon_idx, contingency_flows = contingency.get_lp_contingency_flows(base_flow=branch_vars.flows[t_idx, :],
+                                                                          injections=bus_vars.Pcalc[t_idx, :],
+                                                                          active=branch_data_t.active)
+
+        # Monitoring logic: Avoid unrealistic ntc flows over CEP rule limit in N-1 condition
+        # if monitor_only_ntc_load_rule_branches:
+        #     """
+        #     Calculo el porcentaje del ratio de la línea que se reserva al intercambio según la regla de ACER,
+        #     y paso dicho valor a la frontera, y si el valor es mayor que el máximo intercambio estructural
+        #     significa que la linea no puede limitar el intercambio
+        #     Ejemplo:
+        #         ntc_load_rule = 0.7
+        #         rate = 1700
+        #         alpha_n1 = 0.05
+        #         structural_rate = 5200
+        #         0.7 * 1700 --> 1190 mw para el intercambio
+        #         1190 / 0.05 --> 23.800 MW en la frontera en N
+        #         23.800 >>>> 5200 --> esta linea no puede ser declarada como limitante en la NTC en N.
+        #        """
+        #     monitor_by_load_rule_n1 = ntc_load_rule * branch_data_t.rates[m] / (alpha_n1[m, c] + 1e-20) <= structural_ntc
+        # else:
+        #     monitor_by_load_rule_n1 = True
+        #
+        # # Monitoring logic: Exclude branches with not enough sensibility to exchange in N-1 condition
+        # if monitor_only_sensitive_branches:
+        #     monitor_by_sensitivity_n1 = alpha_n1[m, c] > alpha_threshold
+        # else:
+        #     monitor_by_sensitivity_n1 = True
+
+        # TODO: Figure out how to compute Alpha N-1 to be able to uncomment the block above
+        #       (meanwhile, all the monitored branches get their contingency constraints)
+
+        # declare the slack variables of all the monitored branches of the contingency at once
+        n_mon = len(mon_idx)
+        pos_slacks = prob.add_var_array(lb=np.zeros(n_mon), ub=np.full(n_mon, 1e20),
+                                        name_prefix=f"br_cst_flow_pos_sl_{t_idx}_" if prob.emit_names else "",
+                                        idx=mon_idx,
+                                        name_suffix=f"_{c}" if prob.emit_names else "")
+        neg_slacks = prob.add_var_array(lb=np.zeros(n_mon), ub=np.full(n_mon, 1e20),
+                                        name_prefix=f"br_cst_flow_neg_sl_{t_idx}_" if prob.emit_names else "",
+                                        idx=mon_idx,
+                                        name_suffix=f"_{c}" if prob.emit_names else "")
+
+        for m, contingency_flow, pos_slack, neg_slack in zip(mon_idx, contingency_flows, pos_slacks, neg_slacks):
+
+            # register the contingency data to evaluate the result at the end
+            branch_vars.add_contingency_flow(t=t_idx, m=m, c=c,
+                                             flow_var=contingency_flow,
+                                             neg_slack=neg_slack,
+                                             pos_slack=pos_slack)
+
+            # add upper rate constraint
+            prob.add_linear_cst(
+                coefficients=(1.0, 1.0, -1.0),
+                variables=(contingency_flow, pos_slack, neg_slack),
+                sense="<=",
+                rhs=cr_pu[m],
+                name=f"br_cst_flow_upper_lim_{t_idx}_{m}_{c}" if prob.emit_names else ""
+            )
 
-                    f_obj += pos_slack + neg_slack
+            # add lower rate constraint
+            prob.add_linear_cst(
+                coefficients=(1.0, 1.0, -1.0),
+                variables=(contingency_flow, pos_slack, neg_slack),
+                sense=">=",
+                rhs=-cr_pu[m],
+                name=f"br_cst_flow_lower_lim_{t_idx}_{m}_{c}" if prob.emit_names else ""
+            )
 
-    # copy the contingency rates
-    branch_vars.contingency_rates[t_idx, :] = branch_data_t.contingency_rates
+        f_obj += prob.sum(pos_slacks) + prob.sum(neg_slacks)
 
     return f_obj
 
@@ -883,7 +972,8 @@ def add_linear_hvdc_formulation(t_idx: int,
                                 vars_bus: BusNtcVars,
                                 prob: LpModel):
     """
-
+    Add the hvdc formulation
+    The hvdc injections are staged in vars_bus, call vars_bus.flush_pending(t_idx) to add them to Pcalc
     :param t_idx:
     :param Sbase:
     :param hvdc_data_t:
@@ -895,78 +985,73 @@ def add_linear_hvdc_formulation(t_idx: int,
 
     f_obj = 0.0
 
-    for m in range(hvdc_data_t.nelm):
+    # copy rates
+    hvdc_vars.rates[t_idx, :] = hvdc_data_t.rate
+
+    # per unit magnitudes, computed at once for all the hvdc lines
+    rate_pu = hvdc_data_t.rate / Sbase
+    Pset_pu = hvdc_data_t.Pset / Sbase
+    Pset_pu_clipped = np.clip(Pset_pu, -rate_pu, rate_pu)
+    droop_pu = hvdc_data_t.get_angle_droop_in_pu_rad(Sbase)  # MW/deg to pu/rad
+
+    # declare the flow vars of the active hvdc lines
+    # (the flows of the inactive lines are exactly zero)
+    active_idx = np.flatnonzero(hvdc_data_t.active)
+    hvdc_vars.flows[t_idx, active_idx] = prob.add_var_array(
+        lb=-rate_pu[active_idx],
+        ub=rate_pu[active_idx],
+        name_prefix=f"hvdc_flow_{t_idx}_" if prob.emit_names else "",
+        idx=active_idx
+    )
+
+    for m in active_idx:
 
         fr = hvdc_data_t.F[m]
         to = hvdc_data_t.T[m]
-        hvdc_vars.rates[t_idx, m] = hvdc_data_t.rate[m]
 
-        if hvdc_data_t.active[m]:
+        if hvdc_data_t.control_mode[m] == HvdcControlType.type_0_free:
 
-            # declare the flow var
-            hvdc_vars.flows[t_idx, m] = prob.add_var(
-                lb=-hvdc_data_t.rate[m] / Sbase,
-                ub=hvdc_data_t.rate[m] / Sbase,
-                name=join("hvdc_flow_", [t_idx, m], "_")
+            # set the flow based on the angular difference
+            prob.add_linear_cst(
+                coefficients=(1.0, -droop_pu[m], droop_pu[m]),
+                variables=(hvdc_vars.flows[t_idx, m], vars_bus.theta[t_idx, fr], vars_bus.theta[t_idx, to]),
+                sense="==",
+                rhs=Pset_pu[m],
+                name=f"hvdc_flow_cst_{t_idx}_{m}" if prob.emit_names else ""
             )
 
-            if hvdc_data_t.control_mode[m] == HvdcControlType.type_0_free:
+            # add the injections matching the flow
+            vars_bus.add_pending_injection(t_idx=t_idx, bus=fr, sign=-1.0, flow=hvdc_vars.flows[t_idx, m])
+            vars_bus.add_pending_injection(t_idx=t_idx, bus=to, sign=1.0, flow=hvdc_vars.flows[t_idx, m])
 
-                # set the flow based on the angular difference
-                P0 = hvdc_data_t.Pset[m] / Sbase
+        elif hvdc_data_t.control_mode[m] == HvdcControlType.type_1_Pset:
 
-                # convert MW/deg to pu/rad
-                droop = hvdc_data_t.get_angle_droop_in_pu_rad_at(m, Sbase)
-                prob.add_cst(
-                    cst=hvdc_vars.flows[t_idx, m] == P0 + droop * (
-                            vars_bus.theta[t_idx, fr] - vars_bus.theta[t_idx, to]),
-                    name=join("hvdc_flow_cst_", [t_idx, m], "_")
-                )
+            if hvdc_data_t.dispatchable[m]:
 
                 # add the injections matching the flow
-                vars_bus.Pcalc[t_idx, fr] -= hvdc_vars.flows[t_idx, m]
-                vars_bus.Pcalc[t_idx, to] += hvdc_vars.flows[t_idx, m]
-
-            elif hvdc_data_t.control_mode[m] == HvdcControlType.type_1_Pset:
-
-                if hvdc_data_t.dispatchable[m]:
+                vars_bus.add_pending_injection(t_idx=t_idx, bus=fr, sign=-1.0, flow=hvdc_vars.flows[t_idx, m])
+                vars_bus.add_pending_injection(t_idx=t_idx, bus=to, sign=1.0, flow=hvdc_vars.flows[t_idx, m])
 
-                    # add the injections matching the flow
-                    vars_bus.Pcalc[t_idx, fr] -= hvdc_vars.flows[t_idx, m]
-                    vars_bus.Pcalc[t_idx, to] += hvdc_vars.flows[t_idx, m]
-
-                else:
-
-                    if hvdc_data_t.Pset[m] > hvdc_data_t.rate[m]:
-                        P0 = hvdc_data_t.rate[m] / Sbase
-
-                    elif hvdc_data_t.Pset[m] < -hvdc_data_t.rate[m]:
-                        P0 = -hvdc_data_t.rate[m] / Sbase
-
-                    else:
-                        P0 = hvdc_data_t.Pset[m] / Sbase
+            else:
 
-                    # make the flow equal to P0
-                    set_var_bounds(var=hvdc_vars.flows[t_idx, m], ub=P0, lb=P0)
+                # make the flow equal to the set point (within the rate)
+                P0 = Pset_pu_clipped[m]
+                set_var_bounds(var=hvdc_vars.flows[t_idx, m], ub=P0, lb=P0)
 
-                    # add the injections matching the flow
-                    vars_bus.Pcalc[t_idx, fr] -= hvdc_vars.flows[t_idx, m]
-                    vars_bus.Pcalc[t_idx, to] += hvdc_vars.flows[t_idx, m]
-            else:
-                raise Exception('OPF: Unknown HVDC control mode {}'.format(hvdc_data_t.control_mode[m]))
+                # add the injections matching the flow
+                vars_bus.add_pending_injection(t_idx=t_idx, bus=fr, sign=-1.0, flow=hvdc_vars.flows[t_idx, m])
+                vars_bus.add_pending_injection(t_idx=t_idx, bus=to, sign=1.0, flow=hvdc_vars.flows[t_idx, m])
         else:
-            # not active, therefore the flow is exactly zero
-            set_var_bounds(var=hvdc_vars.flows[t_idx, m], ub=0.0, lb=0.0)
+            raise Exception('OPF: Unknown HVDC control mode {}'.format(hvdc_data_t.control_mode[m]))
 
     # add the flows to the objective function
-    for k, sense in hvdc_vars.inter_space_hvdc:
-        f_obj -= hvdc_vars.flows[t_idx, k] * sense
+    f_obj -= prob.dot(hvdc_vars.inter_space_sense, hvdc_vars.flows[t_idx, hvdc_vars.inter_space_idx])
 
     return f_obj
 
 
 def add_linear_node_balance(t_idx: int,
-                            Bbus,
+                            Bbus_csr: sp.csr_matrix,
                             vd: IntVec,
                             bus_data: BusData,
                             bus_vars: BusNtcVars,
@@ -974,29 +1059,99 @@ def add_linear_node_balance(t_idx: int,
     """
     Add the kirchhoff nodal equality
     :param t_idx: time step
-    :param Bbus: susceptance matrix (complete)
+    :param Bbus_csr: susceptance matrix (complete) in CSR format
     :param vd: Array of slack indices
     :param bus_data: BusData
     :param bus_vars: BusVars
     :param prob: LpModel
     """
-    B = Bbus.tocsc()
-
+    theta = bus_vars.theta[t_idx, :]
     P_esp = bus_vars.Pcalc[t_idx, :]
 
-    # calculate the linear nodal injection
-    P_calc = lpDot(B, bus_vars.theta[t_idx, :])
-
     # add the equality restrictions
-    for k in range(bus_data.nbus):
-        bus_vars.kirchhoff[t_idx, k] = prob.add_cst(
-            cst=P_calc[k] == P_esp[k],
-            name=join("kirchhoff_", [t_idx, k], "_"))
+    # note: the rows of the slack buses are not redundant, since the slack injections are variables
+    #       of the problem, removing those rows would allow the injections to be unbalanced
+    bus_vars.kirchhoff[t_idx, :] = prob.add_matrix_constraints(
+        A=Bbus_csr,
+        x=theta,
+        sense="==",
+        rhs=P_esp,
+        name_prefix=f"kirchhoff_{t_idx}_" if prob.emit_names else ""
+    )
 
     for i in vd:
         set_var_bounds(var=bus_vars.theta[t_idx, i], lb=0.0, ub=0.0)
 
 
+def compile_ntc_step(grid: MultiCircuit,
+                     t: Union[int, None],
+                     bus_dict: Dict[Bus, int],
+                     areas_dict: Dict[Area, int],
+                     compute_linear_analysis: bool,
+                     logger: Logger) -> Tuple[NumericalCircuit, Union[LinearAnalysis, None]]:
+    """
+    Compile the numerical circuit of a time step and run its linear analysis.
+    This is independent of the LP model, so it can be run for several time steps at the same time.
+    :param grid: MultiCircuit instance
+    :param t: time index (in the general scheme), None for the snapshot
+    :param bus_dict: dictionary of bus objects to their index
+    :param areas_dict: dictionary of areas to their index
+    :param compute_linear_analysis: compute the PTDF and LODF?
+    :param logger: logger instance
+    :return: NumericalCircuit, LinearAnalysis (None if not computed)
+    """
+    # note: There are very little chances of simplifying this step and experience shows it is not
+    #        worth the effort, so compile every time step
+    nc: NumericalCircuit = compile_numerical_circuit_at(circuit=grid,
+                                                        t_idx=t,  # yes, this is not a bug
+                                                        bus_dict=bus_dict,
+                                                        areas_dict=areas_dict,
+                                                        logger=logger)
+
+    if compute_linear_analysis:
+        # declare the linear analysis and compute the PTDF and LODF
+        ls = LinearAnalysis(numerical_circuit=nc,
+                            distributed_slack=False,
+                            correct_values=True)
+        ls.run()
+    else:
+        ls = None
+
+    return nc, ls
+
+
+def map_in_window(func: Callable[[int], Any], n: int, n_threads: int) -> Iterator[Any]:
+    """
+    Evaluate func(0), ..., func(n - 1) in a thread pool and yield the results in order.
+    At most n_threads evaluations are running or waiting to be consumed at any time,
+    so the memory stays bounded by the window instead of growing with n
+    :param func: function of the step index
+    :param n: number of steps
+    :param n_threads: number of threads (and size of the window)
+    :return: iterator of results, in step order
+    """
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        pending = deque()
+        next_i = 0
+        try:
+            while next_i < n and len(pending) < n_threads:
+                pending.append(executor.submit(func, next_i))
+                next_i += 1
+
+            while pending:
+                res = pending.popleft().result()
+
+                if next_i < n:
+                    pending.append(executor.submit(func, next_i))
+                    next_i += 1
+
+                yield res
+        finally:
+            # if the consumer stops early, do not start the queued steps
+            for future in pending:
+                future.cancel()
+
+
 def run_linear_ntc_opf_ts(grid: MultiCircuit,
                           time_indices: Union[IntVec, None],
                           solver_type: MIPSolvers = MIPSolvers.HIGHS,
@@ -1017,7 +1172,11 @@ def run_linear_ntc_opf_ts(grid: MultiCircuit,
                           progress_func: Union[None, Callable[[float], None]] = None,
                           export_model_fname: Union[None, str] = None,
                           verbose: int = 0,
-                          robust: bool = False) -> NtcVars:
+                          robust: bool = False,
+                          assume_constant_topology: bool = False,
+                          n_threads: int = 1,
+                          lp_solver_mip_rel_gap: float | None = None,
+                          lp_solver_timeout: float | None = None) -> NtcVars:
     """
 
     :param grid: MultiCircuit instance
@@ -1041,6 +1200,17 @@ def run_linear_ntc_opf_ts(grid: MultiCircuit,
     :param export_model_fname: Export the model into LP and MPS?
     :param verbose: Verbosity level
     :param robust: Robust optimization?
+    :param assume_constant_topology: If true, the PTDF, LODF and the multi-contingencies are computed only
+                                     for the first time step and reused for the rest. The numerical circuit
+                                     is still compiled at every time step (injections, rates, etc.), only
+                                     the linear analysis is skipped; use it only if the branch statuses and
+                                     impedances do not change along the time steps
+    :param n_threads: number of threads used to compile the time steps and run their linear analysis
+                      (the LP formulation is always built sequentially). The compilation is mostly Python code
+                      that holds the GIL, so only the numpy / scipy parts of it overlap; hence this is opt-in
+                      and 1 (sequential) by default
+    :param lp_solver_mip_rel_gap: relative gap at which the solver may stop (None for the solver default)
+    :param lp_solver_timeout: maximum solving time in seconds (None for no limit)
     :return: NtcVars class with the results
     """
     mode_2_int = {
@@ -1053,6 +1223,10 @@ def run_linear_ntc_opf_ts(grid: MultiCircuit,
     bus_dict = {bus: i for i, bus in enumerate(grid.buses)}
     areas_dict = {elm: i for i, elm in enumerate(grid.areas)}
 
+    # bus indices of each exchange area
+    bus_a1_idx_set: FrozenSet[int] = frozenset(np.asarray(bus_a1_idx).tolist())
+    bus_a2_idx_set: FrozenSet[int] = frozenset(np.asarray(bus_a2_idx).tolist())
+
     if time_indices is None:
         time_indices = [None]
     else:
@@ -1071,7 +1245,8 @@ def run_linear_ntc_opf_ts(grid: MultiCircuit,
     n_hvdc = grid.get_hvdc_number()
 
     # Declare the LP model
-    lp_model: LpModel = LpModel(solver_type)
+    # the constraint names are only relevant when inspecting the model
+    lp_model: LpModel = LpModel(solver_type, emit_names=verbose > 0 or export_model_fname is not None)
 
     # declare structures of LP vars
     mip_vars = NtcVars(nt=nt, nbus=n, ng=ng, nb=nb, nl=nl, nbr=nbr, n_hvdc=n_hvdc, model=lp_model)
@@ -1079,40 +1254,66 @@ def run_linear_ntc_opf_ts(grid: MultiCircuit,
     # objective function
     f_obj = 0.0
 
-    for t_idx, t in enumerate(time_indices):  # use time_indices = [None] to simulate the snapshot
+    # buffer of bus injections, reused at every time step
+    Pbus = np.empty(n, dtype=float)
 
-        # compile the circuit at the master time index ------------------------------------------------------------
-        # note: There are very little chances of simplifying this step and experience shows it is not
-        #        worth the effort, so compile every time step
-        nc: NumericalCircuit = compile_numerical_circuit_at(circuit=grid,
-                                                            t_idx=t,  # yes, this is not a bug
-                                                            bus_dict=bus_dict,
-                                                            areas_dict=areas_dict,
-                                                            logger=logger)
+    # linear analysis and multi-contingencies (reused along the time steps if the topology is constant)
+    ls: Union[LinearAnalysis, None] = None
+    mctg: Union[LinearMultiContingencies, None] = None
+    Bbus_csr: Union[sp.csr_matrix, None] = None
 
-        if t_idx == 0:
-            # branch index, branch object, flow sense w.r.t the area exchange
-            bus_a1_idx_set = set(bus_a1_idx)
-            bus_a2_idx_set = set(bus_a2_idx)
+    # compile the circuit and run the linear analysis of the time steps ---------------------------------------------
+    def compile_step(t_idx_: int) -> Tuple[NumericalCircuit, Union[LinearAnalysis, None], Logger]:
+        """
+        Compile the time step t_idx_ of time_indices
+        :param t_idx_: time step
+        :return: NumericalCircuit, LinearAnalysis (None if not needed), Logger of the step
+        """
+        # every step logs into its own logger, so that the steps compiled in parallel do not share one
+        step_logger = Logger()
+        nc_, ls_ = compile_ntc_step(
+            grid=grid,
+            t=time_indices[t_idx_],
+            bus_dict=bus_dict,
+            areas_dict=areas_dict,
+            compute_linear_analysis=(zonal_grouping == ZonalGrouping.NoGrouping and
+                                     (t_idx_ == 0 or not assume_constant_topology)),
+            logger=step_logger
+        )
+        return nc_, ls_, step_logger
+
+    if n_threads > 1 and nt > 1:
+        # opt-in: the next time steps are compiled while the current one is formulated
+        steps_data = map_in_window(compile_step, nt, n_threads)
+    else:
+        # compile lazily along the loop
+        steps_data = map(compile_step, range(nt))
 
+    for t_idx, (nc, ls_t, step_logger) in enumerate(steps_data):  # use time_indices = [None] to simulate the snapshot
+
+        # merge the step messages in time order
+        logger += step_logger
+
+        if t_idx == 0:
             # find the inter space branches given the bus indices of each space
-            mip_vars.branch_vars.inter_space_branches = nc.branch_data.get_inter_areas(bus_idx_from=bus_a1_idx_set,
-                                                                                       bus_idx_to=bus_a2_idx_set)
-            mip_vars.hvdc_vars.inter_space_hvdc = nc.hvdc_data.get_inter_areas(bus_idx_from=bus_a1_idx_set,
-                                                                               bus_idx_to=bus_a2_idx_set)
+            mip_vars.branch_vars.set_inter_space_branches(
+                nc.branch_data.get_inter_areas(bus_idx_from=bus_a1_idx_set, bus_idx_to=bus_a2_idx_set)
+            )
+            mip_vars.hvdc_vars.set_inter_space_hvdc(
+                nc.hvdc_data.get_inter_areas(bus_idx_from=bus_a1_idx_set, bus_idx_to=bus_a2_idx_set)
+            )
 
         # formulate the bus angles ---------------------------------------------------------------------------------
-        for k in range(nc.bus_data.nbus):
-            mip_vars.bus_vars.theta[t_idx, k] = lp_model.add_var(
-                lb=nc.bus_data.angle_min[k],
-                ub=nc.bus_data.angle_max[k],
-                name=join("th_", [t_idx, k], "_")
-            )
+        mip_vars.bus_vars.theta[t_idx, :] = lp_model.add_var_array(
+            lb=nc.bus_data.angle_min,
+            ub=nc.bus_data.angle_max,
+            name_prefix=f"th_{t_idx}_" if lp_model.emit_names else ""
+        )
 
         # formulate injections -------------------------------------------------------------------------------------
 
         # magic scaling: the demand must be exactly (to the solver tolerance) the same as the demand
-        Pbus = nc.Pbus.copy()
+        np.copyto(Pbus, nc.Pbus)
         Ptotal = np.sum(Pbus)
         Pbus[nc.vd] -= Ptotal / len(nc.vd)
 
@@ -1142,15 +1343,20 @@ def run_linear_ntc_opf_ts(grid: MultiCircuit,
             prob=lp_model,
         )
 
+        # add the staged hvdc injections to the bus injections
+        mip_vars.bus_vars.flush_pending(t_idx=t_idx)
+
         if zonal_grouping == ZonalGrouping.NoGrouping:
 
-            # declare the linear analysis
-            ls = LinearAnalysis(numerical_circuit=nc,
-                                distributed_slack=False,
-                                correct_values=True)
+            if ls_t is not None:
+                # new PTDF and LODF
+                ls = ls_t
 
-            # compute the PTDF and LODF
-            ls.run()
+                # the mctg depends on the PTDF and LODF, so it must be recomputed
+                mctg = None
+
+                # susceptance matrix in the format used by the nodal balance
+                Bbus_csr = nc.Bbus.tocsr()
 
             # compute the sensitivity to the exchange
             alpha = compute_alpha(ptdf=ls.PTDF,
@@ -1189,7 +1395,7 @@ def run_linear_ntc_opf_ts(grid: MultiCircuit,
 
             # formulate nodes ---------------------------------------------------------------------------------------
             add_linear_node_balance(t_idx=t_idx,
-                                    Bbus=nc.Bbus,
+                                    Bbus_csr=Bbus_csr,
                                     vd=nc.vd,
                                     bus_data=nc.bus_data,
                                     bus_vars=mip_vars.bus_vars,
@@ -1201,13 +1407,14 @@ def run_linear_ntc_opf_ts(grid: MultiCircuit,
 
                 if len(contingency_groups_used) > 0:
 
-                    # declare the multi-contingencies analysis and compute
-                    mctg = LinearMultiContingencies(grid=grid,
-                                                    contingency_groups_used=contingency_groups_used)
-                    mctg.compute(lodf=ls.LODF,
-                                 ptdf=ls.PTDF,
-                                 ptdf_threshold=lodf_threshold,
-                                 lodf_threshold=lodf_threshold)
+                    if mctg is None:
+                        # declare the multi-contingencies analysis and compute
+                        mctg = LinearMultiContingencies(grid=grid,
+                                                        contingency_groups_used=contingency_groups_used)
+                        mctg.compute(lodf=ls.LODF,
+                                     ptdf=ls.PTDF,
+                                     ptdf_threshold=lodf_threshold,
+                                     lodf_threshold=lodf_threshold)
 
                     # formulate the contingencies
                     f_obj += add_linear_branches_contingencies_formulation(
@@ -1225,6 +1432,9 @@ def run_linear_ntc_opf_ts(grid: MultiCircuit,
                         alpha_threshold=alpha_threshold,
                     )
 
+                    # copy the contingency rates
+                    mip_vars.branch_vars.contingency_rates[t_idx, :] = nc.branch_data.contingency_rates
+
                 else:
                     logger.add_warning(msg="Contingencies enabled, but no contingency groups provided")
 
@@ -1250,7 +1460,8 @@ def run_linear_ntc_opf_ts(grid: MultiCircuit,
         print('LP model saved as:', export_model_fname)
 
     # solve the model
-    status = lp_model.solve(robust=robust, show_logs=verbose > 0, progress_text=progress_text)
+    status = lp_model.solve(robust=robust, show_logs=verbose > 0, progress_text=progress_text,
+                            mip_rel_gap=lp_solver_mip_rel_gap, time_limit=lp_solver_timeout)
 
     # gather the results
     logger.add_info(msg="Status", value=lp_model.status2string(status))
@@ -1297,7 +1508,9 @@ def run_linear_ntc_opf_ts_fast(grid: MultiCircuit,
                                progress_func: Union[None, Callable[[float], None]] = None,
                                export_model_fname: Union[None, str] = None,
                                verbose: int = 0,
-                               robust: bool = False) -> NtcVars:
+                               robust: bool = False,
+                               lp_solver_mip_rel_gap: float | None = None,
+                               lp_solver_timeout: float | None = None) -> NtcVars:
     """
 
     :param grid: MultiCircuit instance
@@ -1321,6 +1534,8 @@ def run_linear_ntc_opf_ts_fast(grid: MultiCircuit,
     :param export_model_fname: Export the model into LP and MPS?
     :param verbose: Verbosity level
     :param robust: Robust optimization?
+    :param lp_solver_mip_rel_gap: relative gap at which the solver may stop (None for the solver default)
+    :param lp_solver_timeout: maximum solving time in seconds (None for no limit)
     :return: NtcVars class with the results
     """
     mode_2_int = {
@@ -1333,6 +1548,10 @@ def run_linear_ntc_opf_ts_fast(grid: MultiCircuit,
     bus_dict = {bus: i for i, bus in enumerate(grid.buses)}
     areas_dict = {elm: i for i, elm in enumerate(grid.areas)}
 
+    # bus indices of each exchange area
+    bus_a1_idx_set: FrozenSet[int] = frozenset(np.asarray(bus_a1_idx).tolist())
+    bus_a2_idx_set: FrozenSet[int] = frozenset(np.asarray(bus_a2_idx).tolist())
+
     if time_indices is None:
         time_indices = [None]
     else:
@@ -1351,7 +1570,8 @@ def run_linear_ntc_opf_ts_fast(grid: MultiCircuit,
     n_hvdc = grid.get_hvdc_number()
 
     # Declare the LP model
-    lp_model: LpModel = LpModel(solver_type)
+    # the constraint names are only relevant when inspecting the model
+    lp_model: LpModel = LpModel(solver_type, emit_names=verbose > 0 or export_model_fname is not None)
 
     # declare structures of LP vars
     mip_vars = NtcVars(nt=nt, nbus=n, ng=ng, nb=nb, nl=nl, nbr=nbr, n_hvdc=n_hvdc, model=lp_model)
@@ -1371,6 +1591,9 @@ def run_linear_ntc_opf_ts_fast(grid: MultiCircuit,
 
     Pbus_prof = grid.get_Sbus_prof().real
 
+    # buffer of bus injections, reused at every time step
+    Pbus = np.empty(n, dtype=float)
+
     # declare the linear analysis
     ls = LinearAnalysis(numerical_circuit=nc,
                         distributed_slack=False,
@@ -1393,6 +1616,12 @@ def run_linear_ntc_opf_ts_fast(grid: MultiCircuit,
     # compute the structural NTC: this is the sum of ratings in the inter area
     structural_ntc = nc.get_structural_ntc(bus_a1_idx=bus_a1_idx, bus_a2_idx=bus_a2_idx)
 
+    # susceptance matrix in the format used by the nodal balance
+    Bbus_csr = nc.Bbus.tocsr()
+
+    # branch rates reserved to the exchange by the ntc load rule
+    ntc_load_rule_rates = ntc_load_rule * nc.branch_data.rates
+
     # declare the multi-contingencies analysis and compute
     mctg = LinearMultiContingencies(grid=grid,
                                     contingency_groups_used=contingency_groups_used)
@@ -1401,39 +1630,39 @@ def run_linear_ntc_opf_ts_fast(grid: MultiCircuit,
                  ptdf_threshold=lodf_threshold,
                  lodf_threshold=lodf_threshold)
 
+    if zonal_grouping == ZonalGrouping.NoGrouping and consider_contingencies and len(contingency_groups_used) > 0:
+        # the contingency rates are the same for all the time steps, since the circuit is compiled once
+        mip_vars.branch_vars.contingency_rates[:, :] = nc.branch_data.contingency_rates[np.newaxis, :]
+
+    # find the inter space branches given the bus indices of each space
+    mip_vars.branch_vars.set_inter_space_branches(
+        nc.branch_data.get_inter_areas(bus_idx_from=bus_a1_idx_set, bus_idx_to=bus_a2_idx_set)
+    )
+    mip_vars.hvdc_vars.set_inter_space_hvdc(
+        nc.hvdc_data.get_inter_areas(bus_idx_from=bus_a1_idx_set, bus_idx_to=bus_a2_idx_set)
+    )
+
     # END OF THINGS THAT CAN BE COMPUTED LESS TIMES --------------------------------------------------------------------
 
     for t_idx, t in enumerate(time_indices):  # use time_indices = [None] to simulate the snapshot
 
         # TODO: determine if this is sufficient
         if t is None:
-            Pbus = grid.get_Sbus().real
+            np.copyto(Pbus, grid.get_Sbus().real)
         else:
-            Pbus = Pbus_prof[t, :]
+            np.copyto(Pbus, Pbus_prof[t, :])
 
         # magic scaling: the demand must be exactly (to the solver tolerance) the same as the demand
         # TODO: Replace by old more detailed scaling function
         Ptotal = np.sum(Pbus)
         Pbus[nc.vd] -= Ptotal / len(nc.vd)
 
-        if t_idx == 0:
-            # branch index, branch object, flow sense w.r.t the area exchange
-            bus_a1_idx_set = set(bus_a1_idx)
-            bus_a2_idx_set = set(bus_a2_idx)
-
-            # find the inter space branches given the bus indices of each space
-            mip_vars.branch_vars.inter_space_branches = nc.branch_data.get_inter_areas(bus_idx_from=bus_a1_idx_set,
-                                                                                       bus_idx_to=bus_a2_idx_set)
-            mip_vars.hvdc_vars.inter_space_hvdc = nc.hvdc_data.get_inter_areas(bus_idx_from=bus_a1_idx_set,
-                                                                               bus_idx_to=bus_a2_idx_set)
-
         # formulate the bus angles ---------------------------------------------------------------------------------
-        for k in range(nc.bus_data.nbus):
-            mip_vars.bus_vars.theta[t_idx, k] = lp_model.add_var(
-                lb=nc.bus_data.angle_min[k],
-                ub=nc.bus_data.angle_max[k],
-                name=join("th_", [t_idx, k], "_")
-            )
+        mip_vars.bus_vars.theta[t_idx, :] = lp_model.add_var_array(
+            lb=nc.bus_data.angle_min,
+            ub=nc.bus_data.angle_max,
+            name_prefix=f"th_{t_idx}_" if lp_model.emit_names else ""
+        )
 
         # formulate injections -------------------------------------------------------------------------------------
 
@@ -1466,6 +1695,9 @@ def run_linear_ntc_opf_ts_fast(grid: MultiCircuit,
             prob=lp_model,
         )
 
+        # add the staged hvdc injections to the bus injections
+        mip_vars.bus_vars.flush_pending(t_idx=t_idx)
+
         if zonal_grouping == ZonalGrouping.NoGrouping:
 
             mip_vars.branch_vars.alpha[t_idx, :] = alpha
@@ -1488,12 +1720,13 @@ def run_linear_ntc_opf_ts_fast(grid: MultiCircuit,
                 ntc_load_rule=ntc_load_rule,
                 inf=1e20,
                 add_flow_slacks=False,
+                ntc_load_rule_rates=ntc_load_rule_rates,
             )
 
             # formulate nodes ---------------------------------------------------------------------------------------
             # TODO: review that the samples NumericalCircuit is ok to use here
             add_linear_node_balance(t_idx=t_idx,
-                                    Bbus=nc.Bbus,
+                                    Bbus_csr=Bbus_csr,
                                     vd=nc.vd,
                                     bus_data=nc.bus_data,
                                     bus_vars=mip_vars.bus_vars,
@@ -1548,7 +1781,8 @@ def run_linear_ntc_opf_ts_fast(grid: MultiCircuit,
         print('LP model saved as:', export_model_fname)
 
     # solve the model
-    status = lp_model.solve(robust=robust, show_logs=verbose > 0, progress_text=progress_text)
+    status = lp_model.solve(robust=robust, show_logs=verbose > 0, progress_text=progress_text,
+                            mip_rel_gap=lp_solver_mip_rel_gap, time_limit=lp_solver_timeout)
 
     # gather the results
     logger.add_info(msg="Status", value=lp_model.status2string(status))
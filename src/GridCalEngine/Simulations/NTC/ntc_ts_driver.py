@@ -4,16 +4,16 @@
 # SPDX-License-Identifier: MPL-2.0
 
 import numpy as np
-from typing import Union
+from typing import Union, Tuple, Iterable
 
 from GridCalEngine.Devices.multi_circuit import MultiCircuit
-from GridCalEngine.Simulations.NTC.ntc_opf import run_linear_ntc_opf_ts
+from GridCalEngine.Simulations.NTC.ntc_opf import run_linear_ntc_opf_ts, map_in_window, NtcVars
 from GridCalEngine.Simulations.NTC.ntc_driver import OptimalNetTransferCapacityOptions
 from GridCalEngine.Simulations.NTC.ntc_ts_results import OptimalNetTransferCapacityTimeSeriesResults
 from GridCalEngine.Simulations.driver_template import TimeSeriesDriverTemplate
 from GridCalEngine.Simulations.Clustering.clustering_results import ClusteringResults
 from GridCalEngine.basic_structures import Logger
-from GridCalEngine.enumerations import SimulationTypes
+from GridCalEngine.enumerations import SimulationTypes, MIPSolvers
 
 
 class OptimalNetTransferCapacityTimeSeriesDriver(TimeSeriesDriverTemplate):
@@ -22,13 +22,16 @@ class OptimalNetTransferCapacityTimeSeriesDriver(TimeSeriesDriverTemplate):
     def __init__(self, grid: MultiCircuit,
                  options: OptimalNetTransferCapacityOptions,
                  time_indices: np.ndarray,
-                 clustering_results: Union[ClusteringResults, None] = None):
+                 clustering_results: Union[ClusteringResults, None] = None,
+                 n_threads: int = 1):
         """
 
         :param grid: MultiCircuit Object
         :param options: Optimal net transfer capacity options
         :param time_indices: time index to start (optional)
         :param clustering_results: ClusteringResults (optional)
+        :param n_threads: number of time steps to formulate and solve at the same time (optional,
+                          only used with the HiGHS solver and without model export)
         """
         TimeSeriesDriverTemplate.__init__(
             self,
@@ -40,6 +43,8 @@ class OptimalNetTransferCapacityTimeSeriesDriver(TimeSeriesDriverTemplate):
         self.options: OptimalNetTransferCapacityOptions = options
         self.unresolved_counter = 0
 
+        self.n_threads = n_threads
+
         self.logger = Logger()
 
         self.results: Union[None, OptimalNetTransferCapacityTimeSeriesResults] = None
@@ -65,8 +70,13 @@ class OptimalNetTransferCapacityTimeSeriesDriver(TimeSeriesDriverTemplate):
             clustering_results=self.clustering_results,
         )
 
-        for t_idx, t in enumerate(self.time_indices):
-
+        def solve_step(t: int) -> Tuple[NtcVars, Logger]:
+            """
+            Formulate and solve the NTC of a single time step
+            :param t: time index
+            :return: NtcVars, Logger of the step
+            """
+            step_logger = Logger()
             opf_vars = run_linear_ntc_opf_ts(
                 grid=self.grid,
                 time_indices=[t],  # only one time index at a time
@@ -78,57 +88,87 @@ class OptimalNetTransferCapacityTimeSeriesDriver(TimeSeriesDriverTemplate):
                 lodf_threshold=self.options.lin_options.lodf_threshold,
                 bus_a1_idx=self.options.sending_bus_idx,
                 bus_a2_idx=self.options.receiving_bus_idx,
-                logger=self.logger,
+                logger=step_logger,
                 progress_text=None,
                 progress_func=None,
                 export_model_fname=self.options.opf_options.export_model_fname,
                 verbose=self.options.opf_options.verbose,
                 robust=self.options.opf_options.robust
             )
-
-            if t_idx == 0:
-                # one time results
-                self.results.rates = opf_vars.branch_vars.rates[0, :]
-                self.results.contingency_rates = opf_vars.branch_vars.contingency_rates[0, :]
-                self.results.sending_bus_idx = self.options.sending_bus_idx
-                self.results.receiving_bus_idx = self.options.receiving_bus_idx
-                self.results.inter_space_branches = opf_vars.branch_vars.inter_space_branches
-                self.results.inter_space_hvdc = opf_vars.hvdc_vars.inter_space_hvdc
-
-            self.results.voltage[t_idx, :] = opf_vars.get_voltages()[0, :]
-            self.results.Sbus[t_idx, :] = opf_vars.bus_vars.Pcalc[0, :]
-            self.results.dSbus[t_idx, :] = opf_vars.bus_vars.delta_p[0, :]
-            self.results.bus_shadow_prices[t_idx, :] = opf_vars.bus_vars.shadow_prices[0, :]
-            self.results.load_shedding[t_idx, :] = opf_vars.bus_vars.load_shedding[0, :]
-
-            self.results.Sf[t_idx, :] = opf_vars.branch_vars.flows[0, :]
-            self.results.St[t_idx, :] = -opf_vars.branch_vars.flows[0, :]
-            self.results.overloads[t_idx, :] = (opf_vars.branch_vars.flow_slacks_pos[0, :]
-                                                - opf_vars.branch_vars.flow_slacks_neg[0, :])
-            self.results.loading[t_idx, :] = opf_vars.branch_vars.loading[0, :]
-            self.results.phase_shift[t_idx, :] = opf_vars.branch_vars.tap_angles[0, :]
-
-            self.results.alpha[t_idx, :] = opf_vars.branch_vars.alpha[0, :]
-            self.results.monitor_logic[t_idx, :] = opf_vars.branch_vars.monitor_logic[0, :]
-
-            self.results.contingency_flows_list += opf_vars.branch_vars.contingency_flow_data
-
-            self.results.hvdc_Pf[t_idx, :] = opf_vars.hvdc_vars.flows[0, :]
-            self.results.hvdc_loading[t_idx, :] = opf_vars.hvdc_vars.loading[0, :]
-
-            self.results.converged[t_idx] = opf_vars.acceptable_solution
-
-            # update progress bar
-            self.report_progress2(t_idx, len(self.time_indices))
-
-            if self.progress_text is not None:
-                self.report_text('Optimal net transfer capacity at ' + str(self.grid.time_profile[t]))
-
-            else:
-                print('Optimal net transfer capacity at ' + str(self.grid.time_profile[t]))
-
-            if self.__cancel__:
-                break
+            return opf_vars, step_logger
+
+        def collect(steps_vars: Iterable[Tuple[NtcVars, Logger]]) -> None:
+            """
+            Store the results of the time steps, in order
+            :param steps_vars: iterable of (NtcVars, Logger) per time index
+            """
+            for t_idx, (t, (opf_vars, step_logger)) in enumerate(zip(self.time_indices, steps_vars)):
+
+                self.logger += step_logger
+
+                if t_idx == 0:
+                    # one time results
+                    self.results.rates = opf_vars.branch_vars.rates[0, :]
+                    self.results.contingency_rates = opf_vars.branch_vars.contingency_rates[0, :]
+                    self.results.sending_bus_idx = self.options.sending_bus_idx
+                    self.results.receiving_bus_idx = self.options.receiving_bus_idx
+                    self.results.inter_space_branches = opf_vars.branch_vars.inter_space_branches
+                    self.results.inter_space_hvdc = opf_vars.hvdc_vars.inter_space_hvdc
+
+                self.results.voltage[t_idx, :] = opf_vars.get_voltages()[0, :]
+                self.results.Sbus[t_idx, :] = opf_vars.bus_vars.Pcalc[0, :]
+                self.results.dSbus[t_idx, :] = opf_vars.bus_vars.delta_p[0, :]
+                self.results.bus_shadow_prices[t_idx, :] = opf_vars.bus_vars.shadow_prices[0, :]
+                self.results.load_shedding[t_idx, :] = opf_vars.bus_vars.load_shedding[0, :]
+
+                self.results.Sf[t_idx, :] = opf_vars.branch_vars.flows[0, :]
+                self.results.St[t_idx, :] = -opf_vars.branch_vars.flows[0, :]
+                self.results.overloads[t_idx, :] = (opf_vars.branch_vars.flow_slacks_pos[0, :]
+                                                    - opf_vars.branch_vars.flow_slacks_neg[0, :])
+                self.results.loading[t_idx, :] = opf_vars.branch_vars.loading[0, :]
+                self.results.phase_shift[t_idx, :] = opf_vars.branch_vars.tap_angles[0, :]
+
+                self.results.alpha[t_idx, :] = opf_vars.branch_vars.alpha[0, :]
+                self.results.monitor_logic[t_idx, :] = opf_vars.branch_vars.monitor_logic[0, :]
+
+                self.results.contingency_flows_list += opf_vars.branch_vars.contingency_flow_data
+
+                self.results.hvdc_Pf[t_idx, :] = opf_vars.hvdc_vars.flows[0, :]
+                self.results.hvdc_loading[t_idx, :] = opf_vars.hvdc_vars.loading[0, :]
+
+                self.results.converged[t_idx] = opf_vars.acceptable_solution
+
+                # update progress bar
+                self.report_progress2(t_idx, len(self.time_indices))
+
+                if self.progress_text is not None:
+                    self.report_text('Optimal net transfer capacity at ' + str(self.grid.time_profile[t]))
+
+                else:
+                    print('Optimal net transfer capacity at ' + str(self.grid.time_profile[t]))
+
+                if self.__cancel__:
+                    break
+
+        # the time steps are independent LPs, so several of them may be formulated and solved at the same time.
+        # This is only done when every step has its own in-process solver instance (HiGHS), when the steps do not
+        # write the same model file, and when there are more steps than threads; otherwise, the steps run in series
+        use_threads = (self.n_threads > 1 and
+                       len(self.time_indices) > self.n_threads and
+                       self.options.opf_options.mip_solver == MIPSolvers.HIGHS and
+                       self.options.opf_options.export_model_fname is None)
+
+        if use_threads:
+            # at most n_threads steps are in memory at any time, and the results are collected in order
+            steps_vars = map_in_window(lambda i: solve_step(self.time_indices[i]),
+                                       len(self.time_indices), self.n_threads)
+            try:
+                collect(steps_vars)
+            finally:
+                # on cancellation or error, do not start the steps that are still queued
+                steps_vars.close()
+        else:
+            collect(map(solve_step, self.time_indices))
 
         self.report_text('Done!')
 
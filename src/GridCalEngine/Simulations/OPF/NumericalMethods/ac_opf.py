@@ -154,7 +154,7 @@ def compute_analytic_structures(x, mu, lmbda, compute_jac: bool, compute_hess: b
                                 nodal_capacity_sign, nslcap, pq, pv, Pf_nondisp, Pdcmax, V_U, V_L,
                                 P_U, P_L, tanmax, Q_U, Q_L, tapm_max, tapm_min, tapt_max, tapt_min, alltapm, alltapt,
                                 k_m, k_tau, c0, c1, c2, c_s, c_v, Sbase, rates, il, nll, ig, nig, Sg_undis, ctQ,
-                                acopf_mode) -> Tuple[IpsFunctionReturn, Vec]:
+                                acopf_mode, fast_jac: bool = False) -> Tuple[IpsFunctionReturn, Vec]:
     """
     A function that computes the optimization model for a NumericalCircuit object and returns the values of the
     equations and their derivatives computed analyitically
@@ -206,6 +206,7 @@ def compute_analytic_structures(x, mu, lmbda, compute_jac: bool, compute_hess: b
     :param Sg_undis: undispatchable complex power
     :param ctQ: Boolean that indicates if the Reactive control applies
     :param use_bound_slacks: Determine if there will be bound slacks in the optimization model
+    :param fast_jac: compute the power injection derivatives with the numba Ybus kernel
     :return: Object with all the model equations and derivatives stored
     """
 
@@ -270,7 +271,8 @@ def compute_analytic_structures(x, mu, lmbda, compute_jac: bool, compute_hess: b
                                                                   T_hvdc=tdc, k_m=k_m, k_tau=k_tau, mu=mu, lmbda=lmbda,
                                                                   R=R, X=X,
                                                                   F=from_idx, T=to_idx, ctQ=ctQ, acopf_mode=acopf_mode,
-                                                                  compute_jac=compute_jac, compute_hess=compute_hess)
+                                                                  compute_jac=compute_jac, compute_hess=compute_hess,
+                                                                  fast_jac=fast_jac)
 
     times = np.r_[te_modadm - ts_modadm, te_f - ts_f, te_g - ts_g, te_h - ts_h, der_times]
 
@@ -506,6 +508,7 @@ def ac_optimal_power_flow(nc: NumericalCircuit,
                           opf_options: OptimalPowerFlowOptions,
                           debug: bool = False,
                           use_autodiff: bool = False,
+                          fast_jac: bool = False,
                           pf_init: bool = False,
                           Sbus_pf: Union[CxVec, None] = None,
                           voltage_pf: Union[CxVec, None] = None,
@@ -521,9 +524,10 @@ def ac_optimal_power_flow(nc: NumericalCircuit,
     :param opf_options: OptimalPowerFlowOptions
     :param debug: if true, the jacobians, hessians, etc are checked against finite difeerence versions of them
     :param use_autodiff: use the autodiff version of the structures
+    :param fast_jac: build the power injection derivatives with the numba kernel over the Ybus CSC structure
     :param pf_init: Initialize with power flow
-    :param Sbus_pf: Sbus initial solution
-    :param voltage_pf: Voltage initial solution
+    :param Sbus_pf: Sbus initial solution (if None and pf_init, a power flow is run)
+    :param voltage_pf: Voltage initial solution (if None and pf_init, a power flow is run)
     :param plot_error: Plot the error evolution. Default: False
     :param optimize_nodal_capacity:
     :param nodal_capacity_sign:
@@ -667,6 +671,12 @@ def ac_optimal_power_flow(nc: NumericalCircuit,
     # ignore power from Z and I of the load
 
     if pf_init:
+        if Sbus_pf is None or voltage_pf is None:
+            # no initial solution was passed: run a power flow to start from it
+            pf_results = multi_island_pf_nc(nc=nc, options=pf_options, logger=logger)
+            Sbus_pf = pf_results.Sbus
+            voltage_pf = pf_results.voltage
+
         gen_in_bus = np.zeros(nbus)
         for bus in range(nc.generator_data.C_bus_elm.shape[0]):
             gen_in_bus[bus] = np.sum(nc.generator_data.C_bus_elm[bus])
@@ -728,7 +738,8 @@ def ac_optimal_power_flow(nc: NumericalCircuit,
                                        verbose=opf_options.verbose,
                                        max_iter=opf_options.ips_iterations,
                                        tol=opf_options.ips_tolerance,
-                                       trust=opf_options.ips_trust_radius)
+                                       trust=opf_options.ips_trust_radius,
+                                       linear_solver=opf_options.ips_linear_solver)
 
     else:
         if use_autodiff:
@@ -744,7 +755,8 @@ def ac_optimal_power_flow(nc: NumericalCircuit,
                                            verbose=opf_options.verbose,
                                            max_iter=opf_options.ips_iterations,
                                            tol=opf_options.ips_tolerance,
-                                           trust=opf_options.ips_trust_radius)
+                                           trust=opf_options.ips_trust_radius,
+                                           linear_solver=opf_options.ips_linear_solver)
         else:
             # run the solver with the analytic derivatives
             result, times = interior_point_solver(x0=x0, n_x=NV, n_eq=NE, n_ineq=NI,
@@ -761,11 +773,12 @@ def ac_optimal_power_flow(nc: NumericalCircuit,
                                                       br_mon_idx,
                                                       n_br_mon, gen_disp_idx, gen_nondisp_idx, Sg_undis,
                                                       pf_options.control_Q,
-                                                      opf_options.acopf_mode),
+                                                      opf_options.acopf_mode, fast_jac),
                                                   verbose=opf_options.verbose,
                                                   max_iter=opf_options.ips_iterations,
                                                   tol=opf_options.ips_tolerance,
-                                                  trust=opf_options.ips_trust_radius)
+                                                  trust=opf_options.ips_trust_radius,
+                                                  linear_solver=opf_options.ips_linear_solver)
 
     # convert the solution to the problem variables
     (Va, Vm, Pg_dis, Qg_dis, sl_sf, sl_st,
@@ -13,6 +13,7 @@ from GridCalEngine.Utils.Sparse.csc import diags
 from typing import Tuple
 from GridCalEngine.basic_structures import Vec, CxVec, IntVec, csr_matrix, csc_matrix
 from GridCalEngine.enumerations import AcOpfMode
+from GridCalEngine.Simulations.Derivatives.csc_derivatives import dSbus_dV_numba_sparse_csc
 
 
 def x2var(x: Vec,
@@ -639,7 +640,7 @@ def jacobians_and_hessians(x: Vec, c1: Vec, c2: Vec, c_s: Vec, c_v: Vec, Cg: csc
                            pv: IntVec, tanmax: Vec, alltapm: Vec, alltapt: Vec, F_hvdc: IntVec, T_hvdc: IntVec,
                            k_m: IntVec, k_tau: IntVec, mu, lmbda, R: Vec, X: Vec, F: IntVec, T: IntVec,
                            ctQ: bool, acopf_mode: AcOpfMode, compute_jac: bool,
-                           compute_hess: bool) -> Tuple[Vec, csc, csc, csc, csc, csc, Vec]:
+                           compute_hess: bool, fast_jac: bool = False) -> Tuple[Vec, csc, csc, csc, csc, csc, Vec]:
     """
     Calculates the jacobians and hessians of the objective function and the equality and inequality constraints
     at the current state given by x
@@ -680,6 +681,7 @@ def jacobians_and_hessians(x: Vec, c1: Vec, c2: Vec, c_s: Vec, c_v: Vec, Cg: csc
     :param acopf_mode: AcOpfMode
     :param compute_jac: Boolean that indicates if the Jacobians have to be calculated
     :param compute_hess: Boolean that indicates if the Hessians have to be calculated
+    :param fast_jac: compute the power injection derivatives with the numba kernel over the Ybus CSC structure
     :return: Jacobians and hessians matrices for the objective function and the equality and inequality constraints
     """
     Mm, N = Yf.shape
@@ -778,8 +780,15 @@ def jacobians_and_hessians(x: Vec, c1: Vec, c2: Vec, c_s: Vec, c_v: Vec, Cg: csc
 
         Vva = 1j * Vmat
 
-        GSvm = Vmat @ (IbusCJmat + np.conj(Ybus) @ np.conj(Vmat)) @ vm_inv  # N x N matrix
-        GSva = Vva @ (IbusCJmat - np.conj(Ybus) @ np.conj(Vmat))
+        if fast_jac:
+            # single pass over the Ybus structure: the derivatives share the sparsity pattern of Ybus
+            Ybus_csc = Ybus.tocsc()
+            GSvm_x, GSva_x = dSbus_dV_numba_sparse_csc(Ybus_csc.data, Ybus_csc.indptr, Ybus_csc.indices, V, vm)
+            GSvm = csc((GSvm_x, Ybus_csc.indices, Ybus_csc.indptr), shape=Ybus_csc.shape)  # N x N matrix
+            GSva = csc((GSva_x, Ybus_csc.indices, Ybus_csc.indptr), shape=Ybus_csc.shape)
+        else:
+            GSvm = Vmat @ (IbusCJmat + np.conj(Ybus) @ np.conj(Vmat)) @ vm_inv  # N x N matrix
+            GSva = Vva @ (IbusCJmat - np.conj(Ybus) @ np.conj(Vmat))
         GSpg = -Cg[:, ig]
         GSqg = -1j * Cg[:, ig]
 
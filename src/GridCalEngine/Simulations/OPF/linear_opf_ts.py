@@ -1179,37 +1179,36 @@ def add_linear_branches_contingencies_formulation(t_idx: int,
     f_obj = 0.0
     for c, contingency in enumerate(linear_multicontingencies.multi_contingencies):
 
-        # compute the contingency flow (Lp expression)
-        contingency_flows = contingency.get_lp_contingency_flows(base_flow=branch_vars.flows[t_idx, :],
-                                                                 injections=bus_vars.Pcalc[t_idx, :])
-
-        for m, contingency_flow in enumerate(contingency_flows):
-
-            if isinstance(contingency_flow, LpExp):  # if the contingency is not 0
-
-                # declare slack variables
-                pos_slack = prob.add_var(0, 1e20, join("br_cst_flow_pos_sl_", [t_idx, m, c]))
-                neg_slack = prob.add_var(0, 1e20, join("br_cst_flow_neg_sl_", [t_idx, m, c]))
-
-                # register the contingency data to evaluate the result at the end
-                branch_vars.add_contingency_flow(t=t_idx, m=m, c=c,
-                                                 flow_var=contingency_flow,
-                                                 neg_slack=neg_slack,
-                                                 pos_slack=pos_slack)
-
-                # add upper rate constraint
-                prob.add_cst(
-                    cst=contingency_flow + pos_slack - neg_slack <= branch_data_t.rates[m] / Sbase,
-                    name=join("br_cst_flow_upper_lim_", [t_idx, m, c])
-                )
+        # compute the contingency flow (Lp expression) of the active branches and the sensitive ones
+        mon_idx, contingency_flows = contingency.get_lp_contingency_flows(base_flow=branch_vars.flows[t_idx, :],
+                                                                          injections=bus_vars.Pcalc[t_idx, :],
+                                                                          active=branch_data_t.active)
+
+        for m, contingency_flow in zip(mon_idx, contingency_flows):
+
+            # declare slack variables
+            pos_slack = prob.add_var(0, 1e20, join("br_cst_flow_pos_sl_", [t_idx, m, c]))
+            neg_slack = prob.add_var(0, 1e20, join("br_cst_flow_neg_sl_", [t_idx, m, c]))
+
+            # register the contingency data to evaluate the result at the end
+            branch_vars.add_contingency_flow(t=t_idx, m=m, c=c,
+                                             flow_var=contingency_flow,
+                                             neg_slack=neg_slack,
+                                             pos_slack=pos_slack)
+
+            # add upper rate constraint
+            prob.add_cst(
+                cst=contingency_flow + pos_slack - neg_slack <= branch_data_t.rates[m] / Sbase,
+                name=join("br_cst_flow_upper_lim_", [t_idx, m, c])
+            )
 
-                # add lower rate constraint
-                prob.add_cst(
-                    cst=contingency_flow + pos_slack - neg_slack >= -branch_data_t.rates[m] / Sbase,
-                    name=join("br_cst_flow_lower_lim_", [t_idx, m, c])
-                )
+            # add lower rate constraint
+            prob.add_cst(
+                cst=contingency_flow + pos_slack - neg_slack >= -branch_data_t.rates[m] / Sbase,
+                name=join("br_cst_flow_lower_lim_", [t_idx, m, c])
+            )
 
-                f_obj += pos_slack + neg_slack
+            f_obj += pos_slack + neg_slack
 
     return f_obj
 
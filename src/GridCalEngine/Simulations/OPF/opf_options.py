@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import List, Union
 from GridCalEngine.enumerations import (SolverType, MIPSolvers, ZonalGrouping, TimeGrouping, AcOpfMode, DeviceType,
-                                        SubObjectType)
+                                        SubObjectType, SparseSolver)
 from GridCalEngine.Simulations.PowerFlow.power_flow_options import PowerFlowOptions
 from GridCalEngine.Devices.Aggregation.contingency_group import ContingencyGroup
 from GridCalEngine.Devices.Aggregation.inter_aggregation_info import InterAggregationInfo
@@ -39,6 +39,7 @@ class OptimalPowerFlowOptions(OptionsTemplate):
                  ips_iterations: int = 100,
                  ips_trust_radius: float = 1.0,
                  ips_init_with_pf: bool = False,
+                 ips_linear_solver: SparseSolver = SparseSolver.Pardiso,
                  acopf_mode: AcOpfMode = AcOpfMode.ACOPFstd,
                  robust: bool = False,):
         """
@@ -63,6 +64,7 @@ class OptimalPowerFlowOptions(OptionsTemplate):
         :param ips_iterations:
         :param ips_trust_radius:
         :param ips_init_with_pf:
+        :param ips_linear_solver: sparse solver for the KKT system (SuperLU is used if the chosen one is not installed)
         :param acopf_mode:
         """
         OptionsTemplate.__init__(self, name="Optimal power flow options")
@@ -111,6 +113,7 @@ class OptimalPowerFlowOptions(OptionsTemplate):
         self.ips_iterations = ips_iterations
         self.ips_trust_radius = ips_trust_radius
         self.ips_init_with_pf = ips_init_with_pf
+        self.ips_linear_solver: SparseSolver = ips_linear_solver
 
         self.register(key="verbose", tpe=int)
         self.register(key="solver", tpe=SolverType)
@@ -134,4 +137,5 @@ class OptimalPowerFlowOptions(OptionsTemplate):
         self.register(key="ips_iterations", tpe=int)
         self.register(key="ips_trust_radius", tpe=float)
         self.register(key="ips_init_with_pf", tpe=bool)
+        self.register(key="ips_linear_solver", tpe=SparseSolver)
         self.register(key="robust", tpe=bool)
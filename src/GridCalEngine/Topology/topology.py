@@ -3,7 +3,9 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # SPDX-License-Identifier: MPL-2.0
 
-from typing import List, Dict, Union, Tuple
+from __future__ import annotations
+
+from typing import List, Dict, Union, Tuple, Set
 import numpy as np
 import numba as nb
 import scipy.sparse as sp
@@ -255,6 +257,33 @@ def get_csr_bus_indices(C: csr_matrix) -> IntVec:
     return arr
 
 
+def get_inter_areas(F: IntVec, T: IntVec,
+                    bus_idx_from: IntVec | Set[int],
+                    bus_idx_to: IntVec | Set[int]) -> List[Tuple[int, float]]:
+    """
+    Get the elements that join two areas
+    :param F: Array of element bus from indices
+    :param T: Array of element bus to indices
+    :param bus_idx_from: bus indices of the area from
+    :param bus_idx_to: bus indices of the area to
+    :return: List of (element index, flow sense w.r.t the area exchange)
+    """
+    if isinstance(bus_idx_from, (set, frozenset)):
+        bus_idx_from = np.fromiter(bus_idx_from, dtype=int, count=len(bus_idx_from))
+
+    if isinstance(bus_idx_to, (set, frozenset)):
+        bus_idx_to = np.fromiter(bus_idx_to, dtype=int, count=len(bus_idx_to))
+
+    # the elements going from the area "from" to the area "to" and vice versa
+    forward = np.isin(F, bus_idx_from) & np.isin(T, bus_idx_to)
+    backward = np.isin(F, bus_idx_to) & np.isin(T, bus_idx_from)
+
+    idx = np.flatnonzero(forward | backward)
+    sense = np.where(forward[idx], 1.0, -1.0)
+
+    return list(zip(idx.tolist(), sense.tolist()))
+
+
 class ConnectivityMatrices:
     """
     Connectivity matrices
@@ -9,7 +9,11 @@ so that in the future it can be exchanged with some
 other solver interface easily
 """
 
-from typing import List, Union, Tuple, Iterable
+from __future__ import annotations
+
+from typing import List, Union, Tuple, Iterable, Callable
+import numpy as np
+import scipy.sparse as sp
 import ortools.linear_solver.pywraplp as ort
 from ortools.linear_solver.python import model_builder
 from ortools.linear_solver.python.model_builder import BoundedLinearExpression as LpCstBounded
@@ -19,7 +23,7 @@ from ortools.linear_solver.python.model_builder import Variable as LpVar
 from ortools.linear_solver.python.model_builder import _Sum as LpSum
 # from ortools.init.python import init
 from GridCalEngine.enumerations import MIPSolvers
-from GridCalEngine.basic_structures import Logger
+from GridCalEngine.basic_structures import Logger, Vec, IntVec, ObjVec
 
 
 # this avoids displaying all the solver logger information, should only be called once
@@ -60,7 +64,15 @@ class LpModel:
     INFINITY = 1e20
     originally_infeasible = False
 
-    def __init__(self, solver_type: MIPSolvers):
+    def __init__(self, solver_type: MIPSolvers, emit_names: bool = True):
+        """
+        LpModel constructor
+        :param solver_type: MIP solver to use
+        :param emit_names: If false, the formulations may skip naming the variables and constraints
+        """
+        self.emit_names: bool = emit_names
+
+        self.solver_type: MIPSolvers = solver_type
 
         # self.model: ort.Solver = ort.Solver.CreateSolver(solver_type.value)
 
@@ -112,13 +124,38 @@ class LpModel:
         :param name: name (optional)
         :return: LpVar
         """
-        if name in self._var_names:
-            raise Exception(f'Variable name already defined: {name}')
-        else:
-            self._var_names.add(name)
+        if name:
+            if name in self._var_names:
+                raise Exception(f'Variable name already defined: {name}')
+            else:
+                self._var_names.add(name)
 
         return self.model.new_var(lb=lb, ub=ub, is_integer=False, name=name)
 
+    def add_var_array(self, lb: Vec, ub: Vec, name_prefix: str = "", idx: IntVec | None = None,
+                      name_suffix: str = "") -> ObjVec:
+        """
+        Make an array of floating point LP vars at once
+        :param lb: array of lower bounds
+        :param ub: array of upper bounds
+        :param name_prefix: name prefix, each var is named as name_prefix + index + name_suffix,
+                            if empty, the vars are created without names (optional)
+        :param idx: array of indices used to name the vars, by default 0...n-1 (optional)
+        :param name_suffix: name suffix (optional)
+        :return: array of LpVar
+        """
+        n = len(lb)
+        arr = np.empty(n, dtype=object)
+
+        if name_prefix:
+            if idx is None:
+                idx = range(n)
+
+            arr[:] = [self.add_var(lb=l, ub=u, name=f"{name_prefix}{i}{name_suffix}") for i, l, u in zip(idx, lb, ub)]
+        else:
+            arr[:] = [self.add_var(lb=l, ub=u) for l, u in zip(lb, ub)]
+        return arr
+
     def add_cst(self, cst: Union[LpCstBounded, LpExp, bool], name: str = "") -> Union[LpCst, int]:
         """
         Add constraint to the model
@@ -126,10 +163,11 @@ class LpModel:
         :param name: name of the constraint (optional)
         :return: Constraint object
         """
-        if name in self._var_names:
-            raise Exception(f'Constraint name already defined: {name}')
-        else:
-            self._var_names.add(name)
+        if name:
+            if name in self._var_names:
+                raise Exception(f'Constraint name already defined: {name}')
+            else:
+                self._var_names.add(name)
 
         if isinstance(cst, bool):
             return 0
@@ -145,6 +183,72 @@ class LpModel:
         """
         return sum(cst)
 
+    @staticmethod
+    def dot(coefficients: Vec, variables: ObjVec) -> LpExp:
+        """
+        Build the expression sum(coefficients[i] * variables[i]) at once
+        :param coefficients: array of numeric coefficients
+        :param variables: array of LP variables (LP expressions or numbers are also accepted)
+        :return: LpExp
+        """
+        return LpExp.weighted_sum(list(variables), [float(c) for c in coefficients])
+
+    def add_linear_cst(self, coefficients: Vec, variables: ObjVec, sense: str,
+                       rhs: Union[float, LpExp] = 0.0, name: str = "") -> LpCst:
+        """
+        Add the constraint sum(coefficients[i] * variables[i]) (sense) rhs
+        :param coefficients: array of numeric coefficients
+        :param variables: array of LP variables (LP expressions or numbers are also accepted)
+        :param sense: constraint sense, one of "==", "<=", ">="
+        :param rhs: right hand side (number or LP expression)
+        :param name: name of the constraint (optional)
+        :return: Constraint object
+        """
+        expr = self.dot(coefficients, variables)
+
+        if sense == "==":
+            cst = expr == rhs
+        elif sense == "<=":
+            cst = expr <= rhs
+        elif sense == ">=":
+            cst = expr >= rhs
+        else:
+            raise Exception(f"Unknown constraint sense {sense}")
+
+        if name:
+            return self.add_cst(cst=cst, name=name)
+        else:
+            # unnamed constraints do not go through the names registry
+            return self.model.add(ct=cst)
+
+    def add_matrix_constraints(self, A: sp.csr_matrix, x: ObjVec, sense: str, rhs: Union[Vec, ObjVec],
+                               name_prefix: str = "") -> ObjVec:
+        """
+        Add the constraints A·x (sense) rhs at once
+        :param A: CSR sparse matrix of coefficients
+        :param x: array of LP variables (LP expressions or numbers are also accepted)
+        :param sense: constraint sense, one of "==", "<=", ">="
+        :param rhs: array of right hand side values (numbers or LP expressions)
+        :param name_prefix: name prefix, each constraint is named as name_prefix + row index,
+                            if empty, the constraints get generic names (optional)
+        :return: array of constraints
+        """
+        if A.format != 'csr':
+            raise Exception("add_matrix_constraints: Sparse matrix must be in CSR format")
+
+        n_rows = A.shape[0]
+        csts = np.empty(n_rows, dtype=object)
+        for k in range(n_rows):
+            a = A.indptr[k]
+            b = A.indptr[k + 1]
+            csts[k] = self.add_linear_cst(coefficients=A.data[a:b],
+                                          variables=x[A.indices[a:b]],
+                                          sense=sense,
+                                          rhs=rhs[k],
+                                          name=f"{name_prefix}{k}" if name_prefix else "")
+
+        return csts
+
     def minimize(self, obj_function: Union[LpExp, LpSum]) -> None:
         """
         Set the objective function with minimization sense
@@ -170,12 +274,46 @@ class LpModel:
             raise Exception('Unsupported file format')
         return mdl
 
-    def solve(self, robust=True) -> int:
+    def set_solver_options(self, show_logs: bool = False,
+                           mip_rel_gap: float | None = None,
+                           time_limit: float | None = None):
+        """
+        Pass the generic solving options to the solver
+        :param show_logs: display the solver logs
+        :param mip_rel_gap: relative gap at which the solver may stop, None for the solver default (optional)
+        :param time_limit: maximum solving time in seconds, None for no limit (optional)
+        """
+        self.solver.enable_output(show_logs)
+
+        if time_limit is not None:
+            self.solver.set_time_limit_in_seconds(time_limit)
+
+        if mip_rel_gap is not None:
+            # the relative gap is not a generic option of the model builder
+            if self.solver_type == MIPSolvers.SCIP:
+                self.solver.set_solver_specific_parameters(f"limits/gap = {mip_rel_gap}")
+            else:
+                self.logger.add_warning("The MIP relative gap is not supported by this solver interface",
+                                        device=self.solver_type.value,
+                                        value=mip_rel_gap)
+
+    def solve(self, robust: bool = True, show_logs: bool = False,
+              progress_text: Callable[[str], None] | None = None,
+              mip_rel_gap: float | None = None,
+              time_limit: float | None = None) -> int:
         """
         Solve the model
         :param robust: Relax the problem if infeasible
+        :param show_logs: display the solver logs
+        :param progress_text: progress function pointer
+        :param mip_rel_gap: relative gap at which the solver may stop, None for the solver default (optional)
+        :param time_limit: maximum solving time in seconds, None for no limit (optional)
         :return: integer value matching OPTIMAL or not
         """
+        if progress_text is not None:
+            progress_text(f"Solving model with {self.solver_type.value}...")
+
+        self.set_solver_options(show_logs=show_logs, mip_rel_gap=mip_rel_gap, time_limit=time_limit)
 
         print("SOLVING ORIGINAL MODEL ------------------------------")
         # original_mdl = self.model
@@ -12,13 +12,15 @@ from __future__ import annotations
 
 from typing import List, Union, Callable
 import subprocess
+import numpy as np
+import scipy.sparse as sp
 import GridCalEngine.Utils.ThirdParty.pulp as pulp
 from GridCalEngine.Utils.ThirdParty.pulp import HiGHS, CPLEX_CMD
 from GridCalEngine.Utils.ThirdParty.pulp.model.lp_objects import LpAffineExpression as LpExp
 from GridCalEngine.Utils.ThirdParty.pulp.model.lp_objects import LpConstraint as LpCst
 from GridCalEngine.Utils.ThirdParty.pulp.model.lp_objects import LpVariable as LpVar
 from GridCalEngine.enumerations import MIPSolvers
-from GridCalEngine.basic_structures import Logger
+from GridCalEngine.basic_structures import Logger, Vec, IntVec, ObjVec
 
 
 def get_lp_var_value(x: Union[float, LpVar]) -> float:
@@ -80,10 +82,17 @@ class LpModel:
     INFINITY = 1e20
     originally_infeasible = False
 
-    def __init__(self, solver_type: MIPSolvers):
-
+    def __init__(self, solver_type: MIPSolvers, emit_names: bool = True):
+        """
+        LpModel constructor
+        :param solver_type: MIP solver to use
+        :param emit_names: If false, the formulations may skip naming the variables and constraints
+                           (the solver interface assigns generic names)
+        """
         self.solver_type: MIPSolvers = solver_type
 
+        self.emit_names: bool = emit_names
+
         self.model = pulp.LpProblem("myProblem", pulp.LpMinimize)
 
         self.relaxed_slacks = list()
@@ -93,11 +102,24 @@ class LpModel:
         if self.model is None:
             raise Exception("{} is not present".format(solver_type.value))
 
+    def name_unnamed_vars(self) -> None:
+        """
+        Give generic unique names (_X<n>) to the variables created without a name (see emit_names),
+        this is needed to write the LP / MPS files
+        """
+        if not self.emit_names:
+            for i, var in enumerate(self.model.variables()):
+                if not var.name:
+                    var.name = f"_X{i}"
+
     def save_model(self, file_name: str = "ntc_opf_problem.lp") -> None:
         """
         Save problem in LP format
         :param file_name: name of the file (.lp or .mps supported)
         """
+        # the files require unique variable names
+        self.name_unnamed_vars()
+
         # save the problem in LP format to debug
         if file_name.lower().endswith('.lp'):
             lp_content = self.model.writeLP(filename=file_name)
@@ -133,6 +155,35 @@ class LpModel:
         self.model.addVariable(var)
         return var
 
+    def add_var_array(self, lb: Vec, ub: Vec, name_prefix: str = "", idx: IntVec | None = None,
+                      name_suffix: str = "") -> ObjVec:
+        """
+        Make an array of floating point LP vars at once
+        :param lb: array of lower bounds
+        :param ub: array of upper bounds
+        :param name_prefix: name prefix, each var is named as name_prefix + index + name_suffix,
+                            if empty, the vars are created without names (optional)
+        :param idx: array of indices used to name the vars, by default 0...n-1 (optional)
+        :param name_suffix: name suffix (optional)
+        :return: array of LpVar
+        """
+        n = len(lb)
+        arr = np.empty(n, dtype=object)
+
+        if name_prefix:
+            if idx is None:
+                idx = range(n)
+
+            arr[:] = [pulp.LpVariable(name=f"{name_prefix}{i}{name_suffix}", lowBound=l, upBound=u,
+                                      cat=pulp.LpContinuous)
+                      for i, l, u in zip(idx, lb, ub)]
+        else:
+            arr[:] = [pulp.LpVariable(name="", lowBound=l, upBound=u, cat=pulp.LpContinuous)
+                      for l, u in zip(lb, ub)]
+
+        self.model.addVariables(arr)
+        return arr
+
     def add_cst(self, cst: LpCst | bool, name: str = "") -> Union[LpCst, int]:
         """
         Add constraint to the model
@@ -154,6 +205,87 @@ class LpModel:
         """
         return pulp.lpSum(cst)
 
+    @staticmethod
+    def dot(coefficients: Vec, variables: ObjVec) -> LpExp:
+        """
+        Build the expression sum(coefficients[i] * variables[i]) at once
+        :param coefficients: array of numeric coefficients
+        :param variables: array of LP variables (LP expressions or numbers are also accepted)
+        :return: LpExp
+        """
+        expr = LpExp()
+        for coef, var in zip(coefficients, variables):
+            if isinstance(var, LpVar):
+                expr.addterm(var, coef)
+            else:
+                expr.addInPlace(var * coef)
+        return expr
+
+    @staticmethod
+    def _get_sense(sense: str) -> int:
+        """
+        Translate the constraint sense to the pulp constant
+        :param sense: constraint sense, one of "==", "<=", ">="
+        :return: pulp sense constant
+        """
+        if sense == "==":
+            return pulp.LpConstraintEQ
+        elif sense == "<=":
+            return pulp.LpConstraintLE
+        elif sense == ">=":
+            return pulp.LpConstraintGE
+        else:
+            raise Exception(f"Unknown constraint sense {sense}")
+
+    def add_linear_cst(self, coefficients: Vec, variables: ObjVec, sense: str,
+                       rhs: Union[float, LpExp] = 0.0, name: str = "") -> LpCst:
+        """
+        Add the constraint sum(coefficients[i] * variables[i]) (sense) rhs
+        The constraint object is filled directly with the terms, no intermediate expressions are created
+        :param coefficients: array of numeric coefficients
+        :param variables: array of LP variables (LP expressions or numbers are also accepted)
+        :param sense: constraint sense, one of "==", "<=", ">="
+        :param rhs: right hand side (number or LP expression)
+        :param name: name of the constraint (optional)
+        :return: Constraint object
+        """
+        cst = LpCst(sense=self._get_sense(sense))
+        for coef, var in zip(coefficients, variables):
+            if isinstance(var, LpVar):
+                cst.addterm(var, coef)
+            else:
+                cst.addInPlace(var, sign=coef)
+        cst.addInPlace(rhs, sign=-1)
+        return self.model.addConstraint(constraint=cst, name=name)
+
+    def add_matrix_constraints(self, A: sp.csr_matrix, x: ObjVec, sense: str, rhs: Union[Vec, ObjVec],
+                               name_prefix: str = "") -> ObjVec:
+        """
+        Add the constraints A·x (sense) rhs at once
+        :param A: CSR sparse matrix of coefficients
+        :param x: array of LP variables (LP expressions or numbers are also accepted)
+        :param sense: constraint sense, one of "==", "<=", ">="
+        :param rhs: array of right hand side values (numbers or LP expressions)
+        :param name_prefix: name prefix, each constraint is named as name_prefix + row index,
+                            if empty, the constraints get generic names (optional)
+        :return: array of constraints
+        """
+        if A.format != 'csr':
+            raise Exception("add_matrix_constraints: Sparse matrix must be in CSR format")
+
+        n_rows = A.shape[0]
+        csts = np.empty(n_rows, dtype=object)
+        for k in range(n_rows):
+            a = A.indptr[k]
+            b = A.indptr[k + 1]
+            csts[k] = self.add_linear_cst(coefficients=A.data[a:b],
+                                          variables=x[A.indices[a:b]],
+                                          sense=sense,
+                                          rhs=rhs[k],
+                                          name=f"{name_prefix}{k}" if name_prefix else "")
+
+        return csts
+
     def minimize(self, obj_function: LpExp):
         """
         Set the objective function with minimization sense
@@ -161,54 +293,66 @@ class LpModel:
         """
         self.model.setObjective(obj=obj_function)
 
-    def get_solver(self, show_logs: bool = False):
+    def get_solver(self, show_logs: bool = False, mip_rel_gap: float | None = None, time_limit: float | None = None):
         """
 
         :param show_logs:
+        :param mip_rel_gap: relative gap at which the solver may stop (optional)
+        :param time_limit: maximum solving time in seconds (optional)
         :return:
         """
         if self.solver_type == MIPSolvers.HIGHS:
-            return HiGHS(mip=self.model.isMIP(), msg=show_logs)
+            return HiGHS(mip=self.model.isMIP(), msg=show_logs, gapRel=mip_rel_gap, timeLimit=time_limit)
 
         elif self.solver_type == MIPSolvers.SCIP:
-            return pulp.getSolver('SCIP_CMD')
+            return pulp.getSolver('SCIP_CMD', gapRel=mip_rel_gap, timeLimit=time_limit)
 
         elif self.solver_type == MIPSolvers.CPLEX:
-            return CPLEX_CMD(mip=self.model.isMIP(), msg=show_logs)
+            return CPLEX_CMD(mip=self.model.isMIP(), msg=show_logs, gapRel=mip_rel_gap, timeLimit=time_limit)
 
         elif self.solver_type == MIPSolvers.GUROBI:
-            return pulp.getSolver('GUROBI')
+            return pulp.getSolver('GUROBI', gapRel=mip_rel_gap, timeLimit=time_limit)
 
         elif self.solver_type == MIPSolvers.XPRESS:
-            return pulp.getSolver('XPRESS')
+            return pulp.getSolver('XPRESS', gapRel=mip_rel_gap, timeLimit=time_limit)
 
         else:
             raise Exception('PuLP Unsupported MIP solver ' + self.solver_type.value)
 
     def solve(self, robust: bool = False, show_logs: bool = False,
-              progress_text: Callable[[str], None] | None = None) -> int:
+              progress_text: Callable[[str], None] | None = None,
+              mip_rel_gap: float | None = None,
+              time_limit: float | None = None) -> int:
         """
         Solve the model
         :param robust: In this interface, this is useless
         :param show_logs: In this interface, this is useless
         :param progress_text: progress function pointer
+        :param mip_rel_gap: relative gap at which the solver may stop, None for the solver default (optional)
+        :param time_limit: maximum solving time in seconds, None for no limit (optional)
         :return:
         """
         if progress_text is not None:
             progress_text(f"Solving model with {self.solver_type.value}...")
 
+        if self.solver_type != MIPSolvers.HIGHS:
+            # the other solvers may go through the LP / MPS files
+            self.name_unnamed_vars()
+
         # solve the model
         try:
-            status = self.model.solve(solver=self.get_solver(show_logs=show_logs))
+            status = self.model.solve(solver=self.get_solver(show_logs=show_logs, mip_rel_gap=mip_rel_gap, time_limit=time_limit))
         except pulp.PulpSolverError as e:
             self.logger.add_error(msg=str(e), )
             # Retry with Highs
-            status = self.model.solve(solver=HiGHS(mip=self.model.isMIP(), msg=show_logs))
+            status = self.model.solve(solver=HiGHS(mip=self.model.isMIP(), msg=show_logs,
+                                                  gapRel=mip_rel_gap, timeLimit=time_limit))
 
         except subprocess.CalledProcessError as e:
             self.logger.add_error(msg=str(e), )
             # Retry with Highs
-            status = self.model.solve(solver=HiGHS(mip=self.model.isMIP(), msg=show_logs))
+            status = self.model.solve(solver=HiGHS(mip=self.model.isMIP(), msg=show_logs,
+                                                  gapRel=mip_rel_gap, timeLimit=time_limit))
 
         if status != self.OPTIMAL:
             self.originally_infeasible = True
@@ -257,7 +401,7 @@ class LpModel:
                     progress_text(f"Solving debug model with {self.solver_type.value}...")
 
                 # solve the debug model
-                status_d = debug_model.solve(solver=self.get_solver(show_logs=show_logs))
+                status_d = debug_model.solve(solver=self.get_solver(show_logs=show_logs, mip_rel_gap=mip_rel_gap, time_limit=time_limit))
 
                 # clear the relaxed slacks list
                 self.relaxed_slacks = list()
@@ -299,7 +443,7 @@ class LpModel:
                         progress_text(f"Solving relaxed model with {self.solver_type.value}...")
 
                     # solve the modified (original) model
-                    status = self.model.solve(solver=self.get_solver(show_logs=show_logs))
+                    status = self.model.solve(solver=self.get_solver(show_logs=show_logs, mip_rel_gap=mip_rel_gap, time_limit=time_limit))
 
                     if status == LpModel.OPTIMAL:
 
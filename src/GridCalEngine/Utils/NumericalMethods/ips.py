@@ -6,19 +6,16 @@ from typing import Callable, Any, Union, List, Dict, Tuple
 from dataclasses import dataclass
 import numba as nb
 import numpy as np
-import pandas as pd
 from scipy.sparse import csc_matrix as csc
 from scipy import sparse
+from scipy.sparse.linalg import splu
 import timeit
-from matplotlib import pyplot as plt
-from GridCalEngine.basic_structures import Vec, CxVec
-from GridCalEngine.Utils.Sparse.csc import pack_3_by_4, diags
-from GridCalEngine.Utils.NumericalMethods.sparse_solve import get_linear_solver
+from GridCalEngine.basic_structures import Vec, CxVec, IntVec
+from GridCalEngine.Utils.Sparse.csc import pack_3_by_4, pack_3_by_4_into, sp_scaled_ata
+from GridCalEngine.Utils.NumericalMethods.sparse_solve import get_linear_solver, available_sparse_solvers
 from GridCalEngine.enumerations import SparseSolver
 
-linear_solver = get_linear_solver(SparseSolver.Pardiso)
-
-
+@nb.njit(cache=True, fastmath=True, boundscheck=False)
 def step_calculation(v: Vec, dv: Vec, tau: float = 0.99995):
     """
     This function calculates for each Lambda multiplier or its associated Slack variable
@@ -28,16 +25,17 @@ def step_calculation(v: Vec, dv: Vec, tau: float = 0.99995):
     :param tau: Factor to be not exactly 1
     :return: step size value for the given multipliers
     """
-    k = np.flatnonzero(dv < 0.0)
-    if len(k) > 0:
-        alpha = min([tau * min(v[k] / (-dv[k] + 1e-15)), 1])
-    else:
-        alpha = 1
+    # single pass min-reduction; the entries with dv >= 0 do not limit the step
+    # the sentinel is finite (tau * alpha = 1) because fastmath assumes there are no infinities
+    alpha = 1.0 / tau
+    for i in range(len(v)):
+        cand = v[i] / (-dv[i] + 1e-15) if dv[i] < 0.0 else alpha
+        alpha = min(alpha, cand)
 
-    return alpha
+    return min(tau * alpha, 1.0)
 
 
-@nb.njit(cache=True)
+@nb.njit(cache=True, fastmath=True, boundscheck=False)
 def split(sol: Vec, n: int):
     """
     Split the solution vector in two
@@ -48,7 +46,7 @@ def split(sol: Vec, n: int):
     return sol[:n], sol[n:]
 
 
-@nb.njit(cache=True)
+@nb.njit(cache=True, fastmath=True, boundscheck=False)
 def calc_error(dx, dz, dmu, dlmbda):
     """
     Calculate the error of the process
@@ -59,16 +57,70 @@ def calc_error(dx, dz, dmu, dlmbda):
     :return: max abs value of all of the increments
     """
     err = 0.0
-
-    for arr in [dx, dz, dmu, dlmbda]:
-        for i in range(len(arr)):
-            v = abs(arr[i])
-            if v > err:
-                err = v
+    for i in range(len(dx)):
+        err = max(err, abs(dx[i]))
+    for i in range(len(dz)):
+        err = max(err, abs(dz[i]))
+    for i in range(len(dmu)):
+        err = max(err, abs(dmu[i]))
+    for i in range(len(dlmbda)):
+        err = max(err, abs(dlmbda[i]))
 
     return err
 
 
+@nb.njit(cache=True)
+def calc_convergence(G: Vec, H: Vec, x: Vec, z: Vec, lx: Vec, lam: Vec, mu: Vec,
+                     gamma: float, tol: float) -> Tuple[float, float, float, bool]:
+    """
+    Compute the convergence conditions of the interior point iteration with a single pass over each array
+    :param G: Equality values
+    :param H: Inequality values
+    :param x: State vector
+    :param z: Vector of z slack variables
+    :param lx: Gradient of the lagrangian
+    :param lam: Lambda multipliers
+    :param mu: Mu multipliers
+    :param gamma: barrier parameter
+    :param tol: convergence tolerance
+    :return: feasibility condition, gradient condition, error, converged
+    """
+    g_norm = 0.0
+    for i in range(len(G)):
+        g_norm = max(g_norm, abs(G[i]))
+
+    h_max = -np.inf
+    for i in range(len(H)):
+        h_max = max(h_max, H[i])
+
+    x_norm = 0.0
+    for i in range(len(x)):
+        x_norm = max(x_norm, abs(x[i]))
+
+    z_norm = 0.0
+    for i in range(len(z)):
+        z_norm = max(z_norm, abs(z[i]))
+
+    lx_norm = 0.0
+    for i in range(len(lx)):
+        lx_norm = max(lx_norm, abs(lx[i]))
+
+    lam_norm = 0.0
+    for i in range(len(lam)):
+        lam_norm = max(lam_norm, abs(lam[i]))
+
+    mu_norm = 0.0
+    for i in range(len(mu)):
+        mu_norm = max(mu_norm, abs(mu[i]))
+
+    feascond = max(g_norm, h_max) / (1.0 + max(x_norm, z_norm))
+    gradcond = lx_norm / (1.0 + max(lam_norm, mu_norm))
+    error = max(feascond, gradcond, gamma)
+    converged = feascond < tol and gradcond < tol and gamma < tol
+
+    return feascond, gradcond, error, converged
+
+
 @nb.njit(cache=True)
 def max_abs(x: Vec):
     """
@@ -128,6 +180,53 @@ def calc_ocond(f: float, f_prev: float):
     return abs(f - f_prev) / (1.0 + abs(f_prev))
 
 
+class KKTFactorizer:
+    """
+    Linear solver for the KKT system of the interior point iterations.
+    The KKT matrix keeps its dimensions (and mostly its sparsity pattern) along the iterations,
+    so the fill-reducing (COLAMD) column ordering computed by the first SuperLU factorization is stored
+    and reused in the following ones, which skip the ordering step. SuperLU offers no numeric-only
+    refactorization, so each of them is still a full LU (symbolic and numeric) of the permuted matrix.
+    Any other available sparse solver (i.e. Pardiso, KLU) can be requested instead;
+    if the requested solver is not installed, the SuperLU path is used.
+    """
+
+    def __init__(self, solver_type: SparseSolver = SparseSolver.Pardiso):
+        """
+        Constructor
+        :param solver_type: preferred SparseSolver
+        """
+        if solver_type != SparseSolver.SuperLU and solver_type in available_sparse_solvers:
+            self.linear_solver = get_linear_solver(solver_type)
+        else:
+            self.linear_solver = None
+
+        # inverse of the column permutation of the first factorization
+        self.perm: Union[IntVec, None] = None
+
+    def solve(self, jac: csc, r: Vec) -> Vec:
+        """
+        Solve jac x = r
+        :param jac: KKT matrix (CSC)
+        :param r: right hand side
+        :return: solution vector
+        """
+        if self.linear_solver is not None:
+            return self.linear_solver(jac, r)
+
+        if self.perm is None or len(self.perm) != jac.shape[1]:
+            # full analysis: COLAMD ordering + factorization
+            lu = splu(jac)
+            self.perm = np.argsort(lu.perm_c)
+            return lu.solve(r)
+
+        # full LU of the matrix permuted with the stored ordering (only the ordering step is skipped)
+        lu = splu(jac[:, self.perm].tocsc(), permc_spec='NATURAL')
+        x = np.empty(jac.shape[1])
+        x[self.perm] = lu.solve(r)
+        return x
+
+
 @dataclass
 class IpsFunctionReturn:
     """
@@ -213,6 +312,7 @@ class IpsSolution:
         """
         Plot the IPS error
         """
+        from matplotlib import pyplot as plt
         plt.figure()
         plt.plot(self.error_evolution, )
         plt.xlabel("Iterations")
@@ -221,6 +321,118 @@ class IpsSolution:
         plt.show()
 
 
+def interior_point_solver_eq_only(x0: Vec,
+                                  n_x: int,
+                                  n_eq: int,
+                                  func: Callable[[Vec, Vec, Vec, bool, bool, Any], IpsFunctionReturn],
+                                  arg=(),
+                                  max_iter=100,
+                                  tol=1e-6,
+                                  verbose: int = 0,
+                                  linear_solver: SparseSolver = SparseSolver.Pardiso) -> Tuple[IpsSolution, Vec]:
+    """
+    Solve a non-linear problem with only equality constraints:
+
+        min: f(x)
+        s.t.
+            G(x)  = 0
+
+    Without inequalities there are no slack variables, mu multipliers nor barrier parameter,
+    so this is a plain Newton iteration over the KKT conditions:
+
+        | fxx + Gxx | Gx' | | dx   |     | fx + Gx' lam |
+        | Gx        | 0   | | dlam | = - | G            |
+
+    :param x0: Initial solution
+    :param n_x: Number of variables (size of x)
+    :param n_eq: Number of equality constraints (rows of G)
+    :param func: A function pointer called with (x, mu, lmbda, *args) that returns (f, G, H, fx, Gx, Hx, fxx, Gxx, Hxx)
+    :param arg: Tuple of arguments to call func: func(x, mu, lmbda, *arg)
+    :param max_iter: Maximum number of iterations
+    :param tol: Convergence tolerance
+    :param verbose: 0 to 3 (the larger, the more verbose)
+    :param linear_solver: SparseSolver used for the KKT system
+    :return: IpsSolution
+    """
+    times = np.array([np.zeros(15)])
+    t_start = timeit.default_timer()
+
+    iter_counter = 0
+    x = x0.copy()
+    lam = np.zeros(n_eq)
+    mu = np.zeros(0)
+    z = np.zeros(0)
+    error_evolution = np.zeros(max_iter + 1)
+    kkt_solver = KKTFactorizer(solver_type=linear_solver)
+    jac = None
+    r = np.empty(n_x + n_eq)
+    dlam = None
+
+    ret, new_times_0 = func(x, mu, lam, True, True, *arg)
+    lx = ret.fx + ret.Gx.T @ lam
+    feascond, gradcond, error, converged = calc_convergence(G=ret.G, H=ret.H, x=x, z=z, lx=lx, lam=lam, mu=mu,
+                                                            gamma=0.0, tol=tol)
+    error_evolution[0] = error
+
+    while not converged and iter_counter < max_iter:
+        ts_iter = timeit.default_timer()
+
+        # compose the Jacobian
+        lxx = (ret.fxx + ret.Gxx).tocsc()
+        Gx_t = ret.Gx.T.tocsc()
+        Gx = ret.Gx.tocsc()
+        if jac is None or not pack_3_by_4_into(lxx, Gx_t, Gx, jac):
+            jac = pack_3_by_4(lxx, Gx_t, Gx)
+
+        # compose the residual
+        np.negative(lx, out=r[:n_x])
+        np.negative(ret.G, out=r[n_x:])
+
+        ts_nrstep = timeit.default_timer()
+        dx, dlam = split(kkt_solver.solve(jac, r), n_x)
+        te_nrstep = timeit.default_timer()
+
+        # full Newton step
+        x += dx
+        lam += dlam
+
+        ret, new_times_i = func(x, mu, lam, True, True, *arg)
+
+        ts_conds = timeit.default_timer()
+        lx = ret.fx + ret.Gx.T @ lam
+        feascond, gradcond, error, converged = calc_convergence(G=ret.G, H=ret.H, x=x, z=z, lx=lx, lam=lam, mu=mu,
+                                                                gamma=0.0, tol=tol)
+        te_conds = timeit.default_timer()
+
+        if verbose > 1:
+            print(f'Iteration: {iter_counter}', "-" * 80)
+            print("\tErr:", error)
+
+        iter_counter += 1
+        error_evolution[iter_counter] = error
+
+        te_iter = timeit.default_timer()
+        new_times = np.r_[new_times_i + new_times_0, te_nrstep - ts_nrstep, 0.0, 0.0, te_conds - ts_conds,
+                          te_iter - ts_iter]
+        new_times_0 = 0
+        times = np.r_[times, [new_times]]
+
+    t_end = timeit.default_timer()
+
+    if verbose > 0:
+        print(f'SOLUTION', "-" * 80)
+        print(f"\tx:", x)
+        print(f"\tλ:", lam)
+        print(f"\tF.obj: {ret.f * 1e4}")
+        print(f"\tErr: {error}")
+        print(f'\tIterations: {iter_counter}')
+        print(f'\tTime elapsed (s): {t_end - t_start}')
+        print(f'\tFeas cond: ', feascond)
+
+    return IpsSolution(x=x, error=error, gamma=0.0, lam=lam, dlam=dlam, mu=mu, z=z, residuals=lx, structs=ret,
+                       converged=converged, iterations=iter_counter, error_evolution=error_evolution), times
+
+
 def interior_point_solver(x0: Vec,
                           n_x: int,
                           n_eq: int,
@@ -232,7 +444,11 @@ def interior_point_solver(x0: Vec,
                           pf_init=False,
                           trust=0.9,
                           verbose: int = 0,
-                          step_control=False) -> Tuple[IpsSolution, Vec]:
+                          step_control=False,
+                          lam0: Union[Vec, None] = None,
+                          mu0: Union[Vec, None] = None,
+                          z0: Union[Vec, None] = None,
+                          linear_solver: SparseSolver = SparseSolver.Pardiso) -> Tuple[IpsSolution, Vec]:
     """
     Solve a non-linear problem of the form:
 
@@ -276,9 +492,19 @@ def interior_point_solver(x0: Vec,
     :param trust: Amount of trust in the initial Newton derivative length estimation
     :param verbose: 0 to 3 (the larger, the more verbose)
     :param step_control: Use step control to improve the solution process control
+    :param lam0: Initial lambda multipliers for a warm start (optional, i.e. IpsSolution.lam of a similar problem)
+    :param mu0: Initial mu multipliers for a warm start (optional, i.e. IpsSolution.mu of a similar problem)
+    :param z0: Initial slack variables for a warm start (optional, i.e. IpsSolution.z of a similar problem)
+    :param linear_solver: SparseSolver used for the KKT system (falls back to SuperLU if not installed)
     :return: IpsSolution
     """
 
+    if n_ineq == 0:
+        # without inequalities the barrier machinery is not needed (and gamma would be 0 / 0)
+        return interior_point_solver_eq_only(x0=x0, n_x=n_x, n_eq=n_eq, func=func, arg=arg,
+                                             max_iter=max_iter, tol=tol, verbose=verbose,
+                                             linear_solver=linear_solver)
+
     times = np.array([np.zeros(15)])
     t_start = timeit.default_timer()
 
@@ -294,31 +520,40 @@ def interior_point_solver(x0: Vec,
 
     # Our init, which computes the multipliers as a solution of the KKT conditions
     if pf_init:
-        z0 = 1.0
-        z = z0 * np.ones(n_ineq)
+        z_ini = 1.0
+        z = z_ini * np.ones(n_ineq)
         lam = np.ones(n_eq)
         mu = z.copy()
         ret = func(x, mu, lam, True, False, *arg)
         z = - ret.H
         z = np.array([1e-2 if zz < 1e-2 else zz for zz in z])
-        z_inv = diags(1.0 / z)
-        mu = gamma * (z_inv @ e)
-        mu_diag = diags(mu)
+        mu = gamma / z
         lam = sparse.linalg.lsqr(ret.Gx.T, -ret.fx - ret.Hx.T @ mu.T)[0]
 
     # PyPower init
     else:
         ret, _ = func(x, None, None, False, False, *arg)
-        z0 = 1.0
-        z = z0 * np.ones(n_ineq)
-        mu = z0 * np.ones(n_ineq)
+        z_ini = 1.0
+        z = z_ini * np.ones(n_ineq)
+        mu = z_ini * np.ones(n_ineq)
         lam = np.zeros(n_eq)
-        kk = np.flatnonzero(ret.H < -z0)
+        kk = np.flatnonzero(ret.H < -z_ini)
         z[kk] = -ret.H[kk]
-        z_inv = diags(1.0 / z)
-        kk = np.flatnonzero((gamma / z) > z0)
+        kk = np.flatnonzero((gamma / z) > z_ini)
         mu[kk] = gamma / z[kk]
-        mu_diag = diags(mu)
+
+    # warm start: reuse the multipliers and slacks of the solution of a similar problem
+    # (i.e. the previous time step of a time series), the ones with the wrong size are ignored.
+    # z and mu must remain strictly positive for the barrier method to work
+    if lam0 is not None and len(lam0) == n_eq:
+        lam = np.array(lam0, dtype=float)
+    if z0 is not None and len(z0) == n_ineq:
+        z = np.maximum(z0, tol)
+    if mu0 is not None and len(mu0) == n_ineq:
+        mu = np.maximum(mu0, tol)
+        if z0 is not None and len(z0) == n_ineq:
+            # start the barrier parameter from the complementarity gap of the previous solution
+            gamma = 0.1 * mu @ z / n_ineq
 
     ret, _ = func(x, mu, lam, True, False, *arg)
 
@@ -333,38 +568,64 @@ def interior_point_solver(x0: Vec,
     error_evolution[0] = error
     n = np.zeros(n_x + n_eq)
     dlam = None
+    kkt_solver = KKTFactorizer(solver_type=linear_solver)
+    jac = None
+    r = np.empty(n_x + n_eq)
+
+    # scratch buffers for the Newton steps
+    x_step = np.empty(n_x)
+    eq_step = np.empty(n_eq)
+    ineq_step = np.empty(n_ineq)
+    dmu = np.empty(n_ineq)
     while not converged and iter_counter < max_iter:
         ts_iter = timeit.default_timer()
         # Evaluate the functions, gradients and hessians at the current iteration.
+        # (the following iterations reuse Hx' and the lagrangian gradient computed in the convergence check)
         if iter_counter == 0:
             ret, new_times_0 = func(x, mu, lam, True, True, *arg)
+            Hx_t = ret.Hx.T
+            lx = ret.fx + ret.Gx.T @ lam + Hx_t @ mu
         else:
             new_times_0 = 0
-        Hx_t = ret.Hx.T
-        Gx_t = ret.Gx.T
+
+        # unpack the evaluated structures once, the loop body uses them as locals
+        G, H, Hx = ret.G, ret.H, ret.Hx
+        Gx = ret.Gx.tocsc()
+
         # compose the Jacobian
         lxx = ret.fxx + ret.Gxx + ret.Hxx
-        m = lxx + Hx_t @ z_inv @ mu_diag @ ret.Hx
-        jac = pack_3_by_4(m.tocsc(), Gx_t.tocsc(), ret.Gx.tocsc())
+        m = lxx + sp_scaled_ata(Hx, mu / z)
+        m = m.tocsc()
+        Gx_t = Gx.T.tocsc()
+        if jac is None or not pack_3_by_4_into(m, Gx_t, Gx, jac):
+            # the pattern changed (or first iteration): build the matrix again
+            jac = pack_3_by_4(m, Gx_t, Gx)
 
         # compose the residual
-        lx = ret.fx + Gx_t @ lam + Hx_t @ mu
-        n = lx + Hx_t @ z_inv @ (gamma * e + mu * ret.H)
-        r = - np.r_[n, ret.G]
+        n = lx + Hx_t @ ((gamma * e + mu * H) / z)
+        np.negative(n, out=r[:n_x])
+        np.negative(G, out=r[n_x:])
 
         # Find the reduced problem residuals and split them
         ts_nrstep = timeit.default_timer()
-        dx, dlam = split(linear_solver(jac, r), n_x)
+        dx, dlam = split(kkt_solver.solve(jac, r), n_x)
         te_nrstep = timeit.default_timer()
         # Calculate the inequalities residuals using the reduced problem residuals
 
         ts_mult = timeit.default_timer()
-        dz = - ret.H - z - ret.Hx @ dx
-        dmu = - mu + z_inv @ (gamma * e - mu * dz)
+        dz = Hx @ dx
+        dz += H
+        dz += z
+        np.negative(dz, out=dz)
+
+        np.multiply(mu, dz, out=dmu)
+        np.subtract(gamma, dmu, out=dmu)
+        dmu /= z
+        dmu -= mu
         te_mult = timeit.default_timer()
         # Step control as in PyPower
         if step_control:
-            l0 = ret.f + np.dot(lam, ret.G) + np.dot(mu, ret.H + z) - gamma * np.sum(np.log(z))
+            l0 = ret.f + np.dot(lam, G) + np.dot(mu, H + z) - gamma * np.sum(np.log(z))
             alpha = trust
             for j in range(20):
                 dx1 = alpha * dx
@@ -392,10 +653,14 @@ def interior_point_solver(x0: Vec,
         alpha_d = step_calculation(mu, dmu)
         te_steps = timeit.default_timer()
         # Update the values of the variables and multipliers
-        x += dx * alpha_p
-        z += dz * alpha_p
-        lam += dlam * alpha_d
-        mu += dmu * alpha_d
+        np.multiply(dx, alpha_p, out=x_step)
+        x += x_step
+        np.multiply(dz, alpha_p, out=ineq_step)
+        z += ineq_step
+        np.multiply(dlam, alpha_d, out=eq_step)
+        lam += eq_step
+        np.multiply(dmu, alpha_d, out=ineq_step)
+        mu += ineq_step
         gamma = 0.1 * mu @ z / n_ineq
 
         # Update fobj, g, h, calculate next step.
@@ -403,25 +668,17 @@ def interior_point_solver(x0: Vec,
 
         ts_conds = timeit.default_timer()
         Hx_t = ret.Hx.T
-        Gx_t = ret.Gx.T
-        g_norm = np.linalg.norm(ret.G, np.inf)
-        lam_norm = np.linalg.norm(lam, np.inf)
-        mu_norm = np.linalg.norm(mu, np.inf)
-        z_norm = np.linalg.norm(z, np.inf)
-
-        lx = ret.fx + Hx_t @ mu + Gx_t @ lam
-        feascond = max([g_norm, max(ret.H)]) / (1 + max([np.linalg.norm(x, np.inf), z_norm]))
-        gradcond = np.linalg.norm(lx, np.inf) / (1 + max([lam_norm, mu_norm]))
-        error = np.max([feascond, gradcond, gamma])
-        maxdispl = np.max(np.r_[dx, dlam, dz, dmu])
-        z_inv = diags(1.0 / z)
-        mu_diag = diags(mu)
+        lx = ret.fx + Hx_t @ mu + ret.Gx.T @ lam
+        feascond, gradcond, error, converged = calc_convergence(G=ret.G, H=ret.H, x=x, z=z, lx=lx, lam=lam, mu=mu,
+                                                                gamma=gamma, tol=tol)
+        if verbose > 0:
+            maxdispl = np.max(np.r_[dx, dlam, dz, dmu])
         te_conds = timeit.default_timer()
-        converged = feascond < tol and gradcond < tol and gamma < tol
 
         if verbose > 1:
             print(f'Iteration: {iter_counter}', "-" * 80)
             if verbose > 2:
+                import pandas as pd
                 x_df = pd.DataFrame(data={'x': x, 'dx': dx})
                 eq_df = pd.DataFrame(data={'λ': lam, 'dλ': dlam})
                 ineq_df = pd.DataFrame(data={'mu': mu, 'z': z, 'dmu': dmu, 'dz': dz})
@@ -297,6 +297,43 @@ def pack_3_by_4(A11: CscMat, A12: CscMat, A21: CscMat):
     return CscMat((Px, Pi, Pp), shape=(m, n))
 
 
+def pack_3_by_4_into(A11: CscMat, A12: CscMat, A21: CscMat, out: CscMat) -> bool:
+    """
+    Refill, without reallocating, a matrix previously built with pack_3_by_4
+    | A11 | A12 |
+    | A21 | 0   |
+    :param A11: Upper left matrix
+    :param A12: Upper right matrix
+    :param A21: Lower left matrix
+    :param out: Stitched matrix from a previous pack_3_by_4 call (its data is overwritten)
+    :return: True if the blocks have the same sparsity pattern as before and out was updated.
+             If False, out is left in an undefined state and pack_3_by_4 must be called again.
+    """
+    if out.shape != (A11.shape[0] + A21.shape[0], A11.shape[1] + A12.shape[1]):
+        return False
+
+    return csc_numba.csc_stack_3_by_4_into_ff(A11.shape[1], A11.indices, A11.indptr, A11.data,
+                                              A12.shape[1], A12.indices, A12.indptr, A12.data,
+                                              A21.indices, A21.indptr, A21.data,
+                                              A11.shape[0], out.indices, out.indptr, out.data)
+
+
+def sp_scaled_ata(mat: csc_matrix, w: np.ndarray) -> csc_matrix:
+    """
+    Compute mat' x diag(w) x mat in a single fused pass
+    :param mat: CSC matrix (m x n)
+    :param w: scaling vector of size m
+    :return: CSC matrix (n x n)
+    """
+    Cn, Cp, Ci, Cx = csc_numba.csc_scaled_ata_ff(Am=mat.shape[0],
+                                                 An=mat.shape[1],
+                                                 Ap=mat.indptr,
+                                                 Ai=mat.indices,
+                                                 Ax=mat.data,
+                                                 w=w)
+    return csc_matrix((Cx, Ci, Cp), shape=(Cn, Cn))
+
+
 def sp_transpose(mat: csc_matrix):
     """
     Actual CSC transpose unlike scipy's
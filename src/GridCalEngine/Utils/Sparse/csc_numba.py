@@ -296,6 +296,66 @@ def csc_multiply_ff(Am, An, Ap, Ai, Ax,
     return Cm, Cn, Cp, Cinew, Cxnew, Cnzmax
 
 
+@nb.njit(cache=True)
+def csc_scaled_ata_ff(Am, An, Ap, Ai, Ax, w):
+    """
+    Fused sparse product C = A' * diag(w) * A where A is a CSC sparse matrix.
+    The scaling is applied on the fly, so no diagonal matrix nor intermediate product is formed.
+    :param Am: number of rows in A
+    :param An: number of columns in A
+    :param Ap: column pointers of A
+    :param Ai: indices of A
+    :param Ax: data of A
+    :param w: row scaling vector (size Am)
+    :return: Cn, Cp, Ci, Cx (C is a square An x An matrix)
+    """
+    # the rows of A are the columns of A'
+    _, _, Tp, Ti, Tx = csc_transpose(Am, An, Ap, Ai, Ax)
+
+    mark = np.full(An, -1, dtype=nb.int32)
+    x = np.zeros(An, dtype=nb.float64)
+
+    # symbolic pass: count the non-zeros to allocate C exactly once
+    nz = 0
+    for k in range(An):
+        for pa in range(Ap[k], Ap[k + 1]):
+            i = Ai[pa]
+            for pt in range(Tp[i], Tp[i + 1]):
+                j = Ti[pt]
+                if mark[j] != k:
+                    mark[j] = k
+                    nz += 1
+
+    Cp = np.empty(An + 1, dtype=nb.int32)
+    Ci = np.empty(nz, dtype=nb.int32)
+    Cx = np.empty(nz, dtype=nb.float64)
+    mark[:] = -1
+
+    # numeric pass: C[:, k] = sum_i A[i, k] * w[i] * A[i, :]'
+    nz = 0
+    for k in range(An):
+        Cp[k] = nz
+        for pa in range(Ap[k], Ap[k + 1]):
+            i = Ai[pa]
+            beta = w[i] * Ax[pa]
+            for pt in range(Tp[i], Tp[i + 1]):
+                j = Ti[pt]
+                if mark[j] != k:
+                    mark[j] = k
+                    Ci[nz] = j
+                    nz += 1
+                    x[j] = beta * Tx[pt]
+                else:
+                    x[j] += beta * Tx[pt]
+
+        for pc in range(Cp[k], nz):
+            Cx[pc] = x[Ci[pc]]
+
+    Cp[An] = nz
+
+    return An, Cp, Ci, Cx
+
+
 # @nb.njit("f8[:](i8, i8, i4[:], i4[:], f8[:], f8[:])", parallel=False)
 @nb.njit(cache=True)
 def csc_mat_vec_ff(m, n, Ap, Ai, Ax, x):
@@ -883,6 +943,66 @@ def csc_stack_3_by_4_ff(am, an, Ai, Ap, Ax,
     return m, n, indices, indptr, data
 
 
+@nb.njit(cache=True)
+def csc_stack_3_by_4_into_ff(an, Ai, Ap, Ax,
+                             bn, Bi, Bp, Bx,
+                             Ci, Cp, Cx,
+                             am, indices, indptr, data):
+    """
+    Refill the data of a matrix previously stacked with csc_stack_3_by_4_ff
+    | A | B |
+    | C | 0 |
+    The sparsity pattern is checked while copying.
+    :param an: number of columns of A (and C)
+    :param Ai: indices of A
+    :param Ap: column pointers of A
+    :param Ax: data of A
+    :param bn: number of columns of B
+    :param Bi: indices of B
+    :param Bp: column pointers of B
+    :param Bx: data of B
+    :param Ci: indices of C
+    :param Cp: column pointers of C
+    :param Cx: data of C
+    :param am: number of rows of A
+    :param indices: indices of the stacked matrix
+    :param indptr: column pointers of the stacked matrix
+    :param data: data of the stacked matrix (modified in place)
+    :return: True if the pattern matched and the data was written, False otherwise
+    """
+    if Ap[an] + Bp[bn] + Cp[an] != len(data):
+        return False
+
+    cnt = 0
+    for j in range(an):
+        for k in range(Ap[j], Ap[j + 1]):
+            if indices[cnt] != Ai[k]:
+                return False
+            data[cnt] = Ax[k]
+            cnt += 1
+
+        for k in range(Cp[j], Cp[j + 1]):
+            if indices[cnt] != Ci[k] + am:
+                return False
+            data[cnt] = Cx[k]
+            cnt += 1
+
+        if indptr[j + 1] != cnt:
+            return False
+
+    for j in range(bn):
+        for k in range(Bp[j], Bp[j + 1]):
+            if indices[cnt] != Bi[k]:
+                return False
+            data[cnt] = Bx[k]
+            cnt += 1
+
+        if indptr[an + j + 1] != cnt:
+            return False
+
+    return True
+
+
 @nb.njit(cache=True)
 def csc_norm(n, Ap, Ax):
     """
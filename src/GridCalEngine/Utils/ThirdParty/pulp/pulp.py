@@ -126,7 +126,8 @@ from collections.abc import Iterable
 from GridCalEngine.Utils.ThirdParty.pulp.model.lp_objects import (LpAffineExpression)
 
 import json
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 from GridCalEngine.Utils.ThirdParty.pulp.apis.cplex_cmd import CPLEX_CMD
 from GridCalEngine.Utils.ThirdParty.pulp.apis.cplex_py import CPLEX_PY
 from GridCalEngine.Utils.ThirdParty.pulp.apis.gurobi_py import GUROBI
@@ -157,6 +158,9 @@ _all_solvers = [
     COPT_CMD,
 ]
 
+# solver name -> solver class, built once
+_SOLVER_MAP = {k.name: k for k in _all_solvers}
+
 
 def setConfigInformation(**keywords):
     """
@@ -209,13 +213,12 @@ def getSolver(solver, *args, **kwargs):
     :param kwargs: additional keyword arguments to the solver
     :return: solver of type :py:class:`LpSolver`
     """
-    mapping = {k.name: k for k in _all_solvers}
     try:
-        return mapping[solver](*args, **kwargs)
+        return _SOLVER_MAP[solver](*args, **kwargs)
     except KeyError:
         raise PulpSolverError(
             "The solver {} does not exist in PuLP.\nPossible options are: \n{}".format(
-                solver, mapping.keys()
+                solver, _SOLVER_MAP.keys()
             )
         )
 
@@ -249,6 +252,29 @@ def getSolverFromJson(filename):
     return getSolverFromDict(data)
 
 
+@lru_cache(maxsize=2)
+def _listSolvers(onlyAvailable: bool) -> Tuple[str, ...]:
+    """
+    Cached implementation of listSolvers (the solvers availability does not change at runtime)
+
+    :param bool onlyAvailable: if True, only show the available solvers
+    :return: tuple of solver names
+    """
+    result = []
+    for s in _all_solvers:
+        if onlyAvailable:
+            # the availability needs an instance (it may probe libraries or executables)
+            solver = s(msg=False)
+            ok = solver.available()
+            del solver
+            if not ok:
+                continue
+
+        # the name is a class attribute, no need to instantiate the solver to read it
+        result.append(s.name)
+    return tuple(result)
+
+
 def listSolvers(onlyAvailable: bool = False) -> List[str]:
     """
     List the names of all the existing solvers in PuLP
@@ -257,13 +283,7 @@ def listSolvers(onlyAvailable: bool = False) -> List[str]:
     :return: list of solver names
     :rtype: list
     """
-    result = []
-    for s in _all_solvers:
-        solver = s(msg=False)
-        if (not onlyAvailable) or solver.available():
-            result.append(solver.name)
-        del solver
-    return result
+    return list(_listSolvers(bool(onlyAvailable)))
 
 
 def lpSum(vector):
@@ -0,0 +1,40 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+from __future__ import annotations
+
+import os
+import copy
+from functools import lru_cache
+from pathlib import Path
+from typing import Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import GridCalEngine.api as gce
+
+
+@lru_cache(maxsize=16)
+def _open(file_name: str, mtime_ns: int) -> gce.MultiCircuit:
+    """
+    Parse a grid file (cached)
+    :param file_name: absolute file name
+    :param mtime_ns: modification time of the file, so that edited files are parsed again
+    :return: MultiCircuit template, never handed out directly
+    """
+    from GridCalEngine.IO.file_handler import FileOpen
+
+    return FileOpen(file_name).open()
+
+
+def open_grid(file_name: Union[str, Path]) -> gce.MultiCircuit:
+    """
+    Open a grid file, parsing it only once per test session.
+    The tests modify the grids they get, so a deep copy of the parsed template is returned
+    (the whole circuit is copied at once to keep the references between devices)
+    :param file_name: grid file name
+    :return: MultiCircuit
+    """
+    file_name = os.path.abspath(file_name)
+    return copy.deepcopy(_open(file_name, os.stat(file_name).st_mtime_ns))
+
@@ -11,6 +11,7 @@ from GridCalEngine.enumerations import TapPhaseControl, TapModuleControl
 from GridCalEngine.DataStructures.numerical_circuit import compile_numerical_circuit_at, NumericalCircuit
 from GridCalEngine.Simulations.OPF.NumericalMethods.ac_opf import run_nonlinear_opf
 from GridCalEngine.Simulations.OPF.opf_options import OptimalPowerFlowOptions
+from tests._grid_cache import open_grid
 
 
 def example_3bus_acopf():
@@ -64,7 +65,7 @@ def example_3bus_acopf():
     # print('\tConv:\n', power_flow.results.get_branch_df())
     opf_options = OptimalPowerFlowOptions()
 
-    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=3)
+    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=0)
     run_nonlinear_opf(grid=grid,
                       opf_options=opf_options,
                       pf_options=pf_options,
@@ -411,7 +412,7 @@ def case9() -> NumericalCircuit:
     # Go back two directories
     file_path = os.path.join('data', 'grids', 'case9.m')
 
-    grid = gce.FileOpen(file_path).open()
+    grid = open_grid(file_path)
     nc = gce.compile_numerical_circuit_at(grid)
 
     return nc
@@ -428,7 +429,7 @@ def case14() -> NumericalCircuit:
     # Go back two directories
     file_path = os.path.join('data', 'grids', 'case14.m')
 
-    grid = gce.FileOpen(file_path).open()
+    grid = open_grid(file_path)
     for l in grid.get_transformers2w():
         l.set_tap_controls(TapPhaseControl.Pt, TapModuleControl.Qt)
 
@@ -446,7 +447,7 @@ def case_pegase89() -> NumericalCircuit:
     # Go back two directories
     file_path = os.path.join('data', 'grids', 'case89pegase.m')
 
-    grid = gce.FileOpen(file_path).open()
+    grid = open_grid(file_path)
     grid.get_transformers2w()[3].set_tap_controls(TapPhaseControl.Pt, TapModuleControl.Qt)
     grid.get_transformers2w()[7].set_tap_controls(TapPhaseControl.Pt, TapModuleControl.Qt)
     grid.get_transformers2w()[18].set_tap_controls(TapPhaseControl.fixed, TapModuleControl.Vm)
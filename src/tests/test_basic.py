@@ -9,6 +9,7 @@ from GridCalEngine.Devices.Substation import Bus
 from GridCalEngine.Devices.Injections.generator import Generator
 from GridCalEngine.Devices.Injections.static_generator import StaticGenerator
 from GridCalEngine.Devices.Branches.transformer import TransformerType, Transformer2W
+from GridCalEngine.Devices.Branches.line import Line
 from GridCalEngine.Simulations.PowerFlow.power_flow_worker import PowerFlowOptions
 from GridCalEngine.Simulations.PowerFlow.power_flow_options import SolverType
 from GridCalEngine.Simulations.PowerFlow.power_flow_driver import PowerFlowDriver
@@ -332,7 +333,44 @@ def test_gridcal_basic_pi():
     assert equal
 
 
+def test_add_buses_and_lines():
+    """
+    Adding buses and lines in bulk must give the same grid as adding them one by one,
+    including the profiles and the conversion of lines between voltage levels into transformers
+    """
+    def build(bulk: bool) -> MultiCircuit:
+        grid = MultiCircuit()
+        grid.create_profiles(steps=4, step_length=1, step_unit='h')
+
+        buses = [Bus(name=f"B{i}", Vnom=110.0 if i < 3 else 20.0) for i in range(4)]
+        lines = [Line(bus_from=buses[0], bus_to=buses[1], name="L01", r=0.01, x=0.1),
+                 Line(bus_from=buses[1], bus_to=buses[2], name="L12", r=0.02, x=0.2),
+                 Line(bus_from=buses[2], bus_to=buses[3], name="L23", r=0.01, x=0.1)]  # 110 kV -> 20 kV
+
+        if bulk:
+            grid.add_buses(buses)
+            grid.add_lines(lines)
+        else:
+            for bus in buses:
+                grid.add_bus(bus)
+            for line in lines:
+                grid.add_line(line)
+
+        return grid
+
+    ref = build(bulk=False)
+    grid = build(bulk=True)
+
+    assert [b.name for b in grid.buses] == [b.name for b in ref.buses]
+    assert [l.name for l in grid.lines] == [l.name for l in ref.lines] == ["L01", "L12"]
+    assert len(grid.transformers2w) == len(ref.transformers2w) == 1
+    assert all(b.active_prof.size() == 4 for b in grid.buses)
+    assert all(l.rate_prof.size() == 4 for l in grid.lines)
+
+
 if __name__ == '__main__':
     test_basic()
 
     test_gridcal_basic_pi()
+
+    test_add_buses_and_lines()
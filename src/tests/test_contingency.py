@@ -115,3 +115,57 @@ def test_linear_contingency():
 
 if __name__ == '__main__':
     test_contingency()
+
+
+def test_lp_contingency_flows_monitored_branches():
+    """
+    The LP contingency flows must be returned for the same branches as the baseline formulation,
+    which picked every flow entry that became an LP expression: all the active branches
+    (also the ones whose contingency factors are zero, like the antenna here) and the sensitive ones
+    """
+    from GridCalEngine.Utils.MIP.selected_interface import LpModel, LpExp, lpDot
+
+    grid = MultiCircuit()
+    buses = [Bus(name=f"B{i}", Vnom=220) for i in range(6)]
+    buses[0].is_slack = True
+    for bus in buses:
+        grid.add_bus(bus)
+
+    pairs = [(0, 1), (1, 2), (2, 3), (3, 0), (1, 3), (3, 4), (4, 5)]  # 3-4 and 4-5 form an antenna
+    for k, (f, t) in enumerate(pairs):
+        grid.add_line(Line(bus_from=buses[f], bus_to=buses[t], name=f"L{k}", x=0.05 + 0.01 * k, rate=100))
+    grid.lines[1].active = False
+
+    grid.add_generator(buses[0], Generator(name="G0", P=80))
+    grid.add_load(buses[5], Load(name="Ld5", P=30))
+
+    for k in [0, 2, 4]:
+        cg = ContingencyGroup(name=f"CG{k}")
+        grid.add_contingency_group(cg)
+        grid.add_contingency(Contingency(device_idtag=grid.lines[k].idtag, name=f"C{k}", group=cg))
+
+    linear_analysis = LinearAnalysisDriver(grid=grid)
+    linear_analysis.run()
+    mctg = LinearMultiContingencies(grid=grid, contingency_groups_used=grid.get_contingency_groups())
+    mctg.compute(ptdf=linear_analysis.results.PTDF, lodf=linear_analysis.results.LODF)
+
+    nc = compile_numerical_circuit_at(grid)
+    active = nc.branch_data.active.astype(bool)
+
+    prob = LpModel(MIPSolvers.HIGHS)
+    base_flow = np.zeros(nc.nbr, dtype=object)
+    base_flow[active] = prob.add_var_array(lb=np.full(active.sum(), -1e3), ub=np.full(active.sum(), 1e3),
+                                           name_prefix="flow_", idx=np.flatnonzero(active))
+    injections = np.zeros(nc.nbus, dtype=object)
+
+    for contingency in mctg.multi_contingencies:
+        # baseline formulation
+        flow = base_flow.copy()
+        flow += lpDot(contingency.mlodf_factors, base_flow[contingency.branch_indices])
+        expected = [k for k in range(nc.nbr) if isinstance(flow[k], LpExp)]
+
+        idx, flows = contingency.get_lp_contingency_flows(base_flow=base_flow, injections=injections, active=active)
+
+        assert list(idx) == expected
+        assert len(flows) == len(idx)
+        assert 5 in idx and 6 in idx  # the antenna branches are not sensitive but they are active
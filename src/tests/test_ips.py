@@ -0,0 +1,137 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+import numpy as np
+from scipy.sparse import csc_matrix, random, identity
+from scipy.sparse.linalg import spsolve
+from GridCalEngine.Utils.NumericalMethods.ips import (KKTFactorizer, IpsFunctionReturn, interior_point_solver,
+                                                       interior_point_solver_eq_only)
+from GridCalEngine.enumerations import SparseSolver
+
+
+def circle_problem(x, mu, lmbda, compute_jac: bool, compute_hess: bool):
+    """
+    min: (x0 - 2)^2 + (x1 - 2)^2
+    s.t.
+        x0^2 + x1^2 - 2 = 0
+
+    The solution is x = (1, 1) with λ = 1
+    :return: IpsFunctionReturn, times
+    """
+    f = (x[0] - 2.0) ** 2 + (x[1] - 2.0) ** 2
+    G = np.array([x[0] ** 2 + x[1] ** 2 - 2.0])
+    H = np.zeros(0)
+
+    fx = 2.0 * (x - 2.0)
+    Gx = csc_matrix(2.0 * x.reshape(1, 2))
+    Hx = csc_matrix((0, 2))
+
+    fxx = csc_matrix(2.0 * np.eye(2))
+    Gxx = csc_matrix(2.0 * lmbda[0] * np.eye(2)) if compute_hess else csc_matrix((2, 2))
+    Hxx = csc_matrix((2, 2))
+
+    return IpsFunctionReturn(f=f, G=G, H=H, fx=fx, Gx=Gx, Hx=Hx, fxx=fxx, Gxx=Gxx, Hxx=Hxx,
+                             S=np.zeros(0), Sf=np.zeros(0), St=np.zeros(0)), np.zeros(10)
+
+
+def half_plane_problem(x, mu, lmbda, compute_jac: bool, compute_hess: bool):
+    """
+    min: (x0 - 2)^2 + (x1 - 2)^2
+    s.t.
+        x0 - x1 = 0
+        x0 + x1 - 2 <= 0
+
+    The solution is x = (1, 1) with λ = 0 and μ = 2
+    :return: IpsFunctionReturn, times
+    """
+    f = (x[0] - 2.0) ** 2 + (x[1] - 2.0) ** 2
+    G = np.array([x[0] - x[1]])
+    H = np.array([x[0] + x[1] - 2.0])
+
+    fx = 2.0 * (x - 2.0)
+    Gx = csc_matrix(np.array([[1.0, -1.0]]))
+    Hx = csc_matrix(np.array([[1.0, 1.0]]))
+
+    fxx = csc_matrix(2.0 * np.eye(2))
+    Gxx = csc_matrix((2, 2))
+    Hxx = csc_matrix((2, 2))
+
+    return IpsFunctionReturn(f=f, G=G, H=H, fx=fx, Gx=Gx, Hx=Hx, fxx=fxx, Gxx=Gxx, Hxx=Hxx,
+                             S=np.zeros(0), Sf=np.zeros(0), St=np.zeros(0)), np.zeros(10)
+
+
+def test_kkt_factorizer_reuses_the_ordering():
+    """
+    The second solve reuses the column ordering of the first factorization,
+    both solutions must match scipy's spsolve
+    """
+    n = 40
+    A = csc_matrix(random(n, n, density=0.1, random_state=5) + 10.0 * identity(n))
+    b = np.random.default_rng(5).random(n)
+
+    kkt = KKTFactorizer(solver_type=SparseSolver.SuperLU)
+
+    # first solve: full analysis, the ordering is stored
+    x1 = kkt.solve(A, b)
+    assert kkt.perm is not None
+    assert np.allclose(x1, spsolve(A, b))
+
+    # second solve: same pattern, new values, the stored ordering is reused
+    perm = kkt.perm.copy()
+    A2 = A.copy()
+    A2.data *= np.linspace(0.5, 1.5, len(A2.data))
+    x2 = kkt.solve(A2, b)
+    assert np.array_equal(kkt.perm, perm)
+    assert np.allclose(x2, spsolve(A2, b))
+
+
+def test_interior_point_solver_eq_only():
+    """
+    Problems without inequalities are solved with the plain KKT Newton iteration,
+    also when calling the general interior point solver
+    """
+    x0 = np.array([1.5, 0.5])
+
+    sol, _ = interior_point_solver_eq_only(x0=x0, n_x=2, n_eq=1, func=circle_problem, tol=1e-8,
+                                           linear_solver=SparseSolver.SuperLU)
+
+    assert sol.converged
+    assert np.allclose(sol.x, [1.0, 1.0], atol=1e-6)
+    assert np.allclose(sol.lam, [1.0], atol=1e-6)
+
+    sol2, _ = interior_point_solver(x0=x0, n_x=2, n_eq=1, n_ineq=0, func=circle_problem, tol=1e-8,
+                                    linear_solver=SparseSolver.SuperLU)
+
+    assert sol2.converged
+    assert np.allclose(sol2.x, sol.x)
+
+
+def test_interior_point_solver_warm_start():
+    """
+    Warm starting from the multipliers and slacks of a previous solution reaches the same point
+    in fewer iterations; multipliers of the wrong size are ignored
+    """
+    x0 = np.zeros(2)
+
+    cold, _ = interior_point_solver(x0=x0, n_x=2, n_eq=1, n_ineq=1, func=half_plane_problem, tol=1e-8,
+                                    linear_solver=SparseSolver.SuperLU)
+
+    assert cold.converged
+    assert np.allclose(cold.x, [1.0, 1.0], atol=1e-6)
+    assert np.allclose(cold.mu, [2.0], atol=1e-6)
+
+    warm, _ = interior_point_solver(x0=x0, n_x=2, n_eq=1, n_ineq=1, func=half_plane_problem, tol=1e-8,
+                                    lam0=cold.lam, mu0=cold.mu, z0=cold.z,
+                                    linear_solver=SparseSolver.SuperLU)
+
+    assert warm.converged
+    assert np.allclose(warm.x, cold.x, atol=1e-6)
+    assert warm.iterations < cold.iterations
+
+    ignored, _ = interior_point_solver(x0=x0, n_x=2, n_eq=1, n_ineq=1, func=half_plane_problem, tol=1e-8,
+                                       lam0=np.zeros(3), mu0=np.ones(3), z0=np.ones(3),
+                                       linear_solver=SparseSolver.SuperLU)
+
+    assert ignored.iterations == cold.iterations
+    assert np.allclose(ignored.x, cold.x)
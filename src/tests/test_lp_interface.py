@@ -0,0 +1,114 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+import numpy as np
+import scipy.sparse as sp
+import pytest
+from GridCalEngine.Utils.MIP.selected_interface import LpModel
+from GridCalEngine.enumerations import MIPSolvers
+
+
+def test_add_var_array():
+    """
+    The variables created at once must behave as the ones created one by one with add_var
+    """
+    lb = np.array([-1.0, 0.0, 2.0, -5.0])
+    ub = np.array([1.0, 3.0, 4.0, 5.0])
+    c = np.array([1.0, -1.0, 1.0, -1.0])
+
+    # reference: one by one
+    prob1 = LpModel(MIPSolvers.HIGHS)
+    x1 = np.array([prob1.add_var(lb=lb[i], ub=ub[i], name=f"x_{i}") for i in range(len(lb))])
+    prob1.minimize(prob1.sum([c[i] * x1[i] for i in range(len(lb))]))
+    assert prob1.solve() == LpModel.OPTIMAL
+
+    # at once
+    prob2 = LpModel(MIPSolvers.HIGHS)
+    x2 = prob2.add_var_array(lb=lb, ub=ub, name_prefix="x_")
+    prob2.minimize(prob2.dot(c, x2))
+    assert prob2.solve() == LpModel.OPTIMAL
+
+    val1 = np.array([prob1.get_value(x) for x in x1])
+    val2 = np.array([prob2.get_value(x) for x in x2])
+
+    assert len(x2) == len(lb)
+    assert np.allclose(val2, val1)
+    assert np.allclose(val2, np.where(c > 0, lb, ub))
+
+
+def test_add_matrix_constraints():
+    """
+    The constraints A·x (sense) b added from a CSR matrix must match the ones built row by row with add_cst
+    """
+    n = 6
+    rng = np.random.default_rng(3)
+    A = sp.random(n, n, density=0.4, random_state=3, format='csr') + sp.identity(n, format='csr') * 5.0
+    A = A.tocsr()
+    b = rng.random(n)
+    Ad = A.toarray()
+
+    # reference: row by row
+    prob1 = LpModel(MIPSolvers.HIGHS)
+    x1 = prob1.add_var_array(lb=np.full(n, -1e3), ub=np.full(n, 1e3), name_prefix="x_")
+    for k in range(n):
+        prob1.add_cst(prob1.sum([Ad[k, j] * x1[j] for j in range(n) if Ad[k, j] != 0.0]) == b[k], name=f"c_{k}")
+    prob1.minimize(prob1.sum(x1))
+    assert prob1.solve() == LpModel.OPTIMAL
+
+    # at once
+    prob2 = LpModel(MIPSolvers.HIGHS)
+    x2 = prob2.add_var_array(lb=np.full(n, -1e3), ub=np.full(n, 1e3), name_prefix="x_")
+    csts = prob2.add_matrix_constraints(A=A, x=x2, sense="==", rhs=b, name_prefix="c_")
+    prob2.minimize(prob2.sum(x2))
+    assert prob2.solve() == LpModel.OPTIMAL
+
+    val1 = np.array([prob1.get_value(x) for x in x1])
+    val2 = np.array([prob2.get_value(x) for x in x2])
+
+    assert len(csts) == n
+    assert np.allclose(val2, val1)
+    assert np.allclose(val2, np.linalg.solve(Ad, b))
+
+    # inequalities: A·x <= b with the variables pushed up by the objective
+    prob3 = LpModel(MIPSolvers.HIGHS)
+    x3 = prob3.add_var_array(lb=np.zeros(n), ub=np.full(n, 1e3), name_prefix="x_")
+    prob3.add_matrix_constraints(A=sp.identity(n, format='csr'), x=x3, sense="<=", rhs=b)
+    prob3.minimize(-prob3.sum(x3))
+    assert prob3.solve() == LpModel.OPTIMAL
+    assert np.allclose([prob3.get_value(x) for x in x3], b)
+
+    # only CSR matrices are accepted
+    with pytest.raises(Exception):
+        prob3.add_matrix_constraints(A=A.tocsc(), x=x3, sense="==", rhs=b)
+
+
+def test_unnamed_vars(tmp_path):
+    """
+    Without emit_names, the variables are created without names, the model must solve as the named one
+    and still be exported with unique generic names
+    """
+    lb = np.zeros(3)
+    ub = np.ones(3)
+    c = np.array([1.0, 2.0, 3.0])
+
+    prob1 = LpModel(MIPSolvers.HIGHS)
+    x1 = prob1.add_var_array(lb=lb, ub=ub, name_prefix="x_")
+    prob1.add_cst(prob1.sum(x1) >= 1.5, name="c_0")
+    prob1.minimize(prob1.dot(c, x1))
+    assert prob1.solve() == LpModel.OPTIMAL
+
+    prob2 = LpModel(MIPSolvers.HIGHS, emit_names=False)
+    x2 = prob2.add_var_array(lb=lb, ub=ub)
+    y2 = prob2.add_var(lb=0.0, ub=1.0)
+    prob2.add_cst(prob2.sum(x2) >= 1.5)
+    prob2.minimize(prob2.dot(c, x2) + y2)
+    assert prob2.solve() == LpModel.OPTIMAL
+
+    assert all(not x.name for x in x2)
+    assert np.allclose([prob2.get_value(x) for x in x2], [prob1.get_value(x) for x in x1])
+
+    prob2.save_model(file_name=str(tmp_path / "unnamed.lp"))
+    names = [x.name for x in x2] + [y2.name]
+    assert all(names)
+    assert len(set(names)) == len(names)
@@ -5,6 +5,89 @@
 import os
 import numpy as np
 import GridCalEngine.api as gce
+from GridCalEngine.Simulations.NTC.ntc_opf import run_linear_ntc_opf_ts
+
+
+def build_two_areas_grid(nt: int = 4) -> gce.MultiCircuit:
+    """
+    Build a small meshed grid of two areas with line contingencies and load profiles
+    :param nt: number of time steps
+    :return: MultiCircuit
+    """
+    grid = gce.MultiCircuit()
+    a1 = gce.Area(name="A1")
+    a2 = gce.Area(name="A2")
+    grid.add_area(a1)
+    grid.add_area(a2)
+
+    buses = list()
+    for i in range(8):
+        bus = gce.Bus(name=f"B{i}", Vnom=220)
+        bus.area = a1 if i < 4 else a2
+        bus.is_slack = i == 0
+        grid.add_bus(bus)
+        buses.append(bus)
+
+    pairs = [(0, 1), (1, 2), (2, 3), (0, 3), (3, 4), (2, 5), (4, 5), (5, 6), (6, 7), (4, 7), (1, 6)]
+    for k, (f, t) in enumerate(pairs):
+        line = gce.Line(bus_from=buses[f], bus_to=buses[t], name=f"L{k}", r=0.01, x=0.05 + 0.01 * k,
+                        rate=80 + 10 * k)
+        line.contingency_factor = 1.2
+        grid.add_line(line)
+
+    for i in [0, 1, 2]:
+        grid.add_generator(buses[i], gce.Generator(name=f"G{i}", P=50 + 10 * i, Pmax=300, Pmin=0, Snom=300))
+    for i in [5, 6]:
+        grid.add_generator(buses[i], gce.Generator(name=f"G{i}", P=30, Pmax=200, Pmin=0, Snom=200))
+    for i in range(8):
+        grid.add_load(buses[i], gce.Load(name=f"Ld{i}", P=20 + 3 * i, Q=5))
+
+    for k, line in enumerate(grid.lines[:6]):
+        group = gce.ContingencyGroup(name=f"CG{k}")
+        grid.add_contingency_group(group)
+        grid.add_contingency(gce.Contingency(device_idtag=line.idtag, name=f"C{k}", group=group))
+
+    grid.create_profiles(steps=nt, step_length=1, step_unit="h")
+    for load in grid.loads:
+        load.P_prof.set(load.P * (1.0 + 0.1 * np.arange(nt)))
+
+    return grid
+
+
+def run_two_areas_ntc_opf_ts(**kwargs):
+    """
+    Run the NTC optimization of the two areas grid for all its time steps
+    :param kwargs: extra arguments of run_linear_ntc_opf_ts
+    :return: NtcVars, Logger
+    """
+    grid = build_two_areas_grid()
+    info = grid.get_inter_aggregation_info(objects_from=[grid.areas[0]], objects_to=[grid.areas[1]])
+    logger = gce.Logger()
+    res = run_linear_ntc_opf_ts(grid=grid,
+                                time_indices=grid.get_all_time_indices(),
+                                consider_contingencies=True,
+                                contingency_groups_used=grid.contingency_groups,
+                                bus_a1_idx=info.idx_bus_from,
+                                bus_a2_idx=info.idx_bus_to,
+                                skip_generation_limits=True,
+                                logger=logger,
+                                **kwargs)
+    return res, logger
+
+
+def assert_same_ntc_vars(res, ref) -> None:
+    """
+    Check that two NTC optimizations gave the same results
+    :param res: NtcVars
+    :param ref: reference NtcVars
+    """
+    assert np.array_equal(res.acceptable_solution, ref.acceptable_solution)
+    assert np.allclose(res.bus_vars.theta, ref.bus_vars.theta)
+    assert np.allclose(res.bus_vars.Pcalc, ref.bus_vars.Pcalc)
+    assert np.allclose(res.branch_vars.flows, ref.branch_vars.flows)
+    assert np.allclose(res.branch_vars.alpha, ref.branch_vars.alpha)
+    assert np.allclose(res.power_shift, ref.power_shift)
+    assert len(res.branch_vars.contingency_flow_data) == len(ref.branch_vars.contingency_flow_data)
 
 
 def test_ntc_ultra_simple() -> None:
@@ -90,3 +173,60 @@ def test_ntc_ieee_14() -> None:
     res = drv.results
 
     assert res.converged
+
+
+def test_ntc_ts_threaded_compilation() -> None:
+    """
+    Compiling the time steps in threads must give the same results and messages as compiling them sequentially
+    """
+    ref, ref_logger = run_two_areas_ntc_opf_ts()
+    res, logger = run_two_areas_ntc_opf_ts(n_threads=3)
+
+    assert ref.acceptable_solution
+    assert_same_ntc_vars(res, ref)
+    assert len(logger) == len(ref_logger)
+
+
+def test_ntc_ts_constant_topology() -> None:
+    """
+    Reusing the first time step linear analysis must give the same results when the topology does not change
+    """
+    ref, _ = run_two_areas_ntc_opf_ts()
+    res, _ = run_two_areas_ntc_opf_ts(assume_constant_topology=True)
+
+    assert ref.acceptable_solution
+    assert_same_ntc_vars(res, ref)
+    assert np.allclose(res.branch_vars.contingency_flow_data, ref.branch_vars.contingency_flow_data)
+
+
+def test_ntc_ts_driver_threaded_steps() -> None:
+    """
+    Solving the time steps in threads must give the same results and messages as solving them in series
+    """
+
+    def run(n_threads: int):
+        grid = build_two_areas_grid(nt=6)
+        info = grid.get_inter_aggregation_info(objects_from=[grid.areas[0]], objects_to=[grid.areas[1]])
+        options = gce.OptimalNetTransferCapacityOptions(
+            sending_bus_idx=info.idx_bus_from,
+            receiving_bus_idx=info.idx_bus_to,
+            consider_contingencies=True,
+            opf_options=gce.OptimalPowerFlowOptions(mip_solver=gce.MIPSolvers.HIGHS)
+        )
+        driver = gce.OptimalNetTransferCapacityTimeSeriesDriver(grid, options,
+                                                                time_indices=grid.get_all_time_indices(),
+                                                                n_threads=n_threads)
+        driver.run()
+        return driver
+
+    ref = run(n_threads=1)
+    drv = run(n_threads=3)
+
+    assert ref.results.converged.all()
+    assert np.array_equal(drv.results.converged, ref.results.converged)
+    assert np.allclose(drv.results.Sf, ref.results.Sf)
+    assert np.allclose(drv.results.Sbus, ref.results.Sbus)
+    assert np.allclose(drv.results.dSbus, ref.results.dSbus)
+    assert np.allclose(drv.results.alpha, ref.results.alpha)
+    assert len(drv.results.contingency_flows_list) == len(ref.results.contingency_flows_list)
+    assert len(drv.logger) == len(ref.logger)
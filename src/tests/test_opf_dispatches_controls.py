@@ -2,15 +2,21 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # SPDX-License-Identifier: MPL-2.0
-import os
-from GridCalEngine.api import *
-from GridCalEngine.enumerations import HvdcControlType, TapModuleControl, TapPhaseControl
+from pathlib import Path
+
+import numpy as np
+from tests._grid_cache import open_grid
+
+# GridCalEngine is imported inside the tests, so that collecting this module does not load the whole engine
+
+_GRIDS_DIR = Path(__file__).resolve().parent / 'data' / 'grids'
 
 
 def test_opf_hvdc():
-    fname = os.path.join('data', 'grids', 'IEEE39_hvdc.gridcal')
+    from GridCalEngine.api import (PowerFlowOptions, OptimalPowerFlowOptions, OptimalPowerFlowDriver,
+                                   SolverType, MIPSolvers)
 
-    main_circuit = FileOpen(fname).open()
+    main_circuit = open_grid(_GRIDS_DIR / 'IEEE39_hvdc.gridcal')
 
     power_flow_options = PowerFlowOptions(SolverType.NR,
                                           verbose=0,
@@ -35,8 +41,6 @@ def test_opf_hvdc():
     # HVDC dispatch off
     main_circuit.hvdc_lines[0].dispatchable = False
 
-    opf = OptimalPowerFlowDriver(grid=main_circuit,
-                                 options=opf_options)
     opf.run()
 
     pf_off = opf.results.hvdc_Pf[0]
@@ -48,9 +52,10 @@ def test_opf_hvdc():
 
 
 def test_opf_gen():
-    fname = os.path.join('data', 'grids', 'IEEE39_hvdc.gridcal')
+    from GridCalEngine.api import (PowerFlowOptions, OptimalPowerFlowOptions, OptimalPowerFlowDriver,
+                                   SolverType, MIPSolvers)
 
-    main_circuit = FileOpen(fname).open()
+    main_circuit = open_grid(_GRIDS_DIR / 'IEEE39_hvdc.gridcal')
 
     power_flow_options = PowerFlowOptions(SolverType.NR,
                                           verbose=0,
@@ -72,15 +77,11 @@ def test_opf_gen():
 
     # Gen dispatch off
     main_circuit.generators[0].enabled_dispatch = False
-    opf = OptimalPowerFlowDriver(grid=main_circuit,
-                                 options=opf_options)
     opf.run()
     pgen_off = opf.results.generator_power[0]
 
     # Gen dispatch back on
     main_circuit.generators[0].enabled_dispatch = True
-    opf = OptimalPowerFlowDriver(grid=main_circuit,
-                                 options=opf_options)
     opf.run()
     pgen_on2 = opf.results.generator_power[0]
 
@@ -90,9 +91,10 @@ def test_opf_gen():
 
 
 def test_opf_line_monitoring():
-    fname = os.path.join('data', 'grids', 'IEEE39_hvdc.gridcal')
+    from GridCalEngine.api import (PowerFlowOptions, OptimalPowerFlowOptions, OptimalPowerFlowDriver,
+                                   SolverType, MIPSolvers)
 
-    main_circuit = FileOpen(fname).open()
+    main_circuit = open_grid(_GRIDS_DIR / 'IEEE39_hvdc.gridcal')
 
     power_flow_options = PowerFlowOptions(SolverType.NR,
                                           verbose=0,
@@ -115,15 +117,11 @@ def test_opf_line_monitoring():
 
     # HVDC dispatch off
     main_circuit.lines[br_idx].monitor_loading = False
-    opf = OptimalPowerFlowDriver(grid=main_circuit,
-                                 options=opf_options)
     opf.run()
     pf_off = opf.results.Sf[br_idx]
 
     # HVDC dispatch back on
     main_circuit.lines[br_idx].monitor_loading = True
-    opf = OptimalPowerFlowDriver(grid=main_circuit,
-                                 options=opf_options)
     opf.run()
     pf_on2 = opf.results.Sf[br_idx]
 
@@ -134,9 +132,11 @@ def test_opf_line_monitoring():
 
 
 def test_opf_hvdc_controls():
-    fname = os.path.join('data', 'grids', 'IEEE39_hvdc.gridcal')
+    from GridCalEngine.api import (PowerFlowOptions, OptimalPowerFlowOptions, OptimalPowerFlowDriver,
+                                   SolverType, MIPSolvers)
+    from GridCalEngine.enumerations import HvdcControlType
 
-    main_circuit = FileOpen(fname).open()
+    main_circuit = open_grid(_GRIDS_DIR / 'IEEE39_hvdc.gridcal')
 
     power_flow_options = PowerFlowOptions(SolverType.NR,
                                           verbose=0,
@@ -158,8 +158,6 @@ def test_opf_hvdc_controls():
 
     # HVDC Pset mode
     main_circuit.hvdc_lines[0].control_mode = HvdcControlType.type_1_Pset
-    opf = OptimalPowerFlowDriver(grid=main_circuit,
-                                 options=opf_options)
     opf.run()
     pf_pset = opf.results.hvdc_Pf[0]
 
@@ -167,8 +165,6 @@ def test_opf_hvdc_controls():
     main_circuit.hvdc_lines[0].dispatchable = False
     main_circuit.hvdc_lines[0].control_mode = HvdcControlType.type_1_Pset
     main_circuit.hvdc_lines[0].Pset = 50  # MW
-    opf = OptimalPowerFlowDriver(grid=main_circuit,
-                                 options=opf_options)
     opf.run()
     pf_pset2 = opf.results.hvdc_Pf[0]
 
@@ -180,9 +176,11 @@ def test_opf_hvdc_controls():
 
 
 def test_opf_trafo_controls():
-    fname = os.path.join('data', 'grids', 'IEEE39_trafo.gridcal')
+    from GridCalEngine.api import (PowerFlowOptions, OptimalPowerFlowOptions, OptimalPowerFlowDriver,
+                                   SolverType, MIPSolvers)
+    from GridCalEngine.enumerations import TapPhaseControl
 
-    main_circuit = FileOpen(fname).open()
+    main_circuit = open_grid(_GRIDS_DIR / 'IEEE39_trafo.gridcal')
 
     power_flow_options = PowerFlowOptions(SolverType.NR,
                                           verbose=0,
@@ -205,15 +203,11 @@ def test_opf_trafo_controls():
     # trafo controlling
     main_circuit.transformers2w[0].tap_phase_control_mode = TapPhaseControl.Pf
     main_circuit.transformers2w[0].tap_phase_control_mode = TapPhaseControl.Pf
-    opf = OptimalPowerFlowDriver(grid=main_circuit,
-                                 options=opf_options)
     opf.run()
     pf2 = opf.results.Sf[48]
 
     # trafo back to fixed
     main_circuit.transformers2w[0].tap_phase_control_mode = TapPhaseControl.fixed
-    opf = OptimalPowerFlowDriver(grid=main_circuit,
-                                 options=opf_options)
     opf.run()
     pf3 = opf.results.Sf[48]
 
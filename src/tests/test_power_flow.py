@@ -13,6 +13,7 @@ from GridCalEngine.Simulations.PowerFlow.power_flow_options import SolverType
 from GridCalEngine.Simulations.PowerFlow.power_flow_driver import PowerFlowDriver
 from GridCalEngine.DataStructures.numerical_circuit import compile_numerical_circuit_at
 import GridCalEngine.api as gce
+from tests._grid_cache import open_grid
 
 
 def test_ieee_grids():
@@ -87,7 +88,7 @@ def test_dc_pf_ieee14():
                                retry_with_other_methods=False)
 
     fname = os.path.join('data', 'grids', 'case14.m')
-    main_circuit = FileOpen(fname).open()
+    main_circuit = open_grid(fname)
     power_flow = PowerFlowDriver(main_circuit, options)
     power_flow.run()
 
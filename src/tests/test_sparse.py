@@ -5,10 +5,11 @@
 import os
 from time import time
 import numpy as np
-from scipy.sparse import csc_matrix, random, hstack, vstack
+from scipy.sparse import csc_matrix, random, hstack, vstack, diags, bmat
 import GridCalEngine.api as gce
 from GridCalEngine.Utils.Sparse import csc_stack_2d_ff
-from GridCalEngine.Utils.Sparse.csc import sp_slice, sp_slice_rows, dense_to_csc
+from GridCalEngine.Utils.Sparse.csc import sp_slice, sp_slice_rows, dense_to_csc, sp_scaled_ata
+from GridCalEngine.Utils.Sparse.csc import pack_3_by_4, pack_3_by_4_into
 
 
 def test_sp_slice():
@@ -73,6 +74,57 @@ def test_stack_4():
     return True
 
 
+def test_sp_scaled_ata():
+    """
+    The fused A' x diag(w) x A product must match the explicit scipy product
+    """
+    A = csc_matrix(random(60, 25, density=0.15, random_state=1))
+    w = np.random.default_rng(1).random(60)
+
+    expected = A.T @ diags(w) @ A
+    C = sp_scaled_ata(A, w)
+
+    assert C.shape == (25, 25)
+    assert np.allclose(C.toarray(), expected.toarray())
+
+
+def test_pack_3_by_4_into():
+    """
+    Refilling a stacked matrix in place must match the scipy stacking when the pattern holds,
+    and must be refused when the pattern changes
+    """
+    A11 = csc_matrix(random(8, 8, density=0.3, random_state=2))
+    A12 = csc_matrix(random(8, 3, density=0.4, random_state=3))
+    A21 = csc_matrix(random(3, 8, density=0.4, random_state=4))
+
+    out = pack_3_by_4(A11, A12, A21)
+
+    # same pattern, new values
+    B11 = A11.copy()
+    B12 = A12.copy()
+    B21 = A21.copy()
+    B11.data *= 2.0
+    B12.data += 1.0
+    B21.data *= -3.0
+
+    assert pack_3_by_4_into(B11, B12, B21, out)
+
+    expected = bmat([[B11, B12], [B21, None]])
+    assert np.allclose(out.toarray(), expected.toarray())
+
+    # same number of entries, but one of them moved to another row
+    C11 = B11.copy()
+    j = np.flatnonzero(np.diff(C11.indptr))[0]
+    k = C11.indptr[j]
+    C11.indices[k] = next(i for i in range(8) if i not in C11.indices[C11.indptr[j]:C11.indptr[j + 1]])
+    C11.sort_indices()
+
+    assert not pack_3_by_4_into(C11, B12, B21, out)
+
+    # different dimensions
+    assert not pack_3_by_4_into(B11, B12[:, :2], B21, out)
+
+
 def test_dense_to_sparse() -> None:
     
     for file_name in ['IEEE14_types_test.gridcal', '1354 Pegase.xlsx']:
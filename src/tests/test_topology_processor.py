@@ -3,11 +3,13 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # SPDX-License-Identifier: MPL-2.0
 import os
+import numpy as np
 
 import GridCalEngine.Devices
 from GridCalEngine.api import *
 import GridCalEngine.Devices as dev
 from GridCalEngine.Devices.multi_circuit import MultiCircuit
+from GridCalEngine.Topology.topology import get_inter_areas
 
 
 def createExampleGridDiagram1() -> MultiCircuit:
@@ -805,3 +807,26 @@ def test_topology_4_nodes_D2():
     assert l2.bus_from == b1 and l2.bus_to == b3
     assert sw1.bus_from == b0 and sw1.bus_to == b1
     assert sw2.bus_from == b2 and sw2.bus_to == b3
+
+
+def test_get_inter_areas():
+    """
+    The vectorized inter-area search must return the same (index, sense) list as the
+    element by element search over the bus sets, both with set and array bus indices
+    """
+    rng = np.random.default_rng(7)
+    F = rng.integers(0, 30, 200)
+    T = rng.integers(0, 30, 200)
+    a1 = {0, 3, 4, 8, 11, 15, 22}
+    a2 = {1, 2, 9, 15, 20, 27}  # bus 15 is in both areas
+
+    expected = list()
+    for k in range(len(F)):
+        if F[k] in a1 and T[k] in a2:
+            expected.append((k, 1.0))
+        elif F[k] in a2 and T[k] in a1:
+            expected.append((k, -1.0))
+
+    assert len(expected) > 0
+    assert get_inter_areas(F=F, T=T, bus_idx_from=a1, bus_idx_to=a2) == expected
+    assert get_inter_areas(F=F, T=T, bus_idx_from=np.array(sorted(a1)), bus_idx_to=np.array(sorted(a2))) == expected
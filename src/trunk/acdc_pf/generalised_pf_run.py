@@ -469,8 +469,7 @@ def case14():
 
     # grid.delete_line(grid.lines[0])
     # grid.delete_line(grid.lines[1])
-    for ll in range(len(grid.lines)):
-        grid.lines[ll].monitor_loading = True
+    grid.set_all_lines_monitor_loading(True)
 
     pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, control_q=False)
     opf_options = gce.OptimalPowerFlowOptions(solver=gce.SolverType.NONLINEAR_OPF, acopf_mode=AcOpfMode.ACOPFstd,
@@ -1,4 +1,5 @@
-import os
+import sys
+from pathlib import Path
 import GridCalEngine.api as gce
 from GridCalEngine.DataStructures.numerical_circuit import compile_numerical_circuit_at
 from GridCalEngine.Simulations.OPF.NumericalMethods.ac_opf import run_nonlinear_opf, ac_optimal_power_flow
@@ -11,6 +12,57 @@ import pandas as pd
 import math
 from GridCalEngine.enumerations import NodalCapacityMethod
 
+# grid folders, resolved from this file so the script can be launched from any working directory
+_GRIDS_DIR = Path(__file__).resolve().parents[3] / 'Grids_and_profiles' / 'grids'
+_REE_GRIDS_DIR = Path(__file__).resolve().parents[4] / 'REE Grids'
+
+# per iteration power flow printouts are only wanted when debugging: python acopf_run.py --verbose
+_PF_VERBOSE = 3 if '--verbose' in sys.argv else 0
+
+
+# AC OPF settings of the grid files run by run_case.
+# "pf" and "opf" override the PowerFlowOptions and OptimalPowerFlowOptions arguments,
+# "run" overrides the run_nonlinear_opf arguments and "monitor_lines" flags all the lines as monitored
+_CASES = {
+    'case9.m': dict(opf=dict(ips_tolerance=1e-8, ips_iterations=50, acopf_mode=gce.AcOpfMode.ACOPFstd),
+                    run=dict(optimize_nodal_capacity=True, nodal_capacity_sign=-1.0,
+                             capacity_nodes_idx=np.array([5]))),
+    'case14.m': dict(pf=dict(control_q=False, verbose=0),
+                     opf=dict(acopf_mode=gce.AcOpfMode.ACOPFslacks, ips_tolerance=1e-6, ips_iterations=50),
+                     monitor_lines=True),
+    'GB Network.gridcal': dict(opf=dict(ips_iterations=100, acopf_mode=gce.AcOpfMode.ACOPFslacks, ips_tolerance=1e-8,
+                                        ips_linear_solver=gce.SparseSolver.KLU)),
+    'case89pegase.m': dict(opf=dict(ips_iterations=100, acopf_mode=gce.AcOpfMode.ACOPFstd, ips_tolerance=1e-7,
+                                    ips_linear_solver=gce.SparseSolver.KLU)),
+    'case300.m': dict(pf=dict(max_iter=50),
+                      opf=dict(ips_iterations=100, acopf_mode=gce.AcOpfMode.ACOPFslacks)),
+    'case13659pegase.m': dict(pf=dict(verbose=_PF_VERBOSE),
+                              opf=dict(ips_tolerance=1e-6, ips_iterations=70, ips_linear_solver=gce.SparseSolver.KLU)),
+}
+
+
+def run_case(file_name: str, **kwargs):
+    """
+    Run the AC OPF of one of the grid files in _CASES with its settings
+    :param file_name: grid file name (key of _CASES) inside the grids folder
+    :param kwargs: extra run_nonlinear_opf arguments, these take precedence over the tabulated ones
+    :return: NonlinearOPFResults
+    """
+    case = _CASES[file_name]
+
+    grid = gce.FileOpen(str(_GRIDS_DIR / file_name)).open()
+
+    if case.get('monitor_lines', False):
+        grid.set_all_lines_monitor_loading(True)
+
+    pf_options = gce.PowerFlowOptions(**{'solver_type': gce.SolverType.NR, 'verbose': 1, **case.get('pf', {})})
+    opf_options = gce.OptimalPowerFlowOptions(**{'solver': gce.SolverType.NONLINEAR_OPF, 'verbose': 1,
+                                                 **case.get('opf', {})})
+
+    run_kwargs = {'plot_error': True, 'pf_init': True, **case.get('run', {}), **kwargs}
+
+    return run_nonlinear_opf(grid=grid, pf_options=pf_options, opf_options=opf_options, **run_kwargs)
+
 
 def example_3bus_acopf():
     """
@@ -39,15 +91,7 @@ def example_3bus_acopf():
 
     opf_options = gce.OptimalPowerFlowOptions(solver=gce.SolverType.NONLINEAR_OPF, verbose=1, ips_tolerance=1e-8,
                                               ips_iterations=25)
-    options = gce.PowerFlowOptions(gce.SolverType.NR, verbose=False)
-    power_flow = gce.PowerFlowDriver(grid, options)
-    power_flow.run()
-
-    # print('\n\n', grid.name)
-    # print('\tConv:\n', power_flow.results.get_bus_df())
-    # print('\tConv:\n', power_flow.results.get_branch_df())
-
-    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=3)
+    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=_PF_VERBOSE)
     run_nonlinear_opf(grid=grid, pf_options=pf_options, opf_options=opf_options, plot_error=True)
 
 
@@ -86,17 +130,8 @@ def case_3bus():
                             tap_phase_min=-0.02, tap_module_min=0.98, rate=100)
     grid.add_transformer2w(tr2)
 
-    options = gce.PowerFlowOptions(gce.SolverType.NR, verbose=False)
-    power_flow = gce.PowerFlowDriver(grid, options)
-    power_flow.run()
-
-    # print('\n\n', grid.name)
-    # print('\tConv:\n', power_flow.results.get_bus_df())
-    # print('\tConv:\n', power_flow.results.get_branch_df())
-
-    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, max_iter=50, verbose=3)
+    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, max_iter=50, verbose=_PF_VERBOSE)
     run_nonlinear_opf(grid=grid, pf_options=pf_options, plot_error=True)
-    nc = compile_numerical_circuit_at(circuit=grid)
 
 
 def linn5bus_example():
@@ -169,13 +204,11 @@ def two_grids_of_3bus():
     b2 = gce.Bus()
     b3 = gce.Bus()
 
-    grid.add_bus(b1)
-    grid.add_bus(b2)
-    grid.add_bus(b3)
+    grid.add_buses([b1, b2, b3])
 
-    grid.add_line(gce.Line(bus_from=b1, bus_to=b2, name='line 1-2', r=0.001, x=0.05, rate=100))
-    grid.add_line(gce.Line(bus_from=b2, bus_to=b3, name='line 2-3', r=0.001, x=0.05, rate=100))
-    grid.add_line(gce.Line(bus_from=b3, bus_to=b1, name='line 3-1_1', r=0.001, x=0.05, rate=100))
+    grid.add_lines([gce.Line(bus_from=b1, bus_to=b2, name='line 1-2', r=0.001, x=0.05, rate=100),
+                    gce.Line(bus_from=b2, bus_to=b3, name='line 2-3', r=0.001, x=0.05, rate=100),
+                    gce.Line(bus_from=b3, bus_to=b1, name='line 3-1_1', r=0.001, x=0.05, rate=100)])
     # grid.add_line(Line(bus_from=b3, bus_to=b1, name='line 3-1_2', r=0.001, x=0.05, rate=100))
 
     grid.add_load(b3, gce.Load(name='L3', P=50, Q=20))
@@ -187,13 +220,11 @@ def two_grids_of_3bus():
     b21 = gce.Bus()
     b31 = gce.Bus()
 
-    grid.add_bus(b11)
-    grid.add_bus(b21)
-    grid.add_bus(b31)
+    grid.add_buses([b11, b21, b31])
 
-    grid.add_line(gce.Line(bus_from=b11, bus_to=b21, name='line 1-2 (2)', r=0.001, x=0.05, rate=100))
-    grid.add_line(gce.Line(bus_from=b21, bus_to=b31, name='line 2-3 (2)', r=0.001, x=0.05, rate=100))
-    grid.add_line(gce.Line(bus_from=b31, bus_to=b11, name='line 3-1 (2)', r=0.001, x=0.05, rate=100))
+    grid.add_lines([gce.Line(bus_from=b11, bus_to=b21, name='line 1-2 (2)', r=0.001, x=0.05, rate=100),
+                    gce.Line(bus_from=b21, bus_to=b31, name='line 2-3 (2)', r=0.001, x=0.05, rate=100),
+                    gce.Line(bus_from=b31, bus_to=b11, name='line 3-1 (2)', r=0.001, x=0.05, rate=100)])
 
     grid.add_load(b31, gce.Load(name='L3 (2)', P=50, Q=20))
     grid.add_generator(b11, gce.Generator('G1 (2)', vset=1.00, Cost=1.0, Cost2=1.5))
@@ -204,17 +235,9 @@ def two_grids_of_3bus():
     hvdc2 = gce.HvdcLine(b11, b1, r=0.001, rate=100)
     # grid.add_hvdc(hvdc2)
 
-    options = gce.PowerFlowOptions(gce.SolverType.NR, verbose=False)
-    power_flow = gce.PowerFlowDriver(grid, options)
-    power_flow.run()
-
-    # print('\n\n', grid.name)
-    # print('\tConv:\n', power_flow.results.get_bus_df())
-    # print('\tConv:\n', power_flow.results.get_branch_df())
-
     opf_options = gce.OptimalPowerFlowOptions(solver=gce.SolverType.NONLINEAR_OPF, verbose=1, ips_tolerance=1e-8,
                                               ips_iterations=25)
-    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=3, max_iter=25)
+    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=_PF_VERBOSE, max_iter=25)
     # run_nonlinear_opf(grid=grid, pf_options=pf_options, plot_error=True)
     island = compile_numerical_circuit_at(circuit=grid, t_idx=None)
 
@@ -230,32 +253,14 @@ def case9():
     """
     IEEE9
     """
-    cwd = os.getcwd()
-
-    # Go back two directories
-    new_directory = os.path.abspath(os.path.join(cwd, '..', '..', '..'))
-    file_path = os.path.join(new_directory, 'Grids_and_profiles', 'grids', 'case9.m')
-
-    grid = gce.FileOpen(file_path).open()
-
-    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=1)
-    opf_options = gce.OptimalPowerFlowOptions(solver=gce.SolverType.NONLINEAR_OPF, ips_tolerance=1e-8,
-                                              ips_iterations=50, verbose=1, acopf_mode=gce.AcOpfMode.ACOPFstd)
-    res = run_nonlinear_opf(grid=grid, pf_options=pf_options, opf_options=opf_options, plot_error=True, pf_init=True,
-                            optimize_nodal_capacity=True,
-                            nodal_capacity_sign=-1.0,
-                            capacity_nodes_idx=np.array([5]))
+    return run_case('case9.m')
 
 
 def case14_linear_vs_nonlinear():
     """
     IEEE14
     """
-    cwd = os.getcwd()
-
-    # Go back two directories
-    new_directory = os.path.abspath(os.path.join(cwd, '..', '..', '..'))
-    file_path = os.path.join(new_directory, 'Grids_and_profiles', 'grids', 'IEEE 14 zip costs.gridcal')
+    file_path = str(_GRIDS_DIR / 'IEEE 14 zip costs.gridcal')
 
     grid = gce.FileOpen(file_path).open()
 
@@ -285,123 +290,42 @@ def case14():
     """
     IEEE14
     """
-    cwd = os.getcwd()
-
-    # Go back two directories
-    new_directory = os.path.abspath(os.path.join(cwd, '..', '..', '..'))
-
-    file_path = os.path.join(new_directory, 'Grids_and_profiles', 'grids', 'case14.m')
-
-    grid = gce.FileOpen(file_path).open()
-
-    # grid.transformers2w[0].control_mode = TransformerControlType.PtQt
-    # grid.transformers2w[1].control_mode = TransformerControlType.Pf
-    # grid.transformers2w[2].control_mode = TransformerControlType.V
-
-    # grid.delete_line(grid.lines[0])
-    # grid.delete_line(grid.lines[1])
-    for ll in range(len(grid.lines)):
-        grid.lines[ll].monitor_loading = True
-
-    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, control_q=False)
-    opf_options = gce.OptimalPowerFlowOptions(solver=gce.SolverType.NONLINEAR_OPF, acopf_mode=gce.AcOpfMode.ACOPFslacks,
-                                              ips_tolerance=1e-6, ips_iterations=50, verbose=1)
-    res = run_nonlinear_opf(grid=grid, pf_options=pf_options, opf_options=opf_options, plot_error=True, pf_init=True)
-    print('')
+    return run_case('case14.m')
 
 
 def case_gb():
     """
     GB
     """
-    cwd = os.getcwd()
-
-    # Go back two directories
-    new_directory = os.path.abspath(os.path.join(cwd, '..', '..', '..'))
-
-    file_path = os.path.join(new_directory, 'Grids_and_profiles', 'grids', 'GB Network.gridcal')
-
-    grid = gce.FileOpen(file_path).open()
-    opf_options = gce.OptimalPowerFlowOptions(solver=gce.SolverType.NONLINEAR_OPF, verbose=1, ips_iterations=100,
-                                              acopf_mode=gce.AcOpfMode.ACOPFslacks, ips_tolerance=1e-8)
-    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=1)
-    run_nonlinear_opf(grid=grid, pf_options=pf_options, opf_options=opf_options, plot_error=True, pf_init=True)
+    return run_case('GB Network.gridcal')
 
 
 def case_pegase89():
     """
     Pegase89
     """
-    cwd = os.getcwd()
-
-    # Go back two directories
-    new_directory = os.path.abspath(os.path.join(cwd, '..', '..', '..'))
-
-    file_path = os.path.join(new_directory, 'Grids_and_profiles', 'grids', 'case89pegase.m')
-
-    grid = gce.FileOpen(file_path).open()
-    # nc = compile_numerical_circuit_at(grid)
-    opf_options = gce.OptimalPowerFlowOptions(solver=gce.SolverType.NONLINEAR_OPF, verbose=1, ips_iterations=100,
-                                              acopf_mode=gce.AcOpfMode.ACOPFstd, ips_tolerance=1e-7)
-    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=1)
-    # ac_optimal_power_flow(nc=nc, pf_options=pf_options, plot_error=True)
-    run_nonlinear_opf(grid=grid, pf_options=pf_options, opf_options=opf_options, plot_error=True, pf_init=True)
-    grid.get_bus_branch_connectivity_matrix()
-    nc = compile_numerical_circuit_at(grid)
-    print('')
+    return run_case('case89pegase.m')
 
 
 def case300():
     """
     case300.m
     """
-    cwd = os.getcwd()
-
-    # Go back two directories
-    new_directory = os.path.abspath(os.path.join(cwd, '..', '..', '..'))
-
-    file_path = os.path.join(new_directory, 'Grids_and_profiles', 'grids', 'case300.m')
-
-    grid = gce.FileOpen(file_path).open()
-    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=1, max_iter=50)
-    opf_options = gce.OptimalPowerFlowOptions(solver=gce.SolverType.NONLINEAR_OPF, verbose=1, ips_iterations=100,
-                                              acopf_mode=gce.AcOpfMode.ACOPFslacks)
-    run_nonlinear_opf(grid=grid, pf_options=pf_options, opf_options=opf_options, plot_error=True, pf_init=True)
+    return run_case('case300.m')
 
 
 def casepegase13k():
     """
     Solves for pf_init=False in about a minute and 130 iterations.
     """
-    cwd = os.getcwd()
-
-    # Go back two directories
-    new_directory = os.path.abspath(os.path.join(cwd, '..', '..', '..'))
-
-    file_path = os.path.join(new_directory, 'Grids_and_profiles', 'grids', 'case13659pegase.m')
-
-    grid = gce.FileOpen(file_path).open()
-
-    options = gce.PowerFlowOptions(gce.SolverType.NR, verbose=False)
-    power_flow = gce.PowerFlowDriver(grid, options)
-    power_flow.run()
-
-    opf_options = gce.OptimalPowerFlowOptions(solver=gce.SolverType.NONLINEAR_OPF, verbose=1, ips_tolerance=1e-6,
-                                              ips_iterations=70)
-    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=3)
-    run_nonlinear_opf(grid=grid, pf_options=pf_options, opf_options=opf_options, plot_error=True, pf_init=True)
+    return run_case('case13659pegase.m')
 
 
 def casehvdc():
     """
     IEEE14
     """
-    cwd = os.getcwd()
-
-    # Go back two directories
-    new_directory = os.path.abspath(os.path.join(cwd, '..', '..', '..', '..'))
-
-    file_path = os.path.join(new_directory, 'REE Grids', 'entrada_a_aopf.raw')
+    file_path = str(_REE_GRIDS_DIR / 'entrada_a_aopf.raw')
 
     grid = gce.FileOpen(file_path).open()
 
@@ -409,13 +333,9 @@ def casehvdc():
         gen.qmin_set = -0.8 * gen.Snom
         gen.qmax_set = 0.8 * gen.Snom
 
-    options = gce.PowerFlowOptions(gce.SolverType.NR, verbose=False)
-    power_flow = gce.PowerFlowDriver(grid, options)
-    power_flow.run()
-
     opf_options = gce.OptimalPowerFlowOptions(solver=gce.SolverType.NONLINEAR_OPF, acopf_mode=gce.AcOpfMode.ACOPFstd,
                                               verbose=1, ips_iterations=150, ips_tolerance=1e-8)
-    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=3)
+    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=_PF_VERBOSE)
     opf_options = gce.OptimalPowerFlowOptions(solver=gce.SolverType.NONLINEAR_OPF, ips_tolerance=1e-8,
                                               ips_iterations=50, verbose=1, acopf_mode=gce.AcOpfMode.ACOPFslacks)
     res = run_nonlinear_opf(grid=grid, pf_options=pf_options, opf_options=opf_options, plot_error=True, pf_init=True,
@@ -430,12 +350,7 @@ def caseREE():
     """
     IEEE14
     """
-    cwd = os.getcwd()
-
-    # Go back two directories
-    new_directory = os.path.abspath(os.path.join(cwd, '..', '..', '..', '..'))
-
-    file_path = os.path.join(new_directory, 'REE Grids', 'entrada_a_aopf.raw')
+    file_path = str(_REE_GRIDS_DIR / 'entrada_a_aopf.raw')
     # file_path = 'C:/Users/J/Documents/ree_opf/entrada_a_aopf.raw'
 
     grid = gce.FileOpen(file_path).open()
@@ -487,33 +402,20 @@ def caseREE():
     genlist = grid.get_generation_like_devices()
     dic = {gen.code: k for k, gen in enumerate(genlist)}
 
-    options = gce.PowerFlowOptions(gce.SolverType.NR, verbose=False)
-    power_flow = gce.PowerFlowDriver(grid, options)
-    power_flow.run()
-
     opf_options = gce.OptimalPowerFlowOptions(solver=gce.SolverType.NONLINEAR_OPF, acopf_mode=gce.AcOpfMode.ACOPFslacks,
                                               verbose=1, ips_iterations=100, ips_tolerance=1e-8)
-    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=3)
+    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=_PF_VERBOSE)
     run_nonlinear_opf(grid=grid, pf_options=pf_options, opf_options=opf_options, plot_error=True, pf_init=True)
 
 
 def case_nodalcap():
-    cwd = os.getcwd()
-
-    # Go back two directories
-    new_directory = os.path.abspath(os.path.join(cwd, '..', '..', '..'))
-
-    file_path = os.path.join(new_directory, 'Grids_and_profiles', 'grids', 'case9.m')
+    file_path = str(_GRIDS_DIR / 'case9.m')
 
     grid = gce.FileOpen(file_path).open()
     grid.time_profile = pd.DatetimeIndex(["1/1/2020 10:00:00+00:00"])
-    options = gce.PowerFlowOptions(gce.SolverType.NR, verbose=False)
-    power_flow = gce.PowerFlowDriver(grid, options)
-    power_flow.run()
-
     opf_options = gce.OptimalPowerFlowOptions(solver=gce.SolverType.NONLINEAR_OPF, acopf_mode=gce.AcOpfMode.ACOPFslacks,
                                               verbose=1, ips_iterations=150, ips_tolerance=1e-8)
-    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=3)
+    pf_options = gce.PowerFlowOptions(solver_type=gce.SolverType.NR, verbose=_PF_VERBOSE)
     nc_options = NodalCapacityOptions(opf_options=opf_options, capacity_nodes_idx=np.array([2, 3, 6]),
                                       nodal_capacity_sign=-1.0, method=NodalCapacityMethod.NonlinearOptimization)
     case = NodalCapacityTimeSeriesDriver(grid=grid, time_indices=np.array([0]), options=nc_options)
@@ -521,7 +423,19 @@ def case_nodalcap():
     # run_nonlinear_opf(grid=grid, pf_options=pf_options, opf_options=opf_options, plot_error=True, pf_init=True)
 
 
-if __name__ == '__main__':
+if __name__ == '__main__' and '--profile' in sys.argv:
+    # profile the largest case: python acopf_run.py --profile
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    casepegase13k()
+    profiler.disable()
+
+    pstats.Stats(profiler).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(40)
+
+elif __name__ == '__main__':
     # example_3bus_acopf()
     # case_3bus()
     # linn5bus_example()